@@ -1,9 +1,29 @@
-import pymysql
 from datetime import datetime
+from typing import List
+from backend.competitor_analysis.db_pool import db_connection, run_in_db_executor
+from backend.competitor_analysis.review_parser import review_hash
+from backend.competitor_analysis.summary_cache import get_summary_cache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def _upsert_review_summary(cur, category: str, review_summary: str, num_reviews: int, crawled_at: str) -> int:
+    """
+    요약본을 INSERT 또는 UPDATE(version 증가)하고 저장된 version을 반환합니다.
+    """
+    sql = """
+    INSERT INTO competitor_review_summary (category, review_summary, num_reviews, crawled_at)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        review_summary = VALUES(review_summary),
+        num_reviews = VALUES(num_reviews),
+        crawled_at = VALUES(crawled_at),
+        version = version + 1
+    """
+    cur.execute(sql, (category, review_summary, num_reviews, crawled_at))
+    cur.execute("SELECT version FROM competitor_review_summary WHERE category=%s", (category,))
+    return cur.fetchone()[0]
+
 def insert_review_summary(
     host: str,
     user: str,
@@ -12,52 +32,41 @@ def insert_review_summary(
     category: str,
     review_summary: str,
     num_reviews: int
-):
+) -> bool:
     """
     경쟁사 리뷰 요약본을 MySQL DB에 저장합니다.
-    이미 동일 카테고리가 있다면 UPDATE (요약/개수/시간 갱신), 없으면 INSERT.
+    이미 동일 카테고리가 있다면 UPDATE (요약/개수/시간 갱신, version 증가), 없으면 INSERT.
+
+    Returns:
+        bool: 저장 성공 여부
     """
     logger.debug(f"🛠️ 리뷰 요약본 저장 시작: category={category}, num_reviews={num_reviews}")
     crawled_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     try:
-        conn = pymysql.connect(
-            host=host,
-            user=user,
-            password=password,
-            db=db,
-            port=3306,
-            charset='utf8mb4'
-        )
-        with conn.cursor() as cur:
-            sql = """
-            INSERT INTO competitor_review_summary (category, review_summary, num_reviews, crawled_at)
-            VALUES (%s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-                review_summary = VALUES(review_summary),
-                num_reviews = VALUES(num_reviews),
-                crawled_at = VALUES(crawled_at)
-            """
-            cur.execute(sql, (category, review_summary, num_reviews, crawled_at))
-        conn.commit()
-        logger.info("✅ 리뷰 요약본 DB 저장 완료")
+        with db_connection(host, user, password, db) as conn:
+            with conn.cursor() as cur:
+                version = _upsert_review_summary(cur, category, review_summary, num_reviews, crawled_at)
+            conn.commit()
     except Exception as e:
         logger.error(f"❌ 리뷰 요약본 저장 실패: {type(e).__name__}: {e!r}")
-    finally:
-        try:
-            conn.close()
-            logger.debug("🛠️ DB 연결 종료")
-        except Exception as e:
-            logger.warning(f"⚠️ DB 연결 종료 중 예외 발생: {type(e).__name__}: {e!r}")
+        return False
+    # 저장 이전에 읽은 요약본이 캐시되지 않도록 새 version을 최소 version으로 기록
+    # (다른 프로세스의 캐시는 version 변경으로 갱신됨)
+    get_summary_cache(host, user, password, db).invalidate(category, min_version=version)
+    logger.info("✅ 리뷰 요약본 DB 저장 완료")
+    return True
 
 def get_latest_review_summary(
     host: str,
     user: str,
     password: str,
     db: str,
-    category: str
+    category: str,
+    use_cache: bool = True
 ) -> str:
     """
     주어진 카테고리에서 가장 최근에 저장된 리뷰 요약본을 반환합니다.
+    프로세스 내 요약본 캐시를 먼저 확인하고, 없을 때만 DB를 조회해 결과를 캐시합니다.
 
     Args:
         host (str): DB 호스트 주소(IP 또는 도메인)
@@ -65,42 +74,179 @@ def get_latest_review_summary(
         password (str): DB 비밀번호
         db (str): 데이터베이스 이름
         category (str): 상품 카테고리명
+        use_cache (bool): False면 캐시를 건너뛰고 DB를 조회 (조회 결과는 캐시에 반영)
 
     Returns:
         str: 가장 최근에 저장된 리뷰 요약본(없으면 None)
     """
+    cache = get_summary_cache(host, user, password, db)
+    if use_cache:
+        cached, summary = cache.get(category)
+        if cached:
+            logger.debug(f"🛠️ 리뷰 요약본 캐시 사용: category={category}, 존재={summary is not None}")
+            return summary
+
     logger.debug(f"🛠️ 최근 리뷰 요약본 조회 시작: category={category}")
     try:
-        conn = pymysql.connect(
-            host=host,
-            user=user,
-            password=password,
-            db=db,
-            port=3306,
-            charset='utf8mb4'
-        )
-        with conn.cursor() as cur:
-            sql = """
-            SELECT review_summary
-            FROM competitor_review_summary
-            WHERE category=%s
-            ORDER BY crawled_at DESC
-            LIMIT 1
-            """
-            cur.execute(sql, (category,))
-            row = cur.fetchone()
-            if row:
-                logger.info("✅ 최근 리뷰 요약본 조회 성공")
-                return row[0]
-            else:
-                logger.warning("⚠️ 해당 카테고리의 리뷰 요약본이 없습니다")
-                return None
+        with db_connection(host, user, password, db) as conn:
+            with conn.cursor() as cur:
+                sql = """
+                SELECT review_summary, version
+                FROM competitor_review_summary
+                WHERE category=%s
+                ORDER BY crawled_at DESC
+                LIMIT 1
+                """
+                cur.execute(sql, (category,))
+                row = cur.fetchone()
     except Exception as e:
+        # 조회 실패는 캐시하지 않음
         logger.error(f"❌ 리뷰 요약본 조회 실패: {type(e).__name__}: {e!r}")
         return None
-    finally:
-        try:
-            conn.close()
-            logger.debug("🛠️ DB 연결 종료")
-        except Exception as e:
-            logger.warning(f"⚠️ DB 연결 종료 중 예외 발생: {type(e).__name__}: {e!r}")
\ No newline at end of file
+
+    if row:
+        cache.put(category, row[0], row[1])
+        logger.info("✅ 최근 리뷰 요약본 조회 성공")
+        return row[0]
+    else:
+        cache.put(category, None, 0)
+        logger.warning("⚠️ 해당 카테고리의 리뷰 요약본이 없습니다")
+        return None
+
+
+def touch_review_summary(host: str, user: str, password: str, db: str, category: str):
+    """
+    새 리뷰가 없을 때 요약본은 그대로 두고 crawled_at만 갱신합니다. (version 유지 → 캐시 유지)
+    자동 크롤링 주기를 다시 시작하기 위해 사용합니다.
+    """
+    crawled_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    try:
+        with db_connection(host, user, password, db) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE competitor_review_summary SET crawled_at = %s WHERE category = %s",
+                    (crawled_at, category)
+                )
+        logger.debug(f"🛠️ 리뷰 요약본 확인 시각 갱신: category={category}")
+    except Exception as e:
+        logger.error(f"❌ 리뷰 요약본 확인 시각 갱신 실패: {type(e).__name__}: {e!r}")
+
+def get_stored_review_hashes(host: str, user: str, password: str, db: str, category: str) -> dict:
+    """
+    competitor_reviews 테이블에 이미 저장된 카테고리 리뷰 해시를 상품별로 조회합니다.
+    크롤러에 넘겨 상품별로 저장된 리뷰는 다시 수집하지 않도록 합니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+        category (str): 상품 카테고리명
+
+    Returns:
+        dict: 상품 URL → 리뷰 해시 집합
+    """
+    stored = {}
+    with db_connection(host, user, password, db) as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT product_url, review_hash FROM competitor_reviews WHERE category = %s", (category,))
+            for product_url, hash_ in cur.fetchall():
+                stored.setdefault(product_url, set()).add(hash_)
+    return stored
+
+def insert_reviews_with_summary(
+    host: str,
+    user: str,
+    password: str,
+    db: str,
+    category: str,
+    product_reviews: List[tuple],
+    review_summary: str,
+    num_stored: int
+) -> int:
+    """
+    수집한 원본 리뷰(competitor_reviews)와 이를 반영한 요약본을 한 트랜잭션으로 저장합니다.
+    (category, product_url, review_hash)가 이미 있는 리뷰는 INSERT IGNORE로 건너뜁니다.
+    둘 중 하나라도 실패하면 모두 rollback되어, 요약본에 반영되지 않은 리뷰가 저장된 것으로 남지 않습니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+        category (str): 상품 카테고리명
+        product_reviews (List[tuple]): (상품 URL, 리뷰 리스트) 리스트
+        review_summary (str): 새 리뷰를 반영한 요약본
+        num_stored (int): 이미 저장되어 있던 리뷰 수 (요약본의 num_reviews 계산에 사용)
+
+    Returns:
+        int: 새로 저장된 리뷰 수
+
+    Raises:
+        Exception: DB 저장에 실패한 경우 (원본 리뷰와 요약본 모두 저장되지 않음)
+    """
+    crawled_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    rows = [
+        (review_hash(review), category, product_url, review, crawled_at)
+        for product_url, reviews in product_reviews
+        for review in reviews
+    ]
+    with db_connection(host, user, password, db) as conn:
+        conn.begin()
+        with conn.cursor() as cur:
+            inserted = 0
+            if rows:
+                inserted = cur.executemany(
+                    """
+                    INSERT IGNORE INTO competitor_reviews (review_hash, category, product_url, review, crawled_at)
+                    VALUES (%s, %s, %s, %s, %s)
+                    """,
+                    rows
+                )
+            version = _upsert_review_summary(cur, category, review_summary, num_stored + inserted, crawled_at)
+        conn.commit()
+    get_summary_cache(host, user, password, db).invalidate(category, min_version=version)
+    logger.info(f"✅ 원본 리뷰/요약본 저장 완료: category={category}, {inserted}/{len(rows)}개 신규")
+    return inserted
+
+
+async def ainsert_review_summary(
+    host: str,
+    user: str,
+    password: str,
+    db: str,
+    category: str,
+    review_summary: str,
+    num_reviews: int
+) -> bool:
+    """
+    insert_review_summary()의 비동기 버전. DB 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    return await run_in_db_executor(
+        insert_review_summary, host, user, password, db, category, review_summary, num_reviews
+    )
+
+
+async def aget_latest_review_summary(
+    host: str,
+    user: str,
+    password: str,
+    db: str,
+    category: str,
+    use_cache: bool = True
+) -> str:
+    """
+    get_latest_review_summary()의 비동기 버전. 캐시 적중 시 바로 반환하고,
+    DB 조회가 필요할 때만 DB 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+
+    Returns:
+        str: 가장 최근에 저장된 리뷰 요약본(없으면 None)
+    """
+    if use_cache:
+        cached, summary = get_summary_cache(host, user, password, db).get(category)
+        if cached:
+            return summary
+    return await run_in_db_executor(get_latest_review_summary, host, user, password, db, category, False)
@@ -1,7 +1,9 @@
 import asyncio
+import time
 from backend.competitor_analysis.differentiator import generate_differentiators
-from backend.competitor_analysis.competitor_db import get_latest_review_summary
-from backend.competitor_analysis.crawl_signal_server import send_crawl_request_signal
+from backend.competitor_analysis.competitor_db import aget_latest_review_summary
+from backend.competitor_analysis.crawl_signal_server import asend_crawl_request_signal
+from backend.competitor_analysis.summary_notifier import SUMMARY_READY, get_summary_broker
 from utils.config import get_openai_api_key, get_db_config
 from utils.logger import get_logger
 
@@ -9,18 +11,16 @@ logger = get_logger(__name__)
 
 async def competitor_main(
     product_input: dict,
-    poll_interval=5,
-    poll_timeout=120
+    wait_timeout=120
 ) -> dict:
     """
     경쟁사 리뷰 분석 및 차별점 리스트 도출 (딕셔너리만 사용)
     1. DB에 요약본 있으면 바로 사용.
-    2. 없으면 신호 송신→DB polling→요약본 확보 후 차별점 생성.
+    2. 없으면 알림 구독→신호 송신→요약본 생성 알림 대기→요약본 확보 후 차별점 생성.
 
     Args:
         product_input (dict): 상품명, 카테고리, 특징 등 상세 정보
-        poll_interval (int): polling 간격(초)
-        poll_timeout (int): polling 최대 대기시간(초)
+        wait_timeout (int): 요약본 생성 알림 최대 대기시간(초)
 
     Returns:
         dict: 경쟁사 차별점 리스트 {'differences': List[str]}
@@ -31,49 +31,33 @@ async def competitor_main(
         openai_api_key = get_openai_api_key()
         db_config = get_db_config()
         category = product_input.get("category", "")
+        db_args = (db_config["host"], db_config["user"], db_config["password"], db_config["db"])
 
         logger.debug(f"🛠️ DB에서 최신 리뷰 요약본 조회 시도 (category={category})")
-        summary = get_latest_review_summary(
-            db_config["host"],
-            db_config["user"],
-            db_config["password"],
-            db_config["db"],
-            category
-        )
+        summary = await aget_latest_review_summary(*db_args, category)
         if summary:
             logger.info("✅ DB에서 최신 리뷰 요약본 바로 사용")
         else:
-            logger.warning("⚠️ 리뷰 요약본 미존재, 신호 송신 및 polling 대기 시작")
-            send_crawl_request_signal(
-                db_config["host"],
-                db_config["user"],
-                db_config["password"],
-                db_config["db"],
-                category
-            )
-            waited = 0
-            while waited < poll_timeout:
-                logger.debug(f"🛠️ {poll_interval}초 대기 후 요약본 재조회 예정 (누적 {waited}/{poll_timeout})")
-                await asyncio.sleep(poll_interval)
-                waited += poll_interval
-                summary = get_latest_review_summary(
-                    db_config["host"],
-                    db_config["user"],
-                    db_config["password"],
-                    db_config["db"],
-                    category
-                )
-                if summary:
-                    logger.info(f"✅ {waited}초만에 리뷰 요약본 생성 완료")
-                    break
-                else:
-                    logger.debug(f"🛠️ 리뷰 요약본 polling 대기 중... ({waited}/{poll_timeout}s)")
+            logger.warning("⚠️ 리뷰 요약본 미존재, 신호 송신 및 생성 알림 대기 시작")
+            async with get_summary_broker().subscribe(category) as subscription:
+                await asend_crawl_request_signal(*db_args, category)
+                # 구독 이후 다시 확인 (첫 조회와 구독 사이에 저장된 요약본을 놓치지 않도록, 캐시 우회)
+                summary = await aget_latest_review_summary(*db_args, category, use_cache=False)
+                if not summary:
+                    started = time.monotonic()
+                    status = await subscription.wait(wait_timeout)
+                    if status == SUMMARY_READY:
+                        summary = await aget_latest_review_summary(*db_args, category, use_cache=False)
+                    logger.debug(f"🛠️ 요약본 알림 대기 종료: status={status}, {time.monotonic() - started:.1f}s")
+            if summary:
+                logger.info("✅ 리뷰 요약본 생성 완료")
             else:
-                logger.error("❌ polling timeout - 리뷰 요약본 생성 실패")
+                logger.error("❌ 리뷰 요약본 생성 실패 (알림 시간 초과 또는 수집된 리뷰 없음)")
                 return {"differences": []}
 
         logger.debug("🛠️ 차별점 문장 생성(generate_differentiators) 시도")
-        diff_dict = generate_differentiators(product_input, summary, openai_api_key)
+        # OpenAI 호출도 블로킹이므로 별도 스레드에서 실행
+        diff_dict = await asyncio.to_thread(generate_differentiators, product_input, summary, openai_api_key)
         differences = diff_dict.get("differences", [])
 
         if differences:
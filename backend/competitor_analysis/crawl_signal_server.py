@@ -1,13 +1,22 @@
-import pymysql
+import os
+import socket
+import threading
 import time
 from datetime import datetime
-from backend.competitor_analysis.crawler import crawl_reviews_by_category
-from backend.competitor_analysis.differentiator import summarize_competitor_reviews
-from backend.competitor_analysis.competitor_db import insert_review_summary
+from backend.competitor_analysis.db_pool import db_connection, run_in_db_executor
+from backend.competitor_analysis.review_refresh import refresh_category_summary
+from backend.competitor_analysis.summary_notifier import SUMMARY_EMPTY, publish_summary_event
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 워커가 신호를 점유하는 기간(초). 이 시간 안에 완료/연장하지 못하면 다른 워커가 다시 가져감
+DEFAULT_LEASE_SECONDS = 600
+# 이 횟수만큼 점유되고도 완료되지 않은 신호는 failed 처리
+MAX_ATTEMPTS = 3
+# 처리에 실패한 신호를 다시 점유하기까지 대기 시간(초). 시도할 때마다 2배씩 증가
+RETRY_BACKOFF_SECONDS = 30
+
 def send_crawl_request_signal(host, user, password, db, category):
     """
     크롤러 실행 신호를 crawl_request_signal 테이블에 등록(요청)합니다.
@@ -24,29 +33,164 @@ def send_crawl_request_signal(host, user, password, db, category):
     """
     logger.debug(f"🛠️ 크롤러 요청 신호 전송 시작: {category}")
     try:
-        conn = pymysql.connect(
-            host=host, user=user, password=password, db=db, port=3306, charset='utf8mb4'
-        )
+        with db_connection(host, user, password, db) as conn:
+            with conn.cursor() as cur:
+                # 같은 카테고리 신호가 pending/running이면 active_key UNIQUE 제약으로 무시됨
+                sql = """
+                INSERT IGNORE INTO crawl_request_signal (category, active_key, status, requested_at)
+                VALUES (%s, %s, 'pending', %s)
+                """
+                inserted = cur.execute(sql, (category, category, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            conn.commit()
+        if inserted:
+            logger.info(f"✅ 크롤러 요청 신호 전송 완료: {category}")
+        else:
+            logger.info(f"✅ 이미 대기/처리 중인 크롤러 요청이 있어 신호를 추가하지 않음: {category}")
+    except Exception as e:
+        logger.error(f"❌ 신호 전송 실패: {type(e).__name__}: {e!r}")
+
+async def asend_crawl_request_signal(host, user, password, db, category):
+    """
+    send_crawl_request_signal()의 비동기 버전. DB 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+    """
+    await run_in_db_executor(send_crawl_request_signal, host, user, password, db, category)
+
+def claim_crawl_request(host, user, password, db, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    가장 오래된 pending 신호(또는 lease가 만료된 running 신호)를 원자적으로 점유합니다.
+    다른 워커가 잠근 행은 건너뛰므로(SKIP LOCKED) 여러 워커가 같은 신호를 가져가지 않습니다.
+    실패 후 재시도 대기 중인(next_attempt_at이 지나지 않은) 신호는 건너뜁니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+        worker_id (str): 점유하는 워커 ID
+        lease_seconds (int): 점유 기간(초)
+
+    Returns:
+        tuple: (signal_id, category, attempts) (처리할 신호가 없으면 None)
+    """
+    with db_connection(host, user, password, db) as conn:
+        conn.begin()
         with conn.cursor() as cur:
-            sql = """
-            INSERT INTO crawl_request_signal (category, status, requested_at)
-            VALUES (%s, 'pending', %s)
-            """
-            cur.execute(sql, (category, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            cur.execute("""
+                SELECT id, category, attempts FROM crawl_request_signal
+                WHERE (status='pending' AND (next_attempt_at IS NULL OR next_attempt_at <= NOW()))
+                    OR (status='running' AND lease_expires_at < NOW())
+                ORDER BY requested_at ASC LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            """)
+            row = cur.fetchone()
+            if row is None:
+                conn.commit()
+                return None
+            signal_id, category, attempts = row
+            exhausted = attempts >= MAX_ATTEMPTS
+            if exhausted:
+                # 워커가 반복해서 중단된 신호는 더 이상 재시도하지 않음
+                cur.execute("""
+                    UPDATE crawl_request_signal
+                    SET status='failed', active_key=NULL, worker_id=NULL, lease_expires_at=NULL, completed_at=NOW()
+                    WHERE id=%s
+                """, (signal_id,))
+            else:
+                cur.execute("""
+                    UPDATE crawl_request_signal
+                    SET status='running', worker_id=%s, attempts=attempts+1,
+                        lease_expires_at=NOW() + INTERVAL %s SECOND
+                    WHERE id=%s
+                """, (worker_id, lease_seconds, signal_id))
         conn.commit()
-        logger.info(f"✅ 크롤러 요청 신호 전송 완료: {category}")
+
+    if exhausted:
+        logger.error(f"❌ 신호 {MAX_ATTEMPTS}회 처리 실패, failed 처리: '{category}'")
+        publish_summary_event(host, user, password, db, category, SUMMARY_EMPTY)
+        return None
+    return signal_id, category, attempts + 1
+
+def extend_crawl_lease(host, user, password, db, signal_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS) -> bool:
+    """
+    점유 중인 신호의 lease를 연장합니다.
+
+    Returns:
+        bool: 연장 성공 여부 (다른 워커가 가져간 경우 False)
+    """
+    with db_connection(host, user, password, db) as conn:
+        with conn.cursor() as cur:
+            updated = cur.execute("""
+                UPDATE crawl_request_signal
+                SET lease_expires_at=NOW() + INTERVAL %s SECOND
+                WHERE id=%s AND worker_id=%s AND status='running'
+            """, (lease_seconds, signal_id, worker_id))
+    return bool(updated)
+
+def finish_crawl_request(host, user, password, db, signal_id, worker_id, success=True):
+    """
+    점유한 신호를 완료(done) 처리하거나, 실패 시 다시 pending으로 돌려 재시도하게 합니다.
+    실패한 신호는 RETRY_BACKOFF_SECONDS * 2^(시도 횟수 - 1)초 뒤에 다시 점유됩니다.
+    완료되면 active_key를 비워 같은 카테고리의 새 신호를 받을 수 있게 합니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+        signal_id (int): 신호 ID
+        worker_id (str): 점유한 워커 ID
+        success (bool): 처리 성공 여부
+    """
+    with db_connection(host, user, password, db) as conn:
+        with conn.cursor() as cur:
+            if success:
+                cur.execute("""
+                    UPDATE crawl_request_signal
+                    SET status='done', active_key=NULL, lease_expires_at=NULL, completed_at=%s
+                    WHERE id=%s AND worker_id=%s
+                """, (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), signal_id, worker_id))
+            else:
+                cur.execute("""
+                    UPDATE crawl_request_signal
+                    SET status='pending', worker_id=NULL, lease_expires_at=NULL,
+                        next_attempt_at=NOW() + INTERVAL %s * POW(2, GREATEST(attempts - 1, 0)) SECOND
+                    WHERE id=%s AND worker_id=%s
+                """, (RETRY_BACKOFF_SECONDS, signal_id, worker_id))
+
+def default_worker_id(index: int = 0) -> str:
+    """
+    호스트명, 프로세스 ID, 워커 번호로 워커 ID를 만듭니다.
+    """
+    return f"{socket.gethostname()}-{os.getpid()}-{index}"
+
+def process_crawl_request(host, user, password, db, openai_api_key, signal_id, category, worker_id):
+    """
+    점유한 신호 하나를 처리합니다: 1. 새 리뷰만 크롤링/저장 → 2. 기존 요약본에 반영 → 완료 처리 및 알림.
+    """
+    logger.info(f"✅ 신호 점유: '{category}' 크롤링 및 요약 시작 (worker={worker_id})")
+    try:
+        status = refresh_category_summary(
+            host, user, password, db, category, openai_api_key,
+            max_products=3,
+            max_reviews_per_product=10,
+            # 크롤링이 끝나면 요약 시간만큼 점유 연장
+            on_crawled=lambda: extend_crawl_lease(host, user, password, db, signal_id, worker_id)
+        )
     except Exception as e:
-        logger.error(f"❌ 신호 전송 실패: {type(e).__name__}: {e!r}")
-    finally:
-        try:
-            conn.close()
-            logger.debug("🛠️ DB 연결 종료")
-        except Exception as e:
-            logger.warning(f"⚠️ DB 연결 종료 중 예외 발생: {type(e).__name__}: {e!r}")
+        logger.error(f"❌ 신호 처리 실패, 재시도 대기열로 반환: '{category}', {type(e).__name__}: {e!r}")
+        finish_crawl_request(host, user, password, db, signal_id, worker_id, success=False)
+        return
 
-def poll_and_process_signal(host, user, password, db, openai_api_key, interval=10):
+    # 신호 완료 처리 (done 표시 및 완료 시각)
+    finish_crawl_request(host, user, password, db, signal_id, worker_id, success=True)
+    # 요약본을 기다리는 요청들에 알림
+    publish_summary_event(host, user, password, db, category, status)
+    logger.info(f"✅ 신호 처리 완료: '{category}' (worker={worker_id})")
+
+def poll_and_process_signal(host, user, password, db, openai_api_key, interval=10, worker_id=None):
     """
-    신호(pending) 감지 시 → 1. 카테고리 리뷰 크롤링 → 2. 요약 → 3. DB 저장까지 자동 수행.
+    신호 처리 워커 루프. pending 신호를 점유해 크롤링/요약/DB 저장을 수행하고,
+    처리할 신호가 없을 때만 interval만큼 대기합니다.
 
     Args:
         host (str): DB 호스트 주소
@@ -55,65 +199,51 @@ def poll_and_process_signal(host, user, password, db, openai_api_key, interval=1
         db (str): 데이터베이스명
         openai_api_key (str): OpenAI API 키
         interval (int, optional): polling 주기(초), 기본값 10초
+        worker_id (str, optional): 워커 ID (기본값: 호스트명-PID-0)
 
     Returns:
         None
     """
-    logger.debug(f"🛠️ 신호 polling 루프 시작 (interval={interval}s)")
+    worker_id = worker_id or default_worker_id()
+    logger.debug(f"🛠️ 신호 polling 루프 시작 (interval={interval}s, worker={worker_id})")
     while True:
         try:
-            conn = pymysql.connect(
-                host=host, user=user, password=password, db=db, port=3306, charset='utf8mb4'
-            )
-            with conn.cursor() as cur:
-                # 가장 오래된 미처리 신호(카테고리) 조회
-                cur.execute("""
-                    SELECT id, category FROM crawl_request_signal
-                    WHERE status='pending' ORDER BY requested_at ASC LIMIT 1
-                """)
-                row = cur.fetchone()
-                if row:
-                    signal_id, category = row
-                    logger.info(f"✅ 신호 감지: '{category}' 크롤링 및 요약 시작")
-
-                    # 1️경쟁사 리뷰 크롤링
-                    reviews = crawl_reviews_by_category(
-                        category=category,
-                        max_products=3,
-                        max_reviews_per_product=10
-                    )
-                    logger.info(f"✅ 크롤링 완료: {len(reviews)}개 리뷰")
-
-                    if not reviews:
-                        logger.warning(f"⚠️ 수집된 리뷰 없음, 신호만 완료 처리")
-                    else:
-                        # 2️리뷰 요약
-                        summary = summarize_competitor_reviews(reviews, openai_api_key)
-                        logger.info("✅ 리뷰 요약 완료")
-
-                        # 3️DB 저장
-                        insert_review_summary(
-                            host=host,
-                            user=user,
-                            password=password,
-                            db=db,
-                            category=category,
-                            review_summary=summary,
-                            num_reviews=len(reviews)
-                        )
-                        logger.info("✅ 리뷰 요약본 DB 저장 완료")
-
-                    # 신호 완료 처리 (done 표시 및 완료 시각)
-                    cur.execute("""
-                        UPDATE crawl_request_signal
-                        SET status='done', completed_at=%s
-                        WHERE id=%s
-                    """, (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), signal_id))
-                    conn.commit()
-                    logger.info(f"✅ 신호 처리 완료: '{category}'")
-                else:
-                    logger.debug("🛠️ 처리 대기 신호 없음 (다음 확인까지 대기)")
-            conn.close()
+            claimed = claim_crawl_request(host, user, password, db, worker_id)
+            if claimed:
+                signal_id, category, _ = claimed
+                process_crawl_request(host, user, password, db, openai_api_key, signal_id, category, worker_id)
+                # 대기 중인 신호가 더 있을 수 있으므로 바로 다음 신호 확인
+                continue
+            logger.debug("🛠️ 처리 대기 신호 없음 (다음 확인까지 대기)")
         except Exception as e:
             logger.error(f"❌ 신호 감지/처리 중 오류: {type(e).__name__}: {e!r}")
-        time.sleep(interval)
\ No newline at end of file
+        time.sleep(interval)
+
+def start_signal_workers(host, user, password, db, openai_api_key, num_workers=2, interval=10) -> list:
+    """
+    신호 처리 워커 num_workers개를 각각 스레드로 실행합니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+        openai_api_key (str): OpenAI API 키
+        num_workers (int): 워커 수
+        interval (int): 신호가 없을 때 polling 주기(초)
+
+    Returns:
+        list: 실행된 워커 스레드 목록
+    """
+    threads = []
+    for index in range(max(1, num_workers)):
+        thread = threading.Thread(
+            target=poll_and_process_signal,
+            args=(host, user, password, db, openai_api_key, interval, default_worker_id(index)),
+            name=f"crawl-signal-worker-{index}",
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+    logger.info(f"✅ 신호 처리 워커 {len(threads)}개 시작")
+    return threads
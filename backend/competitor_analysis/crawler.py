@@ -1,49 +1,176 @@
 from typing import List
+import threading
 import time
-import re
-import os
-from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 import selenium.webdriver as webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from backend.competitor_analysis.driver_pool import get_driver_pool
+from backend.competitor_analysis.http_crawler import get_http_crawler
+from backend.competitor_analysis.review_parser import (
+    PRODUCT_ITEM_SELECTOR,
+    PRODUCT_LINK_SELECTOR,
+    REVIEW_ARTICLE_SELECTOR,
+    REVIEW_CONTENT_SELECTOR,
+    REVIEW_FILTER_SELECTOR,
+    build_search_url,
+    clean_product_url,
+    clean_review_text,
+    product_url_from_href,
+    review_hash,
+)
 from utils.logger import get_logger
+from utils.config import load_config
 
 logger = get_logger(__name__)
 
-def clean_product_url(url: str, pattern: str = r"https://.+?/vp/products/\d+") -> str:
-    """
-    상품 상세 URL을 정제해 표준 형태로 반환합니다.
-
-    Args:
-        url (str): 원본 상품 링크.
-        pattern (str): 추출 정규표현식 (기본: 제품 상세 링크 형식).
+# 크롤링 방식: auto(HTTP 우선, 필요 시 브라우저), http(HTTP만), browser(브라우저만)
+DEFAULT_CRAWL_MODE = "auto"
+# 조건 대기 최대 시간(초)
+PAGE_WAIT_TIMEOUT = 10
+REVIEW_WAIT_TIMEOUT = 5
+# 크롤링 프로필: 리뷰 텍스트만 읽으므로 이미지/폰트/미디어/트래커 요청은 차단
+CRAWL_WINDOW_SIZE = "1280,900"
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*criteo.com*", "*criteo.net*", "*hotjar.com*", "*scorecardresearch.com*",
+]
+# 페이지에서 받은 바이트(전송 크기)와 리소스 수를 Performance API로 측정하는 스크립트
+PAGE_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+let bytes = nav ? nav.transferSize : 0;
+for (const r of resources) bytes += r.transferSize || 0;
+return {bytes: bytes, resources: resources.length, dom_content_loaded: nav ? nav.domContentLoadedEventEnd : 0};
+"""
+# 아직 읽지 않은 리뷰 노드의 본문만 반환하고 읽은 노드에 표시를 남기는 스크립트
+# (페이지 전체 HTML을 매번 파싱하지 않고 새로 그려진 리뷰만 읽음)
+NEW_REVIEWS_SCRIPT = """
+const out = [];
+for (const article of document.querySelectorAll(arguments[0])) {
+    if (article.hasAttribute("data-geo-seen")) continue;
+    article.setAttribute("data-geo-seen", "1");
+    const content = article.querySelector(arguments[1]);
+    if (content) out.push(content.textContent);
+}
+return out;
+"""
 
-    Returns:
-        str: 정제된 상품 상세페이지 URL.
-    """
-    match = re.search(pattern, url)
-    result = match.group(0) if match else url
-    logger.debug(f"🛠️ 정제된 링크: {result}")
-    return result
+_page_stats = {"pages": 0, "bytes": 0, "resources": 0, "seconds": 0.0}
+_page_stats_lock = threading.Lock()
 
-def init_safe_driver():
+def init_safe_driver(headless: bool = False, crawl_profile: bool = False):
     """
     Selenium 크롬 드라이버를 초기화하여 반환합니다.
 
+    Args:
+        headless (bool): 화면 없이 실행할지 여부 (드라이버 풀에서는 True).
+        crawl_profile (bool): 크롤링 전용 프로필 사용 여부. 작은 창 크기, eager 페이지 로드,
+            이미지/폰트/미디어/트래커 요청 차단을 적용합니다. (config.yaml의 crawler.block_resources로 차단 해제 가능)
+
     Returns:
         webdriver.Chrome: 초기화된 드라이버 객체.
     """
     logger.debug("🛠️ 드라이버 초기화 시작")
     options = webdriver.ChromeOptions()
-    options.add_argument("--window-size=1920,1080")
+    if headless:
+        options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+
+    block_resources = False
+    if crawl_profile:
+        try:
+            block_resources = bool((load_config().get("crawler") or {}).get("block_resources", True))
+        except Exception:
+            block_resources = True
+        options.add_argument(f"--window-size={CRAWL_WINDOW_SIZE}")
+        # DOMContentLoaded까지만 기다리고, 필요한 요소는 WebDriverWait로 확인
+        options.page_load_strategy = "eager"
+        options.add_argument("--mute-audio")
+        options.add_argument("--disable-extensions")
+        if block_resources:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    else:
+        options.add_argument("--window-size=1920,1080")
+
     driver = webdriver.Chrome(options=options)
-    logger.info("✅ 드라이버 실행 성공")
+    if block_resources:
+        # 폰트/미디어/트래커는 설정으로 끌 수 없으므로 CDP로 요청 자체를 차단
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    logger.info(f"✅ 드라이버 실행 성공 (headless={headless}, crawl_profile={crawl_profile}, block_resources={block_resources})")
     return driver
 
+def record_page_metrics(driver, url: str, started: float):
+    """
+    상품 페이지 한 개를 크롤링하는 데 받은 바이트와 걸린 시간을 기록합니다.
+    (교차 출처 리소스는 Timing-Allow-Origin이 없으면 전송 크기가 0으로 집계되므로 근사값)
+
+    Args:
+        driver: Selenium 드라이버 객체.
+        url (str): 상품 상세페이지 URL.
+        started (float): 페이지 요청 시작 시각 (time.monotonic())
+    """
+    elapsed = time.monotonic() - started
+    try:
+        metrics = driver.execute_script(PAGE_METRICS_SCRIPT) or {}
+    except Exception as e:
+        logger.debug(f"🛠️ 페이지 측정 실패: {type(e).__name__}: {e!r}")
+        metrics = {}
+    page_bytes = int(metrics.get("bytes") or 0)
+    with _page_stats_lock:
+        _page_stats["pages"] += 1
+        _page_stats["bytes"] += page_bytes
+        _page_stats["resources"] += int(metrics.get("resources") or 0)
+        _page_stats["seconds"] += elapsed
+    logger.debug(
+        f"🛠️ 페이지 크롤링 측정: {url} {page_bytes / 1024:.0f}KB, 리소스 {metrics.get('resources', 0)}개, "
+        f"DOMContentLoaded {metrics.get('dom_content_loaded', 0):.0f}ms, 전체 {elapsed:.2f}s"
+    )
+
+def get_page_stats() -> dict:
+    """
+    지금까지 브라우저로 크롤링한 상품 페이지의 누적/평균 전송량과 시간을 반환합니다.
+    """
+    with _page_stats_lock:
+        stats = dict(_page_stats)
+    pages = stats["pages"] or 1
+    stats["bytes_avg"] = stats["bytes"] / pages
+    stats["seconds_avg"] = stats["seconds"] / pages
+    return stats
+
+def _first_review_article(driver):
+    articles = driver.find_elements(By.CSS_SELECTOR, REVIEW_ARTICLE_SELECTOR)
+    return articles[0] if articles else None
+
+def wait_for_review_refresh(driver, old_article, timeout: float = REVIEW_WAIT_TIMEOUT):
+    """
+    필터 변경/페이지 이동 후 리뷰 목록이 새로 그려질 때까지 기다립니다.
+    (이전 첫 번째 리뷰 노드가 DOM에서 사라지고 새 리뷰 노드가 나타날 때까지)
+
+    Args:
+        driver: Selenium 드라이버 객체.
+        old_article: 갱신 전 첫 번째 리뷰 요소 (없으면 None).
+        timeout (float): 최대 대기 시간(초).
+    """
+    try:
+        if old_article is not None:
+            WebDriverWait(driver, timeout).until(EC.staleness_of(old_article))
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, REVIEW_ARTICLE_SELECTOR))
+        )
+    except TimeoutException:
+        # 해당 필터에 리뷰가 없거나 목록이 그대로인 경우
+        logger.debug("🛠️ 리뷰 목록 갱신 대기 시간 초과")
+
 def click_review_filter(driver, label: str) -> bool:
     """
     리뷰 필터 드롭다운에서 지정된 라벨의 항목을 클릭합니다.
@@ -57,11 +184,10 @@ def click_review_filter(driver, label: str) -> bool:
     """
     logger.debug(f"🛠️ 리뷰 필터 클릭 시도: {label}")
     try:
-        dropdown_trigger = WebDriverWait(driver, 5).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "div.review-star-search-current-selection"))
+        dropdown_trigger = WebDriverWait(driver, REVIEW_WAIT_TIMEOUT).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, REVIEW_FILTER_SELECTOR))
         )
         dropdown_trigger.click()
-        time.sleep(1)
 
         WebDriverWait(driver, 5).until(
             EC.visibility_of_element_located((By.CLASS_NAME, "review-star-search-selector"))
@@ -75,8 +201,9 @@ def click_review_filter(driver, label: str) -> bool:
                 wrapper = item.find_element(By.CLASS_NAME, "review-star-search-item")
                 desc_el = wrapper.find_element(By.CLASS_NAME, "review-star-search-item-desc")
                 if desc_el.text.strip() == label:
+                    old_article = _first_review_article(driver)
                     item.click()
-                    time.sleep(2)
+                    wait_for_review_refresh(driver, old_article)
                     return True
             except Exception:
                 continue
@@ -86,42 +213,67 @@ def click_review_filter(driver, label: str) -> bool:
 
     return False
 
-def crawl_bad_reviews(driver, max_reviews: int) -> List[str]:
+def read_new_reviews(driver) -> List[str]:
+    """
+    현재 페이지에서 아직 읽지 않은 리뷰 노드의 본문만 브라우저 안에서 추출합니다.
+
+    Args:
+        driver: Selenium 드라이버 객체.
+
+    Returns:
+        List[str]: 새로 읽은 리뷰 본문 원문 리스트.
+    """
+    return driver.execute_script(NEW_REVIEWS_SCRIPT, REVIEW_ARTICLE_SELECTOR, REVIEW_CONTENT_SELECTOR) or []
+
+def crawl_bad_reviews(driver, max_reviews: int, seen: set = None) -> List[str]:
     """
     현재 상품 상세페이지에서 부정 리뷰(나쁨/별로)를 최대 max_reviews개까지 크롤링합니다.
+    페이지를 넘길 때마다 새로 그려진 리뷰 노드만 읽고, 이미 수집한 리뷰는 해시로 제외합니다.
 
     Args:
         driver: Selenium 드라이버 객체.
         max_reviews (int): 최대 수집 리뷰 개수.
+        seen (set, optional): 이미 수집했거나 DB에 저장된 리뷰 해시 (필터를 바꿔 이어서 수집할 때 공유).
+            한 페이지의 리뷰가 모두 seen에 있으면 이후 페이지는 넘기지 않습니다.
 
     Returns:
         List[str]: 리뷰 본문 텍스트 리스트.
     """
     logger.debug("🛠️ 부정 리뷰 크롤링 시작")
+    seen = set() if seen is None else seen
     reviews = []
     while len(reviews) < max_reviews:
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        review_list = soup.select("div.js_reviewArticleListContainer article")
-        for article in review_list:
-            content_tag = article.select_one("div.sdp-review__article__list__review__content span")
-            if content_tag:
-                text = content_tag.get_text(strip=True)
-                text = re.sub(r"[^\w\s가-힣.,!?]", "", text)
-                if text:
-                    reviews.append(text)
+        page_texts, page_new = 0, 0
+        for raw_text in read_new_reviews(driver):
+            text = clean_review_text(raw_text)
+            if not text:
+                continue
+            page_texts += 1
+            key = review_hash(text)
+            if key in seen:
+                continue
+            seen.add(key)
+            reviews.append(text)
+            page_new += 1
             if len(reviews) >= max_reviews:
                 break
+        if len(reviews) >= max_reviews:
+            break
+        if page_texts and not page_new:
+            logger.debug("🛠️ 이미 수집된 리뷰만 있는 페이지, 다음 페이지 생략")
+            break
         try:
             next_btn = driver.find_element(By.CSS_SELECTOR, "button.sdp-review__article__page__button--next")
             if "disabled" in next_btn.get_attribute("class"):
                 break
+            old_article = _first_review_article(driver)
             next_btn.click()
-            time.sleep(1.5)
+            wait_for_review_refresh(driver, old_article)
         except Exception:
             break
     return reviews
 
-def crawl_reviews_by_link(driver, url: str, max_reviews: int = 30) -> List[str]:
+def crawl_reviews_by_link(driver, url: str, max_reviews: int = 30, known: set = None) -> List[str]:
     """
     주어진 상품 상세페이지 URL에서 부정 리뷰를 수집합니다.
 
@@ -129,6 +281,7 @@ def crawl_reviews_by_link(driver, url: str, max_reviews: int = 30) -> List[str]:
         driver: Selenium 드라이버 객체.
         url (str): 상품 상세페이지 URL.
         max_reviews (int): 최대 수집 리뷰 수.
+        known (set, optional): 이미 DB에 저장된 리뷰 해시 (수집 결과에서 제외)
 
     Returns:
         List[str]: 수집된 리뷰 리스트.
@@ -136,19 +289,74 @@ def crawl_reviews_by_link(driver, url: str, max_reviews: int = 30) -> List[str]:
     url = clean_product_url(url)
     logger.debug(f"🛠️ 리뷰 수집 시작: {url}")
     try:
+        started = time.monotonic()
         driver.get(url)
-        time.sleep(2)
+        try:
+            # 리뷰 필터가 나타날 때까지 대기 (리뷰 영역 로딩 완료)
+            WebDriverWait(driver, PAGE_WAIT_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, REVIEW_FILTER_SELECTOR))
+            )
+        except TimeoutException:
+            logger.warning(f"⚠️ 리뷰 영역 로딩 대기 시간 초과: {url}")
         reviews = []
+        seen = set(known or ())
         if click_review_filter(driver, "나쁨"):
-            reviews = crawl_bad_reviews(driver, max_reviews)
+            reviews = crawl_bad_reviews(driver, max_reviews, seen)
         if len(reviews) < max_reviews and click_review_filter(driver, "별로"):
-            additional = crawl_bad_reviews(driver, max_reviews - len(reviews))
+            additional = crawl_bad_reviews(driver, max_reviews - len(reviews), seen)
             reviews.extend(additional)
+        record_page_metrics(driver, url, started)
         return reviews
     except Exception as e:
         logger.error(f"❌ 리뷰 수집 실패: {type(e).__name__}: {e!r}")
         return []
 
+def collect_product_links(driver, category: str, max_products: int) -> List[str]:
+    """
+    카테고리 검색 결과에서 상품 상세페이지 링크를 최대 max_products개 수집합니다.
+
+    Args:
+        driver: Selenium 드라이버 객체.
+        category (str): 검색 키워드.
+        max_products (int): 최대 상품 개수.
+
+    Returns:
+        List[str]: 정제된 상품 상세페이지 URL 리스트.
+    """
+    driver.get(build_search_url(category))
+    WebDriverWait(driver, PAGE_WAIT_TIMEOUT).until(
+        EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_ITEM_SELECTOR))
+    )
+    # 지연 로딩되는 상품 목록을 불러오기 위해 스크롤 후 상품 수가 충분해질 때까지 대기
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    try:
+        WebDriverWait(driver, REVIEW_WAIT_TIMEOUT).until(
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, PRODUCT_ITEM_SELECTOR)) >= max_products
+        )
+    except TimeoutException:
+        logger.debug("🛠️ 상품 목록이 max_products보다 적음, 현재 목록으로 진행")
+
+    soup = BeautifulSoup(driver.page_source, "html.parser")
+    product_links = []
+    for li in soup.select(PRODUCT_ITEM_SELECTOR):
+        a_tag = li.select_one(PRODUCT_LINK_SELECTOR)
+        if a_tag:
+            product_links.append(product_url_from_href(a_tag["href"]))
+        if len(product_links) >= max_products:
+            break
+    return product_links
+
+def _crawl_link_with_pool(pool, link: str, max_reviews: int, known: set = None) -> List[str]:
+    with pool.acquire() as driver:
+        return crawl_reviews_by_link(driver, link, max_reviews=max_reviews, known=known)
+
+def _get_crawl_mode() -> str:
+    try:
+        mode = (load_config().get("crawler") or {}).get("mode", DEFAULT_CRAWL_MODE)
+    except Exception:
+        mode = DEFAULT_CRAWL_MODE
+    return mode if mode in ("auto", "http", "browser") else DEFAULT_CRAWL_MODE
+
 def crawl_reviews_by_category(
     category: str, max_products: int = 3, max_reviews_per_product: int = 10
 ) -> List[str]:
@@ -163,42 +371,74 @@ def crawl_reviews_by_category(
     Returns:
         List[str]: 전체 수집된 리뷰 리스트.
     """
-    logger.debug(f"🛠️ 카테고리 '{category}'로 리뷰 크롤링 시작")
-    all_reviews = []
-    driver = init_safe_driver()
+    product_reviews = crawl_product_reviews_by_category(category, max_products, max_reviews_per_product)
+    return [review for _, reviews in product_reviews for review in reviews]
+
+def crawl_product_reviews_by_category(
+    category: str, max_products: int = 3, max_reviews_per_product: int = 10, known: dict = None
+) -> List[tuple]:
+    """
+    특정 카테고리 검색 결과의 상품별 부정 리뷰를 수집합니다.
+    config.yaml의 crawler.mode가 auto이면 HTTP 크롤러로 먼저 수집하고,
+    JavaScript가 필요한 페이지만 공유 드라이버 풀의 Chrome으로 동시에 크롤링합니다.
+
+    Args:
+        category (str): 검색 키워드.
+        max_products (int): 최대 상품 개수.
+        max_reviews_per_product (int): 상품별 최대 리뷰 수 (known을 주면 새 리뷰 기준).
+        known (dict, optional): 상품 URL → 이미 DB에 저장된 리뷰 해시. 저장된 리뷰는 제외하고,
+            저장된 리뷰만 있는 페이지에서 페이지 넘김을 멈춰 새 리뷰만큼만 크롤링합니다.
+
+    Returns:
+        List[tuple]: (상품 URL, 리뷰 리스트) 리스트.
+    """
+    known = known or {}
+    logger.debug(
+        f"🛠️ 카테고리 '{category}'로 리뷰 크롤링 시작 (저장된 리뷰 {sum(len(hashes) for hashes in known.values())}개 제외)"
+    )
+    mode = _get_crawl_mode()
     try:
-        base_search_url = os.environ.get("BASE_SEARCH_URL", "https://example.com/np/search")
-        base_url = f"{base_search_url}?q={quote(category)}&sorter=scoreDesc"
-        driver.get(base_url)
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located(
-                (By.CSS_SELECTOR, 'ul#product-list li[class^="ProductUnit_productUnit__"]')
+        product_links, results = None, None
+        if mode != "browser":
+            try:
+                http_crawler = get_http_crawler()
+                product_links = http_crawler.collect_product_links(category, max_products)
+                if product_links:
+                    results = http_crawler.crawl_reviews(product_links, max_reviews_per_product, known)
+                logger.debug(f"🛠️ HTTP 크롤러 통계: {http_crawler.get_stats()}")
+            except Exception as e:
+                if mode == "http":
+                    raise
+                logger.warning(f"⚠️ HTTP 크롤링 실패, 브라우저로 수집합니다: {type(e).__name__}: {e!r}")
+                product_links, results = None, None
+            if mode == "http":
+                return [(link, reviews) for link, reviews in zip(product_links or [], results or []) if reviews]
+
+        # HTTP로 수집하지 못한 부분만 브라우저로 수집
+        pool = get_driver_pool(lambda: init_safe_driver(headless=True, crawl_profile=True))
+        if not product_links:
+            with pool.acquire() as driver:
+                product_links = collect_product_links(driver, category, max_products)
+            logger.debug(f"🛠️ 상품 링크 {len(product_links)}개 수집")
+        if not product_links:
+            return []
+        results = results or [None] * len(product_links)
+        browser_links = [link for link, reviews in zip(product_links, results) if reviews is None]
+        if browser_links:
+            logger.info(f"✅ 브라우저로 수집할 상품 {len(browser_links)}/{len(product_links)}개")
+            with ThreadPoolExecutor(max_workers=min(pool.pool_size, len(browser_links))) as executor:
+                browser_results = iter(executor.map(
+                    lambda link: _crawl_link_with_pool(pool, link, max_reviews_per_product, known.get(link)), browser_links
+                ))
+                # 상품 순서대로 결과를 합치기 위해 원래 위치에 채움
+                results = [next(browser_results) if reviews is None else reviews for reviews in results]
+            page_stats = get_page_stats()
+            logger.info(
+                f"✅ 브라우저 페이지 평균: {page_stats['bytes_avg'] / 1024:.0f}KB, {page_stats['seconds_avg']:.2f}s "
+                f"(누적 {page_stats['pages']}페이지)"
             )
-        )
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        product_links = []
-        for li in soup.select('ul#product-list li[class^="ProductUnit_productUnit__"]'):
-            a_tag = li.select_one('a[href^="/vp/products/"]')
-            if a_tag:
-                raw_url = base_search_url.split("/np/")[0] + a_tag["href"]
-                clean_url = clean_product_url(raw_url)
-                product_links.append(clean_url)
-            if len(product_links) >= max_products:
-                break
-        for link in product_links:
-            reviews = crawl_reviews_by_link(driver, link, max_reviews=max_reviews_per_product)
-            all_reviews.extend(reviews)
-            time.sleep(1)
-        return all_reviews
+            logger.debug(f"🛠️ 드라이버 풀 통계: {pool.get_stats()}")
+        return list(zip(product_links, results))
     except Exception as e:
         logger.error(f"❌ 카테고리 리뷰 수집 실패: {type(e).__name__}: {e!r}")
         return []
-    finally:
-        driver.quit()
-        logger.debug("🛠️ 드라이버 종료")
\ No newline at end of file
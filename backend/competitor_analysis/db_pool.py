@@ -0,0 +1,330 @@
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import pymysql
+from utils.logger import get_logger
+from utils.config import load_config
+
+logger = get_logger(__name__)
+
+# config.yaml의 db_pool 섹션이 없을 때 사용할 기본값
+DEFAULT_POOL_OPTIONS = {
+    "max_size": 5,
+    # 이 시간(초) 이상 쉬고 있던 연결은 닫고 새로 연결
+    "idle_timeout": 300,
+    # 이 시간(초) 이상 사용한 연결은 재활용하지 않고 새로 연결
+    "max_lifetime": 3600,
+    # 이 시간(초) 이상 쉬고 있던 연결은 빌려주기 전에 ping으로 확인
+    "ping_interval": 30,
+    # 연결이 모두 사용 중일 때 최대 대기 시간(초)
+    "checkout_timeout": 10,
+}
+
+
+class PooledConnection:
+    """
+    풀에 보관되는 연결과 생성/마지막 사용 시각.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    """
+    스레드 간에 공유하는 pymysql 연결 풀.
+    빌려줄 때 오래된 연결은 재연결하고, 쉬고 있던 연결은 ping으로 상태를 확인합니다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        user: str,
+        password: str,
+        db: str,
+        port: int = 3306,
+        max_size: int = DEFAULT_POOL_OPTIONS["max_size"],
+        idle_timeout: float = DEFAULT_POOL_OPTIONS["idle_timeout"],
+        max_lifetime: float = DEFAULT_POOL_OPTIONS["max_lifetime"],
+        ping_interval: float = DEFAULT_POOL_OPTIONS["ping_interval"],
+        checkout_timeout: float = DEFAULT_POOL_OPTIONS["checkout_timeout"]
+    ):
+        self._connect_kwargs = {
+            "host": host, "user": user, "password": password, "db": db, "port": port,
+            # 풀의 연결은 재사용되므로 SELECT가 이전 트랜잭션 스냅샷을 보지 않도록 autocommit 사용
+            "charset": "utf8mb4", "autocommit": True,
+        }
+        self.max_size = max(1, int(max_size))
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.ping_interval = ping_interval
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = deque()
+        self._opened = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {
+            "checkouts": 0,
+            "created": 0,
+            "recycled": 0,
+            "ping_failures": 0,
+            "discarded": 0,
+            "timeouts": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+        }
+
+    @contextmanager
+    def connection(self):
+        """
+        연결을 빌려주고, 블록이 끝나면 풀에 반납합니다.
+        블록에서 예외가 발생하면 rollback 후 반납하고, rollback도 실패하면 연결을 버립니다.
+
+        Yields:
+            pymysql.connections.Connection: DB 연결
+
+        Raises:
+            TimeoutError: checkout_timeout 안에 연결을 빌리지 못한 경우
+        """
+        item = self._checkout()
+        try:
+            yield item.conn
+        except Exception:
+            try:
+                item.conn.rollback()
+            except Exception as e:
+                logger.warning(f"⚠️ rollback 실패, 연결 폐기: {type(e).__name__}: {e!r}")
+                self._discard(item)
+            else:
+                self._checkin(item)
+            # rollback 실패 여부와 관계없이 블록에서 발생한 원래 예외를 전달
+            raise
+        else:
+            self._checkin(item)
+
+    def get_stats(self) -> dict:
+        """
+        연결 생성/재활용 횟수와 checkout 대기 시간 통계를 반환합니다.
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats["opened"] = self._opened
+            stats["idle"] = len(self._idle)
+        stats["wait_avg"] = stats["wait_total"] / stats["checkouts"] if stats["checkouts"] else 0.0
+        return stats
+
+    def close(self):
+        """
+        쉬고 있는 연결을 모두 닫습니다. 사용 중인 연결은 반납될 때 닫힙니다.
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._opened -= len(idle)
+            self._cond.notify_all()
+        for item in idle:
+            self._close_quietly(item.conn)
+        logger.debug(f"🛠️ DB 연결 풀 종료: {self.get_stats()}")
+
+    def _checkout(self) -> PooledConnection:
+        started = time.monotonic()
+        deadline = started + self.checkout_timeout
+        while True:
+            item = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("❌ 종료된 DB 연결 풀입니다")
+                    if self._idle:
+                        # 가장 최근에 반납된 연결부터 사용 (오래 쉰 연결은 자연스럽게 만료됨)
+                        item = self._idle.pop()
+                        break
+                    if self._opened < self.max_size:
+                        self._opened += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise TimeoutError(f"❌ DB 연결 대기 시간 초과 ({self.checkout_timeout}s, max_size={self.max_size})")
+                    self._cond.wait(remaining)
+
+            # 네트워크 작업(ping, 연결)은 lock 밖에서 수행
+            try:
+                item = self._prepare(item)
+            except Exception:
+                with self._cond:
+                    self._opened -= 1
+                    self._cond.notify()
+                raise
+            if item is None:
+                continue
+
+            wait = time.monotonic() - started
+            with self._cond:
+                self._stats["checkouts"] += 1
+                self._stats["wait_total"] += wait
+                self._stats["wait_max"] = max(self._stats["wait_max"], wait)
+            if wait > 1:
+                logger.warning(f"⚠️ DB 연결 대기 시간이 깁니다: {wait:.2f}s (max_size={self.max_size})")
+            return item
+
+    def _prepare(self, item: PooledConnection) -> PooledConnection:
+        """
+        빌려줄 연결을 준비합니다. 새 연결이 필요하면 연결하고, 오래된 연결은 재연결합니다.
+        ping에 실패한 연결은 버리고 None을 반환해 다시 빌리도록 합니다.
+        """
+        if item is None:
+            return self._connect()
+
+        now = time.monotonic()
+        if now - item.last_used > self.idle_timeout or now - item.created_at > self.max_lifetime:
+            self._close_quietly(item.conn)
+            with self._cond:
+                self._stats["recycled"] += 1
+            return self._connect()
+
+        if now - item.last_used > self.ping_interval:
+            try:
+                item.conn.ping(reconnect=False)
+            except Exception as e:
+                logger.warning(f"⚠️ DB 연결 상태 확인 실패, 연결 폐기: {type(e).__name__}: {e!r}")
+                with self._cond:
+                    self._stats["ping_failures"] += 1
+                self._discard(item)
+                return None
+        return item
+
+    def _connect(self) -> PooledConnection:
+        conn = pymysql.connect(**self._connect_kwargs)
+        with self._cond:
+            self._stats["created"] += 1
+        logger.debug(f"🛠️ DB 연결 생성 (opened={self._opened}/{self.max_size})")
+        return PooledConnection(conn)
+
+    def _checkin(self, item: PooledConnection):
+        item.last_used = time.monotonic()
+        with self._cond:
+            if not self._closed:
+                self._idle.append(item)
+                self._cond.notify()
+                return
+            self._opened -= 1
+        self._close_quietly(item.conn)
+
+    def _discard(self, item: PooledConnection):
+        self._close_quietly(item.conn)
+        with self._cond:
+            self._opened -= 1
+            self._stats["discarded"] += 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"🛠️ DB 연결 종료 중 예외 무시: {type(e).__name__}: {e!r}")
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_db_pool(host: str, user: str, password: str, db: str) -> ConnectionPool:
+    """
+    접속 정보별로 프로세스 전체에서 공유하는 연결 풀을 반환합니다. (최초 호출 시 생성)
+    풀 크기와 재활용 주기는 config.yaml의 db_pool 섹션으로 지정합니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+
+    Returns:
+        ConnectionPool: 연결 풀
+    """
+    key = (host, user, password, db)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            try:
+                pool_config = load_config().get("db_pool") or {}
+            except Exception:
+                pool_config = {}
+            options = {name: pool_config.get(name, default) for name, default in DEFAULT_POOL_OPTIONS.items()}
+            pool = _pools[key] = ConnectionPool(host, user, password, db, **options)
+            logger.info(f"✅ DB 연결 풀 생성: {user}@{host}/{db} (max_size={options['max_size']})")
+        return pool
+
+
+@contextmanager
+def db_connection(host: str, user: str, password: str, db: str):
+    """
+    공유 연결 풀에서 연결을 빌려 사용합니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+
+    Yields:
+        pymysql.connections.Connection: DB 연결
+    """
+    with get_db_pool(host, user, password, db).connection() as conn:
+        yield conn
+
+
+def _get_db_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            try:
+                max_size = (load_config().get("db_pool") or {}).get("max_size", DEFAULT_POOL_OPTIONS["max_size"])
+            except Exception:
+                max_size = DEFAULT_POOL_OPTIONS["max_size"]
+            # 연결 풀 크기만큼만 스레드를 두어 스레드가 연결을 기다리며 놀지 않도록 함
+            _executor = ThreadPoolExecutor(max_workers=max(1, int(max_size)), thread_name_prefix="competitor-db")
+        return _executor
+
+
+async def run_in_db_executor(func, *args, **kwargs):
+    """
+    블로킹 DB 함수를 전용 스레드 풀에서 실행하고 결과를 기다립니다.
+    이벤트 루프(FastAPI)는 DB 응답을 기다리는 동안 다른 요청을 처리할 수 있습니다.
+
+    Args:
+        func (Callable): 실행할 동기 DB 함수
+        *args, **kwargs: func에 전달할 인자
+
+    Returns:
+        Any: func의 반환값
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_db_executor(), functools.partial(func, *args, **kwargs))
+
+
+def close_db_pools():
+    """
+    생성된 모든 연결 풀과 DB 전용 스레드 풀을 닫습니다. (프로세스 종료 시 호출)
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
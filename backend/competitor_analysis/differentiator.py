@@ -2,9 +2,69 @@ import openai
 import json
 from typing import List, Dict
 from utils.logger import get_logger
+from utils.token_budget import count_tokens, fit_prompt_parts, get_token_budget
 
 logger = get_logger(__name__)
 
+# 요약/요약 갱신 프롬프트가 공유하는 출력 형식 지시
+REVIEW_SUMMARY_FORMAT = (
+    "한글 핵심 키워드 중심으로 3~7개 항목으로 리스트화해줘. "
+    "각 항목은 한글 20자 이내로 간결히 써줘. 예를 들어, '배터리 방전 문제', '블루투스 연결 불안정', '음질 저하', '착용감 불편' 등."
+)
+
+def _review_prompt_parts(reviews: List[str], existing_summary: str = None) -> List[Dict]:
+    """
+    리뷰 요약(existing_summary가 없을 때) 또는 요약 갱신 프롬프트 조각을 만듭니다.
+    리뷰는 select_summary_reviews()로 미리 예산에 맞춰 고르므로 자르지 않는 조각으로 둡니다.
+    """
+    if existing_summary is None:
+        return [
+            {"name": "header", "text": "아래는 경쟁사 상품에 대한 부정적 리뷰들입니다.\n\n", "priority": None},
+            {"name": "reviews", "text": "\n".join(reviews), "priority": None},
+            {"name": "instruction", "text": (
+                "\n\n이 리뷰에서 반복적으로 언급된 불만, 단점, 개선점만 " + REVIEW_SUMMARY_FORMAT
+            ), "priority": None},
+        ]
+    return [
+        {"name": "header", "text": "아래는 경쟁사 상품 부정 리뷰의 기존 요약과, 이후 새로 수집된 부정적 리뷰들입니다.\n\n[기존 요약]\n", "priority": None},
+        {"name": "summary", "text": existing_summary + "\n\n[새 리뷰]\n", "priority": None},
+        {"name": "reviews", "text": "\n".join(reviews), "priority": None},
+        {"name": "instruction", "text": (
+            "\n\n기존 요약 항목을 유지하되, 새 리뷰에서 반복되는 불만, 단점, 개선점을 반영해 요약을 갱신해줘. "
+            "새 리뷰가 기존 항목과 같은 내용이면 합치고, 전체를 " + REVIEW_SUMMARY_FORMAT
+        ), "priority": None},
+    ]
+
+def select_summary_reviews(
+    reviews: List[str],
+    existing_summary: str = None,
+    model: str = "gpt-4o"
+) -> List[str]:
+    """
+    요약 프롬프트의 토큰 예산(token_budget.review_summary)에 들어가는 앞쪽 리뷰만 골라 반환한다.
+    리뷰를 저장하는 쪽은 이 결과만 요약하고 저장해야, 예산 초과로 빠진 리뷰가 요약 없이 저장되지 않는다.
+
+    Args:
+        reviews (List[str]): 리뷰 문자열 리스트.
+        existing_summary (str, optional): 갱신할 기존 요약본 (없으면 새 요약 프롬프트 기준).
+        model (str): 사용할 GPT 모델명 (토큰 계산용).
+
+    Returns:
+        List[str]: 예산 안에 들어가는 앞쪽 리뷰 리스트.
+    """
+    fixed = sum(count_tokens(part["text"], model) for part in _review_prompt_parts([], existing_summary))
+    available = get_token_budget("review_summary") - fixed
+    selected, used = [], 0
+    for review in reviews:
+        tokens = count_tokens(review + "\n", model)
+        if used + tokens > available:
+            break
+        selected.append(review)
+        used += tokens
+    if len(selected) < len(reviews):
+        logger.warning(f"⚠️ 리뷰 요약 토큰 예산 초과로 리뷰 {len(reviews)}개 중 {len(selected)}개만 사용")
+    return selected
+
 def summarize_competitor_reviews(
     reviews: List[str], 
     openai_api_key: str, 
@@ -12,6 +72,7 @@ def summarize_competitor_reviews(
 ) -> str:
     """
     경쟁사 부정 리뷰들을 GPT로 요약해 한글 요약문을 반환한다.
+    토큰 예산을 넘는 뒤쪽 리뷰는 제외한다. (select_summary_reviews 참고)
 
     Args:
         reviews (List[str]): 경쟁사 리뷰 문자열 리스트.
@@ -23,13 +84,13 @@ def summarize_competitor_reviews(
     """
     logger.debug(f"🛠️ 리뷰 {len(reviews)}개에 대해 요약 시작 (model={model})")
     client = openai.OpenAI(api_key=openai_api_key)
-    joined = "\n".join(reviews)
-    prompt = (
-        "아래는 경쟁사 상품에 대한 부정적 리뷰들입니다.\n\n"
-        f"{joined}\n\n"
-        "이 리뷰에서 반복적으로 언급된 불만, 단점, 개선점만 한글로 핵심 키워드 중심으로 3~7개 항목으로 리스트화해줘. "
-        "각 항목은 한글 20자 이내로 간결히 써줘. 예를 들어, '배터리 방전 문제', '블루투스 연결 불안정', '음질 저하', '착용감 불편' 등."
-    )
+    reviews = select_summary_reviews(reviews, model=model)
+    prompt = "".join(fit_prompt_parts(
+        _review_prompt_parts(reviews),
+        get_token_budget("review_summary"),
+        model=model,
+        label="경쟁사 리뷰 요약"
+    ))
     try:
         res = client.chat.completions.create(
             model=model,
@@ -44,6 +105,49 @@ def summarize_competitor_reviews(
         logger.error(f"❌ 경쟁사 리뷰 요약 중 오류 발생: {type(e).__name__}: {e!r}")
         return ""
 
+def merge_review_summary(
+    existing_summary: str,
+    new_reviews: List[str],
+    openai_api_key: str,
+    model: str = "gpt-4o"
+) -> str:
+    """
+    기존 리뷰 요약본에 새로 수집된 부정 리뷰만 반영해 갱신된 한글 요약문을 반환한다.
+    전체 리뷰를 다시 요약하지 않으므로 프롬프트 크기가 새 리뷰 수에 비례한다.
+    토큰 예산을 넘는 뒤쪽 리뷰는 제외한다. (select_summary_reviews 참고)
+
+    Args:
+        existing_summary (str): 기존 리뷰 요약본.
+        new_reviews (List[str]): 새로 수집된 리뷰 문자열 리스트.
+        openai_api_key (str): OpenAI API 키.
+        model (str): 사용할 GPT 모델명 (기본: "gpt-4o").
+
+    Returns:
+        str: 갱신된 리뷰 요약 결과 (한글, 실패 시 빈 문자열).
+    """
+    logger.debug(f"🛠️ 기존 요약에 새 리뷰 {len(new_reviews)}개 반영 시작 (model={model})")
+    client = openai.OpenAI(api_key=openai_api_key)
+    new_reviews = select_summary_reviews(new_reviews, existing_summary, model=model)
+    prompt = "".join(fit_prompt_parts(
+        _review_prompt_parts(new_reviews, existing_summary),
+        get_token_budget("review_summary"),
+        model=model,
+        label="경쟁사 리뷰 요약 갱신"
+    ))
+    try:
+        res = client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=256,
+            temperature=0.5
+        )
+        merged = res.choices[0].message.content.strip()
+        logger.info("✅ 경쟁사 리뷰 요약 갱신 완료")
+        return merged
+    except Exception as e:
+        logger.error(f"❌ 경쟁사 리뷰 요약 갱신 중 오류 발생: {type(e).__name__}: {e!r}")
+        return ""
+
 def generate_differentiators(
     product_input: Dict,
     competitor_summary: str,
@@ -0,0 +1,181 @@
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from utils.logger import get_logger
+from utils.config import load_config
+
+logger = get_logger(__name__)
+
+DEFAULT_DRIVER_POOL_SIZE = 3
+# 드라이버를 빌릴 때 최대 대기 시간(초)
+DEFAULT_ACQUIRE_TIMEOUT = 300
+
+
+class DriverPool:
+    """
+    크롤링용 Selenium 드라이버 풀. 드라이버를 카테고리/상품 크롤링 사이에 재사용하고,
+    동시에 실행되는 드라이버 수를 pool_size로 제한합니다.
+    """
+
+    def __init__(self, driver_factory, pool_size: int = DEFAULT_DRIVER_POOL_SIZE):
+        """
+        Args:
+            driver_factory (Callable): 새 드라이버를 만드는 함수
+            pool_size (int): 최대 드라이버 수
+        """
+        self._driver_factory = driver_factory
+        self.pool_size = max(1, int(pool_size))
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._lock = threading.Lock()
+        self._drivers = set()
+        self._closed = False
+        self._stats = {"acquires": 0, "created": 0, "replaced": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+    @contextmanager
+    def acquire(self, timeout: float = DEFAULT_ACQUIRE_TIMEOUT):
+        """
+        드라이버를 빌려주고, 블록이 끝나면 풀에 반납합니다.
+        블록에서 예외가 발생하면 드라이버 상태를 확인해 응답하지 않으면 폐기합니다.
+
+        Yields:
+            webdriver.Chrome: 드라이버
+
+        Raises:
+            TimeoutError: timeout 안에 드라이버를 빌리지 못한 경우
+        """
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"❌ 크롤링 드라이버 대기 시간 초과 ({timeout}s, pool_size={self.pool_size})")
+        try:
+            driver = self._take()
+        except Exception:
+            self._slots.release()
+            raise
+
+        wait = time.monotonic() - started
+        with self._lock:
+            self._stats["acquires"] += 1
+            self._stats["wait_total"] += wait
+            self._stats["wait_max"] = max(self._stats["wait_max"], wait)
+
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = self._is_alive(driver)
+            raise
+        finally:
+            self._give_back(driver, healthy)
+
+    def get_stats(self) -> dict:
+        """
+        드라이버 생성/교체 횟수와 대기 시간 통계를 반환합니다.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["drivers"] = len(self._drivers)
+        stats["wait_avg"] = stats["wait_total"] / stats["acquires"] if stats["acquires"] else 0.0
+        return stats
+
+    def close(self):
+        """
+        모든 드라이버를 종료합니다.
+        """
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = list(self._drivers), set()
+        for driver in drivers:
+            self._quit_quietly(driver)
+        logger.info(f"✅ 크롤링 드라이버 풀 종료 ({len(drivers)}개)")
+
+    def _take(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._is_alive(driver):
+                return driver
+            logger.warning("⚠️ 응답하지 않는 드라이버를 교체합니다")
+            self._forget(driver)
+            with self._lock:
+                self._stats["replaced"] += 1
+
+        driver = self._driver_factory()
+        with self._lock:
+            self._drivers.add(driver)
+            self._stats["created"] += 1
+        logger.debug(f"🛠️ 크롤링 드라이버 생성 ({len(self._drivers)}/{self.pool_size})")
+        return driver
+
+    def _give_back(self, driver, healthy: bool):
+        with self._lock:
+            closed = self._closed
+        if healthy and not closed:
+            self._idle.put(driver)
+        else:
+            self._forget(driver)
+        self._slots.release()
+
+    def _forget(self, driver):
+        with self._lock:
+            self._drivers.discard(driver)
+        self._quit_quietly(driver)
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit_quietly(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"🛠️ 드라이버 종료 중 예외 무시: {type(e).__name__}: {e!r}")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool(driver_factory) -> DriverPool:
+    """
+    프로세스 전체에서 공유하는 크롤링 드라이버 풀을 반환합니다. (최초 호출 시 생성)
+    풀 크기는 config.yaml의 crawler.pool_size로 지정합니다.
+
+    Args:
+        driver_factory (Callable): 새 드라이버를 만드는 함수 (최초 생성 시에만 사용)
+
+    Returns:
+        DriverPool: 드라이버 풀
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                crawler_config = load_config().get("crawler") or {}
+            except Exception:
+                crawler_config = {}
+            _pool = DriverPool(driver_factory, crawler_config.get("pool_size", DEFAULT_DRIVER_POOL_SIZE))
+            # 크롤러 프로세스 종료 시 Chrome 프로세스가 남지 않도록 정리
+            atexit.register(shutdown_driver_pool)
+            logger.info(f"✅ 크롤링 드라이버 풀 생성 (pool_size={_pool.pool_size})")
+        return _pool
+
+
+def shutdown_driver_pool():
+    """
+    공유 드라이버 풀을 종료합니다. (프로세스 종료 시 호출)
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
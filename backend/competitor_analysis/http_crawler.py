@@ -0,0 +1,322 @@
+"""
+브라우저 없이 HTTP로 리뷰를 수집하는 경량 크롤러.
+
+httpx AsyncClient(HTTP/2, 연결 재사용)로 페이지를 받아 selectolax로 파싱합니다.
+호스트별 동시 요청 수와 최소 요청 간격을 지켜 대상 사이트에 부담을 주지 않으며,
+JavaScript 렌더링이 필요한 경우(None 반환)에는 호출 측에서 Chrome 크롤러로 대체합니다.
+
+리뷰 목록은 서버가 HTML 조각으로 주는 리뷰 엔드포인트가 있어야 HTTP로 수집할 수 있습니다.
+.env의 REVIEW_ENDPOINT_URL에 {product_id}, {rating}, {page} 자리표시자를 포함한 URL을 지정합니다.
+"""
+import asyncio
+import atexit
+import os
+import re
+import threading
+import time
+from typing import List
+from urllib.parse import urlparse
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+from backend.competitor_analysis.review_parser import (
+    PRODUCT_ITEM_SELECTOR,
+    PRODUCT_LINK_SELECTOR,
+    REVIEW_ARTICLE_SELECTOR,
+    REVIEW_CONTENT_SELECTOR,
+    build_search_url,
+    clean_review_text,
+    product_url_from_href,
+    review_hash,
+)
+from utils.logger import get_logger
+from utils.config import load_config
+
+logger = get_logger(__name__)
+
+# config.yaml의 crawler 섹션이 없을 때 사용할 기본값
+DEFAULT_HTTP_OPTIONS = {
+    "http_max_connections": 20,
+    # 호스트별 동시 요청 수
+    "http_per_host": 4,
+    # 같은 호스트에 보내는 요청 사이의 최소 간격(초)
+    "http_min_interval": 0.5,
+    "http_timeout": 10,
+}
+# 브라우저 크롤러의 "나쁨", "별로" 필터에 해당하는 별점
+NEGATIVE_RATINGS = [1, 2]
+MAX_REVIEW_PAGES = 10
+# 한 번의 수집 작업(여러 상품)에 대한 최대 대기 시간(초)
+CRAWL_TIMEOUT = 300
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+PRODUCT_ID_PATTERN = re.compile(r"/vp/products/(\d+)")
+
+
+class _HostLimit:
+    """
+    호스트 하나에 대한 동시 요청 수 제한과 요청 간격.
+    """
+
+    def __init__(self, per_host: int):
+        self.semaphore = asyncio.Semaphore(per_host)
+        self.lock = asyncio.Lock()
+        self.last_request = 0.0
+
+
+class HttpCrawler:
+    """
+    전용 이벤트 루프 스레드에서 httpx AsyncClient를 유지하며, 동기 코드에서 호출할 수 있는 HTTP 크롤러.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_HTTP_OPTIONS["http_max_connections"],
+        per_host: int = DEFAULT_HTTP_OPTIONS["http_per_host"],
+        min_interval: float = DEFAULT_HTTP_OPTIONS["http_min_interval"],
+        timeout: float = DEFAULT_HTTP_OPTIONS["http_timeout"]
+    ):
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.timeout = timeout
+
+        self._loop = None
+        self._thread = None
+        self._client: httpx.AsyncClient = None
+        self.http2 = False
+        self._hosts = {}
+        self._stats = {"requests": 0, "failed": 0, "bytes": 0, "fetch_time": 0.0}
+
+    def start(self):
+        """
+        이벤트 루프 스레드를 시작하고 HTTP 클라이언트를 만듭니다.
+        """
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="http-crawler", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(timeout=self.timeout)
+        logger.info(f"✅ HTTP 크롤러 시작 완료: http2={self.http2}, per_host={self.per_host}")
+
+    def stop(self):
+        """
+        HTTP 클라이언트를 닫고 이벤트 루프 스레드를 멈춥니다.
+        """
+        if self._thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result(timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"⚠️ HTTP 크롤러 종료 중 오류: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._thread = None
+        logger.info("✅ HTTP 크롤러 종료 완료")
+
+    def collect_product_links(self, category: str, max_products: int) -> List[str]:
+        """
+        서버 렌더링된 검색 결과에서 상품 상세페이지 링크를 수집합니다.
+
+        Returns:
+            List[str]: 정제된 상품 URL 리스트 (HTML에 상품 목록이 없으면 None → 브라우저 필요)
+        """
+        return self._run(self._collect_product_links(category, max_products))
+
+    def crawl_reviews(self, links: List[str], max_reviews: int, known: dict = None) -> list:
+        """
+        여러 상품의 부정 리뷰를 동시에 수집합니다.
+
+        Args:
+            links (List[str]): 상품 상세페이지 URL 리스트
+            max_reviews (int): 상품별 최대 리뷰 수
+            known (dict, optional): 상품 URL → 이미 저장된 리뷰 해시 (제외하고, 한 페이지가 모두 저장된 리뷰면 다음 별점으로 넘어감)
+
+        Returns:
+            list: 상품 순서대로 List[str] (HTTP로 수집할 수 없는 상품은 None → 브라우저 필요)
+        """
+        async def _crawl_all():
+            return await asyncio.gather(
+                *(self._crawl_link(link, max_reviews, (known or {}).get(link)) for link in links)
+            )
+
+        return self._run(_crawl_all())
+
+    def get_stats(self) -> dict:
+        """
+        요청 수, 실패 수, 받은 바이트, 누적 요청 시간을 반환합니다.
+        """
+        return dict(self._stats)
+
+    def _run(self, coro):
+        if self._thread is None:
+            raise RuntimeError("❌ HTTP 크롤러가 시작되지 않았습니다")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout=CRAWL_TIMEOUT)
+
+    async def _start(self):
+        limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        try:
+            self._client = httpx.AsyncClient(
+                http2=True, limits=limits, timeout=self.timeout, headers=HTTP_HEADERS, follow_redirects=True
+            )
+            self.http2 = True
+        except ImportError:
+            # h2 패키지가 없으면 HTTP/1.1 keep-alive로 동작
+            logger.warning("⚠️ h2 패키지가 없어 HTTP/1.1로 요청합니다")
+            self._client = httpx.AsyncClient(
+                limits=limits, timeout=self.timeout, headers=HTTP_HEADERS, follow_redirects=True
+            )
+
+    async def _fetch(self, url: str) -> str:
+        """
+        호스트별 제한을 지키며 GET 요청을 보냅니다.
+
+        Returns:
+            str: 응답 본문 (200이 아니거나 요청 실패 시 None)
+        """
+        host = urlparse(url).netloc
+        limit = self._hosts.get(host)
+        if limit is None:
+            limit = self._hosts[host] = _HostLimit(self.per_host)
+
+        async with limit.semaphore:
+            async with limit.lock:
+                delay = limit.last_request + self.min_interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                limit.last_request = time.monotonic()
+
+            started = time.monotonic()
+            try:
+                res = await self._client.get(url)
+            except httpx.HTTPError as e:
+                self._stats["failed"] += 1
+                logger.warning(f"⚠️ HTTP 요청 실패: {url}: {type(e).__name__}: {e!r}")
+                return None
+            finally:
+                self._stats["requests"] += 1
+                self._stats["fetch_time"] += time.monotonic() - started
+
+        self._stats["bytes"] += len(res.content)
+        if res.status_code != 200:
+            self._stats["failed"] += 1
+            logger.warning(f"⚠️ HTTP 응답 코드 {res.status_code}: {url}")
+            return None
+        return res.text
+
+    async def _collect_product_links(self, category: str, max_products: int) -> List[str]:
+        html = await self._fetch(build_search_url(category))
+        if html is None:
+            return None
+        product_links = []
+        for item in LexborHTMLParser(html).css(PRODUCT_ITEM_SELECTOR):
+            a_tag = item.css_first(PRODUCT_LINK_SELECTOR)
+            if a_tag is not None and a_tag.attributes.get("href"):
+                product_links.append(product_url_from_href(a_tag.attributes["href"]))
+            if len(product_links) >= max_products:
+                break
+        return product_links or None
+
+    async def _crawl_link(self, url: str, max_reviews: int, known: set = None) -> List[str]:
+        endpoint = os.environ.get("REVIEW_ENDPOINT_URL")
+        match = PRODUCT_ID_PATTERN.search(url)
+        if not endpoint or match is None:
+            # 리뷰 필터/페이지 이동은 JavaScript로 동작하므로 브라우저가 필요
+            return None
+
+        reviews = []
+        seen = set(known or ())
+        for rating in NEGATIVE_RATINGS:
+            for page in range(1, MAX_REVIEW_PAGES + 1):
+                html = await self._fetch(endpoint.format(product_id=match.group(1), rating=rating, page=page))
+                if html is None:
+                    # 첫 요청부터 막히면 브라우저로 대체, 중간에 실패하면 지금까지 수집한 리뷰 사용
+                    return reviews or None
+                page_reviews = parse_reviews(html)
+                if not page_reviews:
+                    break
+                page_new = 0
+                for text in page_reviews:
+                    key = review_hash(text)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    reviews.append(text)
+                    page_new += 1
+                    if len(reviews) >= max_reviews:
+                        return reviews
+                if page_new == 0:
+                    # 이미 수집/저장된 리뷰만 있는 페이지부터는 더 넘기지 않음
+                    break
+        return reviews
+
+
+def parse_reviews(html: str) -> List[str]:
+    """
+    리뷰 목록 HTML에서 리뷰 본문을 추출합니다.
+
+    Args:
+        html (str): 상품 페이지 또는 리뷰 목록 HTML 조각
+
+    Returns:
+        List[str]: 정제된 리뷰 본문 리스트
+    """
+    reviews = []
+    tree = LexborHTMLParser(html)
+    # 리뷰 엔드포인트는 컨테이너 없이 article 목록만 줄 수 있으므로 article 선택자로도 확인
+    articles = tree.css(REVIEW_ARTICLE_SELECTOR) or tree.css("article")
+    for article in articles:
+        content = article.css_first(REVIEW_CONTENT_SELECTOR)
+        if content is not None:
+            text = clean_review_text(content.text(strip=True))
+            if text:
+                reviews.append(text)
+    return reviews
+
+
+_crawler = None
+_crawler_lock = threading.Lock()
+
+
+def get_http_crawler() -> HttpCrawler:
+    """
+    프로세스 전체에서 공유하는 HTTP 크롤러를 반환합니다. (최초 호출 시 시작)
+    연결 수와 호스트별 제한은 config.yaml의 crawler 섹션으로 지정합니다.
+
+    Returns:
+        HttpCrawler: 실행 중인 HTTP 크롤러
+    """
+    global _crawler
+    with _crawler_lock:
+        if _crawler is None:
+            try:
+                crawler_config = load_config().get("crawler") or {}
+            except Exception:
+                crawler_config = {}
+            options = {name: crawler_config.get(name, default) for name, default in DEFAULT_HTTP_OPTIONS.items()}
+            crawler = HttpCrawler(
+                max_connections=options["http_max_connections"],
+                per_host=options["http_per_host"],
+                min_interval=options["http_min_interval"],
+                timeout=options["http_timeout"]
+            )
+            crawler.start()
+            _crawler = crawler
+            atexit.register(shutdown_http_crawler)
+        return _crawler
+
+
+def shutdown_http_crawler():
+    """
+    공유 HTTP 크롤러가 실행 중이면 종료합니다.
+    """
+    global _crawler
+    with _crawler_lock:
+        if _crawler is not None:
+            _crawler.stop()
+            _crawler = None
@@ -22,7 +22,7 @@ def load_summary_json_and_insert_to_db(summary_json_path="sample_review_summary.
         summary_dict = json.load(f)
 
     for category, review_summary in summary_dict.items():
-        insert_review_summary(
+        saved = insert_review_summary(
             host=db_config["host"],
             user=db_config["user"],
             password=db_config["password"],
@@ -31,7 +31,10 @@ def load_summary_json_and_insert_to_db(summary_json_path="sample_review_summary.
             review_summary=review_summary,
             num_reviews=0  # 데모용이므로 0으로 설정
         )
-        print(f"✅ DB 삽입 완료: {category}")
+        if saved:
+            print(f"✅ DB 삽입 완료: {category}")
+        else:
+            print(f"❌ DB 삽입 실패: {category}")
 
 if __name__ == "__main__":
     load_summary_json_and_insert_to_db()
\ No newline at end of file
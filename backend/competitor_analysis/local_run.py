@@ -1,12 +1,11 @@
 import threading
 import time
 from datetime import datetime
-import pymysql
 
-from backend.competitor_analysis.crawler import crawl_reviews_by_category
-from backend.competitor_analysis.differentiator import summarize_competitor_reviews
-from backend.competitor_analysis.competitor_db import insert_review_summary
-from backend.competitor_analysis.crawl_signal_server import poll_and_process_signal
+from backend.competitor_analysis.crawl_signal_server import start_signal_workers
+from backend.competitor_analysis.db_pool import db_connection, get_db_pool
+from backend.competitor_analysis.review_refresh import refresh_category_summary
+from backend.competitor_analysis.summary_notifier import SUMMARY_EMPTY, publish_summary_event
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -26,31 +25,21 @@ def get_categories_with_last_time(host, user, password, db):
         list of tuple: [(category(str), last_crawled_at(datetime)), ...]
     """
     logger.debug("🛠️ 카테고리별 최신 크롤링 시간 조회 시작")
-    conn = pymysql.connect(
-        host=host,
-        user=user,
-        password=password,
-        db=db,
-        port=3306,
-        charset='utf8mb4'
-    )
     try:
-        with conn.cursor() as cursor:
-            sql = """
-                SELECT category, MAX(crawled_at) as last_crawled_at
-                FROM competitor_review_summary
-                GROUP BY category
-            """
-            cursor.execute(sql)
-            results = cursor.fetchall()
-            logger.debug(f"🛠️ 카테고리별 조회 결과: {results}")
-            return results
+        with db_connection(host, user, password, db) as conn:
+            with conn.cursor() as cursor:
+                sql = """
+                    SELECT category, MAX(crawled_at) as last_crawled_at
+                    FROM competitor_review_summary
+                    GROUP BY category
+                """
+                cursor.execute(sql)
+                results = cursor.fetchall()
+        logger.debug(f"🛠️ 카테고리별 조회 결과: {results}")
+        return results
     except Exception as e:
         logger.error(f"❌ 카테고리별 최신 크롤링 시간 조회 실패: {type(e).__name__}: {e!r}")
         return []
-    finally:
-        conn.close()
-        logger.debug("🛠️ DB 연결 종료")
 
 def auto_crawl_loop(
     db_config,
@@ -59,7 +48,7 @@ def auto_crawl_loop(
 ):
     """
     competitor_review_summary 테이블에 저장된
-    모든 카테고리별로 주기적으로 크롤링/요약/DB 저장을 수행합니다.
+    모든 카테고리별로 주기적으로 새 리뷰만 크롤링해 기존 요약본에 반영합니다.
     (카테고리별 마지막 저장 시점 이후 interval(초) 이상 경과한 경우만 처리)
 
     Args:
@@ -94,30 +83,28 @@ def auto_crawl_loop(
                 continue
 
             try:
-                logger.debug(f"🛠️ {category} 크롤링 시도")
-                reviews = crawl_reviews_by_category(
-                    category,
+                logger.debug(f"🛠️ {category} 새 리뷰 크롤링 및 요약 갱신 시도")
+                status = refresh_category_summary(
+                    db_config["host"], db_config["user"], db_config["password"], db_config["db"],
+                    category, openai_api_key,
                     max_products=3,
                     max_reviews_per_product=10
                 )
-                if not reviews:
+                if status == SUMMARY_EMPTY:
                     logger.warning(f"⚠️ 리뷰 없음: {category}")
                     continue
-                logger.debug(f"🛠️ {category} 리뷰 요약 시도")
-                summary = summarize_competitor_reviews(reviews, openai_api_key)
-                logger.debug(f"🛠️ {category} DB 저장 시도")
-                insert_review_summary(
-                    host=db_config["host"],
-                    user=db_config["user"],
-                    password=db_config["password"],
-                    db=db_config["db"],
-                    category=category,
-                    review_summary=summary,
-                    num_reviews=len(reviews)
+                publish_summary_event(
+                    db_config["host"], db_config["user"], db_config["password"], db_config["db"], category
                 )
                 logger.info(f"✅ 자동 크롤링+요약+DB저장 완료: {category}")
             except Exception as e:
                 logger.error(f"❌ 자동 크롤링/요약/저장 실패: {category}, {type(e).__name__}: {e!r}")
+        pool_stats = get_db_pool(db_config["host"], db_config["user"], db_config["password"], db_config["db"]).get_stats()
+        logger.debug(
+            f"🛠️ DB 연결 풀: opened={pool_stats['opened']}, created={pool_stats['created']}, "
+            f"checkouts={pool_stats['checkouts']}, wait_avg={pool_stats['wait_avg'] * 1000:.1f}ms, "
+            f"wait_max={pool_stats['wait_max'] * 1000:.1f}ms"
+        )
         logger.info(f"🛠️ 모든 카테고리 완료, 60초 대기")
         time.sleep(60)
 
@@ -125,16 +112,18 @@ def start_local_crawler(
     db_config,
     openai_api_key,
     auto_crawl_interval=1800,
-    signal_poll_interval=10
+    signal_poll_interval=10,
+    signal_workers=2
 ):
     """
-    자동 크롤링 루프 및 신호 polling/처리 루프를 각각 스레드로 실행합니다.
+    자동 크롤링 루프와 신호 처리 워커들을 각각 스레드로 실행합니다.
 
     Args:
         db_config (dict): DB 연결 정보
         openai_api_key (str): OpenAI API 키
         auto_crawl_interval (int): 카테고리별 자동 크롤링 간격(초)
         signal_poll_interval (int): 신호 polling 간격(초)
+        signal_workers (int): 신호를 병렬로 처리할 워커 수
     """
     logger.debug("🛠️ 자동 크롤링 스레드 시작")
     t1 = threading.Thread(
@@ -144,20 +133,16 @@ def start_local_crawler(
     )
     t1.start()
 
-    logger.debug("🛠️ 신호 polling 스레드 시작")
-    t2 = threading.Thread(
-        target=poll_and_process_signal,
-        args=(
-            db_config["host"],
-            db_config["user"],
-            db_config["password"],
-            db_config["db"],
-            openai_api_key,
-            signal_poll_interval
-        ),
-        daemon=True
+    logger.debug(f"🛠️ 신호 처리 워커 {signal_workers}개 시작")
+    start_signal_workers(
+        db_config["host"],
+        db_config["user"],
+        db_config["password"],
+        db_config["db"],
+        openai_api_key,
+        num_workers=signal_workers,
+        interval=signal_poll_interval
     )
-    t2.start()
 
     logger.info("✅ 자동 크롤링/신호 polling 스레드 모두 시작")
     while True:
@@ -178,7 +163,8 @@ if __name__ == "__main__":
             db_config=db_config,
             openai_api_key=openai_api_key,
             auto_crawl_interval=86400,   # 24시간마다 자동 저장
-            signal_poll_interval=5       # 5초마다 polling
+            signal_poll_interval=5,      # 5초마다 polling
+            signal_workers=2             # 신호 병렬 처리 워커 수
         )
         logger.info("✅ main 실행 성공")
     except Exception as e:
@@ -0,0 +1,84 @@
+import hashlib
+import os
+import re
+from urllib.parse import quote
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 브라우저 크롤러와 HTTP 크롤러가 공유하는 선택자
+REVIEW_ARTICLE_SELECTOR = "div.js_reviewArticleListContainer article"
+REVIEW_CONTENT_SELECTOR = "div.sdp-review__article__list__review__content span"
+REVIEW_FILTER_SELECTOR = "div.review-star-search-current-selection"
+PRODUCT_ITEM_SELECTOR = 'ul#product-list li[class^="ProductUnit_productUnit__"]'
+PRODUCT_LINK_SELECTOR = 'a[href^="/vp/products/"]'
+
+
+def clean_product_url(url: str, pattern: str = r"https://.+?/vp/products/\d+") -> str:
+    """
+    상품 상세 URL을 정제해 표준 형태로 반환합니다.
+
+    Args:
+        url (str): 원본 상품 링크.
+        pattern (str): 추출 정규표현식 (기본: 제품 상세 링크 형식).
+
+    Returns:
+        str: 정제된 상품 상세페이지 URL.
+    """
+    match = re.search(pattern, url)
+    result = match.group(0) if match else url
+    logger.debug(f"🛠️ 정제된 링크: {result}")
+    return result
+
+
+def clean_review_text(text: str) -> str:
+    """
+    리뷰 본문에서 이모지/특수문자를 제거합니다.
+
+    Args:
+        text (str): 리뷰 본문 원문.
+
+    Returns:
+        str: 정제된 리뷰 본문 (빈 문자열일 수 있음).
+    """
+    return re.sub(r"[^\w\s가-힣.,!?]", "", text.strip())
+
+
+def review_hash(text: str) -> str:
+    """
+    리뷰 중복 제거에 사용할 해시를 만듭니다. (공백 차이는 무시)
+
+    Args:
+        text (str): 정제된 리뷰 본문.
+
+    Returns:
+        str: sha1 해시 문자열.
+    """
+    return hashlib.sha1(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def get_base_search_url() -> str:
+    """
+    검색 페이지 기본 URL을 반환합니다. (.env의 BASE_SEARCH_URL)
+    """
+    return os.environ.get("BASE_SEARCH_URL", "https://example.com/np/search")
+
+
+def build_search_url(category: str) -> str:
+    """
+    카테고리 검색 결과 페이지 URL을 만듭니다.
+
+    Args:
+        category (str): 검색 키워드.
+
+    Returns:
+        str: 검색 결과 페이지 URL.
+    """
+    return f"{get_base_search_url()}?q={quote(category)}&sorter=scoreDesc"
+
+
+def product_url_from_href(href: str) -> str:
+    """
+    검색 결과의 상대 링크(/vp/products/...)를 정제된 상품 상세페이지 URL로 바꿉니다.
+    """
+    return clean_product_url(get_base_search_url().split("/np/")[0] + href)
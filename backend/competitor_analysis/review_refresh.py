@@ -0,0 +1,125 @@
+"""
+카테고리 리뷰 요약본 증분 갱신.
+
+원본 리뷰는 competitor_reviews 테이블에 (category, product_url, review_hash) 기준으로 중복 없이 저장합니다.
+(다른 상품의 같은 짧은 리뷰는 각각 저장되어 요약에 반영됩니다)
+갱신할 때는 상품별로 저장된 해시를 크롤러에 넘겨 새 리뷰만 수집하고, 새 리뷰만 기존 요약본에 반영합니다.
+원본 리뷰와 요약본은 한 트랜잭션으로 저장해, 요약본에 반영되지 않은 리뷰가 저장된 것으로 남지 않게 합니다.
+- 새 리뷰가 없으면 GPT를 호출하지 않고 요약본 확인 시각만 갱신
+- 저장된 원본 리뷰가 없는 카테고리(최초 수집, 시드 요약본)는 새 리뷰로 처음부터 요약
+- 요약 토큰 예산에 들어가지 않는 새 리뷰는 저장하지 않고 다음 갱신에서 다시 수집
+"""
+from backend.competitor_analysis.crawler import crawl_product_reviews_by_category
+from backend.competitor_analysis.differentiator import (
+    merge_review_summary,
+    select_summary_reviews,
+    summarize_competitor_reviews,
+)
+from backend.competitor_analysis.competitor_db import (
+    get_latest_review_summary,
+    get_stored_review_hashes,
+    insert_reviews_with_summary,
+    touch_review_summary,
+)
+from backend.competitor_analysis.summary_notifier import SUMMARY_EMPTY, SUMMARY_READY
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def refresh_category_summary(
+    host: str,
+    user: str,
+    password: str,
+    db: str,
+    category: str,
+    openai_api_key: str,
+    max_products: int = 3,
+    max_reviews_per_product: int = 10,
+    on_crawled=None
+) -> str:
+    """
+    카테고리의 새 리뷰만 크롤링/저장하고, 기존 요약본에 반영합니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+        category (str): 상품 카테고리명
+        openai_api_key (str): OpenAI API 키
+        max_products (int): 최대 상품 개수
+        max_reviews_per_product (int): 상품별 최대 새 리뷰 수
+        on_crawled (Callable, optional): 크롤링이 끝난 뒤 호출할 함수 (작업 점유 연장 등)
+
+    Returns:
+        str: SUMMARY_READY(요약본 있음) 또는 SUMMARY_EMPTY(수집된 리뷰와 요약본 모두 없음)
+
+    Raises:
+        RuntimeError: 요약 생성에 실패한 경우 (새 리뷰는 저장하지 않으므로 다음 갱신에서 다시 수집)
+        Exception: 원본 리뷰/요약본 저장에 실패한 경우 (둘 다 저장되지 않으므로 다음 갱신에서 다시 수집)
+    """
+    known = get_stored_review_hashes(host, user, password, db, category)
+    num_stored = sum(len(hashes) for hashes in known.values())
+    product_reviews = crawl_product_reviews_by_category(
+        category,
+        max_products=max_products,
+        max_reviews_per_product=max_reviews_per_product,
+        known=known
+    )
+    new_reviews = [review for _, reviews in product_reviews for review in reviews]
+    logger.info(f"✅ 크롤링 완료: '{category}' 새 리뷰 {len(new_reviews)}개 (저장된 리뷰 {num_stored}개)")
+    if on_crawled is not None:
+        on_crawled()
+
+    existing = get_latest_review_summary(host, user, password, db, category, use_cache=False)
+    if not new_reviews:
+        if existing is None:
+            logger.warning(f"⚠️ 수집된 리뷰와 요약본이 모두 없음: '{category}'")
+            return SUMMARY_EMPTY
+        touch_review_summary(host, user, password, db, category)
+        logger.info(f"✅ 새 리뷰 없음, 기존 요약본 유지: '{category}'")
+        return SUMMARY_READY
+
+    merging = bool(existing and known)
+    selected = select_summary_reviews(new_reviews, existing if merging else None)
+    if len(selected) < len(new_reviews):
+        product_reviews = _take_reviews(product_reviews, len(selected))
+    if merging:
+        summary = merge_review_summary(existing, selected, openai_api_key)
+    else:
+        summary = summarize_competitor_reviews(selected, openai_api_key)
+    if not summary:
+        raise RuntimeError(f"리뷰 요약 생성 실패: '{category}'")
+
+    insert_reviews_with_summary(
+        host=host,
+        user=user,
+        password=password,
+        db=db,
+        category=category,
+        product_reviews=product_reviews,
+        review_summary=summary,
+        num_stored=num_stored
+    )
+    return SUMMARY_READY
+
+
+def _take_reviews(product_reviews: list, count: int) -> list:
+    """
+    상품별 리뷰 목록에서 앞쪽 리뷰 count개만 남깁니다. (select_summary_reviews가 고른 리뷰와 같은 순서)
+
+    Args:
+        product_reviews (list): (상품 URL, 리뷰 리스트) 튜플 리스트
+        count (int): 남길 리뷰 수
+
+    Returns:
+        list: 리뷰가 남은 상품만 담은 (상품 URL, 리뷰 리스트) 튜플 리스트
+    """
+    taken = []
+    for product_url, reviews in product_reviews:
+        if count <= 0:
+            break
+        taken.append((product_url, reviews[:count]))
+        count -= len(reviews[:count])
+    return taken
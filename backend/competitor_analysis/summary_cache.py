@@ -0,0 +1,224 @@
+"""
+카테고리별 리뷰 요약본 프로세스 내 캐시.
+
+요약본은 크롤러가 실행될 때만 바뀌므로 요청 경로에서는 캐시로 응답합니다.
+- competitor_review_summary.version이 바뀌면(다른 프로세스의 저장 포함) 백그라운드 watcher가 새 요약본으로 교체
+- 최근 조회된 카테고리는 watcher가 만료 시간을 연장해 요청 경로에서 MySQL을 조회하지 않음
+- 요약본이 없는 카테고리는 짧게만 캐시 (negative cache)
+"""
+import threading
+import time
+from cachetools import TTLCache
+from backend.competitor_analysis.db_pool import db_connection
+from utils.logger import get_logger
+from utils.config import load_config
+
+logger = get_logger(__name__)
+
+# config.yaml의 summary_cache 섹션이 없을 때 사용할 기본값
+DEFAULT_CACHE_OPTIONS = {
+    "maxsize": 256,
+    "ttl": 3600,
+    "negative_ttl": 10,
+    "watch_interval": 30,
+}
+
+
+class SummaryCache:
+    """
+    카테고리 → (요약본, version) TTL 캐시와 요약본이 없는 카테고리의 negative 캐시.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        user: str,
+        password: str,
+        db: str,
+        maxsize: int = DEFAULT_CACHE_OPTIONS["maxsize"],
+        ttl: float = DEFAULT_CACHE_OPTIONS["ttl"],
+        negative_ttl: float = DEFAULT_CACHE_OPTIONS["negative_ttl"],
+        watch_interval: float = DEFAULT_CACHE_OPTIONS["watch_interval"]
+    ):
+        self._db_args = (host, user, password, db)
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._missing = TTLCache(maxsize=maxsize, ttl=negative_ttl)
+        # 마지막 watcher 실행 이후 조회된 카테고리 (만료 시간 연장 대상)
+        self._touched = set()
+        # invalidate() 이후 캐시할 수 있는 최소 version (저장 이전에 읽은 요약본이 늦게 put되는 것을 막음)
+        # 캐시되거나 watcher가 DB에서 확인한 version이 이 값에 도달하면 제거
+        self._min_versions = {}
+        self._lock = threading.Lock()
+        self.watch_interval = watch_interval
+        self._watcher = None
+        self._stats = {"hits": 0, "negative_hits": 0, "misses": 0, "refreshed": 0}
+
+    def get(self, category: str) -> tuple:
+        """
+        캐시된 요약본을 조회합니다.
+
+        Args:
+            category (str): 상품 카테고리명
+
+        Returns:
+            tuple: (캐시 여부, 요약본). 요약본이 없는 것으로 캐시된 경우 (True, None)
+        """
+        self._ensure_watcher()
+        with self._lock:
+            entry = self._entries.get(category)
+            if entry is not None:
+                self._stats["hits"] += 1
+                self._touched.add(category)
+                return True, entry[0]
+            if category in self._missing:
+                self._stats["negative_hits"] += 1
+                return True, None
+            self._stats["misses"] += 1
+            return False, None
+
+    def put(self, category: str, summary: str, version: int):
+        """
+        DB에서 읽은 요약본을 캐시합니다. 요약본이 없으면(None) negative 캐시에 기록합니다.
+        invalidate()로 기록된 최소 version보다 오래된 요약본(또는 요약본 없음)은 캐시하지 않습니다.
+
+        Args:
+            category (str): 상품 카테고리명
+            summary (str): 요약본 (없으면 None)
+            version (int): competitor_review_summary.version
+        """
+        with self._lock:
+            min_version = self._min_versions.get(category)
+            if min_version is not None and (summary is None or version < min_version):
+                logger.debug(f"🛠️ 오래된 요약본 캐시 무시: category={category}, version={version} < {min_version}")
+                return
+            if summary is None:
+                self._entries.pop(category, None)
+                self._missing[category] = True
+                return
+            current = self._entries.get(category)
+            # 더 최신 version이 이미 캐시되어 있으면 덮어쓰지 않음
+            if current is None or version >= current[1]:
+                self._entries[category] = (summary, version)
+            self._missing.pop(category, None)
+            # 최소 version 이상이 캐시되었으므로 이후에는 위의 version 비교로 충분
+            self._min_versions.pop(category, None)
+
+    def invalidate(self, category: str, min_version: int = None):
+        """
+        카테고리 캐시를 지웁니다. (같은 프로세스에서 요약본을 저장했을 때)
+
+        Args:
+            category (str): 상품 카테고리명
+            min_version (int, optional): 저장된 요약본의 version. 이후 이보다 오래된 요약본은 put()해도 캐시하지 않음
+        """
+        with self._lock:
+            self._entries.pop(category, None)
+            self._missing.pop(category, None)
+            if min_version is not None:
+                self._min_versions[category] = max(min_version, self._min_versions.get(category, min_version))
+
+    def get_stats(self) -> dict:
+        """
+        캐시 적중/미스 통계를 반환합니다.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+            stats["negative_size"] = len(self._missing)
+        return stats
+
+    def _ensure_watcher(self):
+        if self._watcher is not None:
+            return
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch, name="summary-cache-watcher", daemon=True)
+                self._watcher.start()
+
+    def _watch(self):
+        logger.debug(f"🛠️ 요약본 캐시 watcher 시작 (interval={self.watch_interval}s)")
+        while True:
+            time.sleep(self.watch_interval)
+            try:
+                self._sync_versions()
+            except Exception as e:
+                logger.warning(f"⚠️ 요약본 캐시 version 확인 실패: {type(e).__name__}: {e!r}")
+
+    def _sync_versions(self):
+        """
+        DB의 카테고리별 version과 비교해 바뀐 요약본은 다시 읽고, 최근 조회된 항목은 만료 시간을 연장합니다.
+        """
+        with db_connection(*self._db_args) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT category, version FROM competitor_review_summary")
+                versions = dict(cur.fetchall())
+
+        with self._lock:
+            cached = {category: entry for category, entry in self._entries.items()}
+            touched, self._touched = self._touched, set()
+            # 요약본이 새로 생긴 카테고리는 negative 캐시에서 제거
+            for category in [category for category in self._missing if category in versions]:
+                self._missing.pop(category, None)
+            # DB가 이미 최소 version에 도달한 카테고리는 기록을 제거해 카테고리 수만큼 쌓이지 않게 함
+            for category in [
+                category for category, min_version in self._min_versions.items()
+                if versions.get(category, -1) >= min_version
+            ]:
+                self._min_versions.pop(category, None)
+
+        changed = [category for category, (_, version) in cached.items() if versions.get(category) != version]
+        if changed:
+            placeholders = ", ".join(["%s"] * len(changed))
+            with db_connection(*self._db_args) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"SELECT category, review_summary, version FROM competitor_review_summary WHERE category IN ({placeholders})",
+                        changed
+                    )
+                    rows = {category: (summary, version) for category, summary, version in cur.fetchall()}
+            with self._lock:
+                for category in changed:
+                    if category in rows:
+                        self._entries[category] = rows[category]
+                    else:
+                        self._entries.pop(category, None)
+                self._stats["refreshed"] += len(changed)
+            logger.info(f"✅ 요약본 캐시 갱신: {changed}")
+
+        with self._lock:
+            # 최근 조회된 항목은 다시 넣어 만료 시간 연장
+            for category in touched - set(changed):
+                entry = self._entries.get(category)
+                if entry is not None:
+                    self._entries[category] = entry
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_summary_cache(host: str, user: str, password: str, db: str) -> SummaryCache:
+    """
+    접속 정보별로 프로세스 전체에서 공유하는 요약본 캐시를 반환합니다.
+    크기와 TTL은 config.yaml의 summary_cache 섹션으로 지정합니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+
+    Returns:
+        SummaryCache: 요약본 캐시
+    """
+    key = (host, user, password, db)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            try:
+                cache_config = load_config().get("summary_cache") or {}
+            except Exception:
+                cache_config = {}
+            options = {name: cache_config.get(name, default) for name, default in DEFAULT_CACHE_OPTIONS.items()}
+            cache = _caches[key] = SummaryCache(host, user, password, db, **options)
+        return cache
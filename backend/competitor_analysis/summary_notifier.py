@@ -0,0 +1,272 @@
+"""
+리뷰 요약본 생성 완료 알림 (카테고리 단위 pub/sub).
+
+크롤링 워커가 요약본을 저장한 뒤 publish하면, 같은 카테고리를 기다리는 요청들이 즉시 깨어납니다.
+같은 카테고리를 기다리는 요청들은 하나의 구독(Future)을 공유합니다.
+
+- InProcessBroker: 같은 프로세스 안에서만 전달 (테스트 또는 워커를 같은 프로세스에서 실행할 때)
+- DbNotificationBroker: competitor_summary_event 테이블을 통해 다른 프로세스(local_run.py)의 알림을 전달.
+  대기 중인 요청이 있을 때만 프로세스당 하나의 poller가 새 이벤트를 조회합니다.
+"""
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from backend.competitor_analysis.db_pool import db_connection, run_in_db_executor
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SUMMARY_READY = "ready"
+SUMMARY_EMPTY = "empty"
+DEFAULT_NOTIFY_POLL_INTERVAL = 1.0
+# 이 기간(일)이 지난 알림 이벤트는 publish 시 정리
+EVENT_RETENTION_DAYS = 1
+
+
+class _Channel:
+    """
+    한 이벤트 루프에서 한 카테고리를 기다리는 요청들이 공유하는 Future.
+    since_id는 구독 시점의 마지막 이벤트 id로, 이 id 이하의 (구독 이전에 발행된) 이벤트는 전달하지 않습니다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, since_id: int = 0):
+        self.loop = loop
+        self.since_id = since_id
+        self.future = loop.create_future()
+        self.refs = 0
+
+
+class Subscription:
+    """
+    subscribe()가 반환하는 구독. wait()로 알림을 기다립니다.
+    """
+
+    def __init__(self, category: str, channel: _Channel):
+        self.category = category
+        self._channel = channel
+
+    async def wait(self, timeout: float) -> str:
+        """
+        알림이 올 때까지 기다립니다.
+
+        Args:
+            timeout (float): 최대 대기 시간(초)
+
+        Returns:
+            str: SUMMARY_READY 또는 SUMMARY_EMPTY (시간 초과 시 None)
+        """
+        try:
+            # 공유 Future가 취소되지 않도록 shield
+            return await asyncio.wait_for(asyncio.shield(self._channel.future), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InProcessBroker:
+    """
+    프로세스 내부 pub/sub. publish()는 어느 스레드에서 호출해도 됩니다.
+    """
+
+    def __init__(self):
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def subscribe(self, category: str):
+        """
+        카테고리 알림을 구독합니다. 구독한 뒤에 DB를 다시 확인하고 wait()해야 알림을 놓치지 않습니다.
+
+        Args:
+            category (str): 상품 카테고리명
+
+        Yields:
+            Subscription: 구독
+        """
+        loop = asyncio.get_running_loop()
+        since_id = await self._on_subscribe()
+        # 구독 시점(since_id)이 같은 요청끼리만 Future를 공유
+        key = (id(loop), category, since_id)
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = self._channels[key] = _Channel(loop, since_id)
+            channel.refs += 1
+        try:
+            yield Subscription(category, channel)
+        finally:
+            with self._lock:
+                channel.refs -= 1
+                if channel.refs == 0 and self._channels.get(key) is channel:
+                    del self._channels[key]
+
+    def publish(self, category: str, status: str = SUMMARY_READY):
+        """
+        카테고리를 기다리는 모든 요청을 깨웁니다.
+
+        Args:
+            category (str): 상품 카테고리명
+            status (str): SUMMARY_READY 또는 SUMMARY_EMPTY
+        """
+        self._notify_local(category, status)
+
+    async def _on_subscribe(self) -> int:
+        """
+        구독 직전에 호출되어 구독 시점의 마지막 이벤트 id를 반환합니다. (프로세스 내 알림은 항상 0)
+        """
+        return 0
+
+    def _notify_local(self, category: str, status: str, event_id: int = None):
+        """
+        카테고리를 기다리는 채널을 깨웁니다. event_id가 주어지면 그 이후에 구독한 채널은 건너뜁니다.
+        """
+        with self._lock:
+            keys = [
+                key for key, channel in self._channels.items()
+                if key[1] == category and (event_id is None or event_id > channel.since_id)
+            ]
+            # 알림을 받은 채널은 떼어내고, 이후 구독자는 새 Future를 받음
+            channels = [self._channels.pop(key) for key in keys]
+        for channel in channels:
+            channel.loop.call_soon_threadsafe(_set_result, channel.future, status)
+        if channels:
+            logger.debug(f"🛠️ 요약본 알림 전달: {category} ({status}), 대기 그룹 {len(channels)}개")
+
+
+def _set_result(future: asyncio.Future, status: str):
+    if not future.done():
+        future.set_result(status)
+
+
+class DbNotificationBroker(InProcessBroker):
+    """
+    competitor_summary_event 테이블을 통한 프로세스 간 알림.
+    구독자가 있는 동안 프로세스당 하나의 poller가 poll_interval마다 새 이벤트를 한 번에 조회합니다.
+    """
+
+    def __init__(self, host: str, user: str, password: str, db: str, poll_interval: float = DEFAULT_NOTIFY_POLL_INTERVAL):
+        super().__init__()
+        self._db_args = (host, user, password, db)
+        self.poll_interval = poll_interval
+        self._pollers = {}
+        self._last_ids = {}
+
+    def publish(self, category: str, status: str = SUMMARY_READY):
+        """
+        알림 이벤트를 DB에 기록하고, 같은 프로세스의 대기 요청도 바로 깨웁니다.
+        """
+        try:
+            with db_connection(*self._db_args) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "INSERT INTO competitor_summary_event (category, status, created_at) VALUES (%s, %s, NOW())",
+                        (category, status)
+                    )
+                    cur.execute(
+                        "DELETE FROM competitor_summary_event WHERE created_at < NOW() - INTERVAL %s DAY",
+                        (EVENT_RETENTION_DAYS,)
+                    )
+            logger.info(f"✅ 요약본 알림 발행: {category} ({status})")
+        except Exception as e:
+            logger.error(f"❌ 요약본 알림 발행 실패: {type(e).__name__}: {e!r}")
+        self._notify_local(category, status)
+
+    async def _on_subscribe(self) -> int:
+        loop = asyncio.get_running_loop()
+        # 구독 이전의 이벤트는 무시하도록 구독 시점의 마지막 id를 읽음 (이미 실행 중인 poller에 합류할 때도 적용)
+        # (구독 → DB 재확인 → 대기 순서이므로 그 사이 이벤트는 놓치지 않음)
+        since_id = await run_in_db_executor(self._fetch_last_id)
+        # 기다리는 동안 다른 구독이 poller를 시작했다면 그 poller를 그대로 사용
+        poller = self._pollers.get(loop)
+        if poller is None or poller.done():
+            self._last_ids[loop] = since_id
+            self._pollers[loop] = loop.create_task(self._poll(loop))
+        return since_id
+
+    def _fetch_last_id(self) -> int:
+        with db_connection(*self._db_args) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COALESCE(MAX(id), 0) FROM competitor_summary_event")
+                return cur.fetchone()[0]
+
+    def _fetch_events(self, last_id: int) -> list:
+        with db_connection(*self._db_args) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT id, category, status FROM competitor_summary_event WHERE id > %s ORDER BY id",
+                    (last_id,)
+                )
+                return cur.fetchall()
+
+    async def _poll(self, loop: asyncio.AbstractEventLoop):
+        logger.debug("🛠️ 요약본 알림 poller 시작")
+        try:
+            while self._has_loop_waiters(loop):
+                await asyncio.sleep(self.poll_interval)
+                try:
+                    events = await run_in_db_executor(self._fetch_events, self._last_ids[loop])
+                except Exception as e:
+                    logger.warning(f"⚠️ 요약본 알림 조회 실패: {type(e).__name__}: {e!r}")
+                    continue
+                for event_id, category, status in events:
+                    self._last_ids[loop] = max(self._last_ids[loop], event_id)
+                    self._notify_local(category, status, event_id)
+        finally:
+            self._pollers.pop(loop, None)
+            logger.debug("🛠️ 대기 요청이 없어 요약본 알림 poller 종료")
+
+    def _has_loop_waiters(self, loop: asyncio.AbstractEventLoop) -> bool:
+        with self._lock:
+            return any(channel.loop is loop for channel in self._channels.values())
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_summary_broker() -> InProcessBroker:
+    """
+    프로세스 전체에서 공유하는 요약본 알림 broker를 반환합니다. (기본값: DB 알림 broker)
+
+    Returns:
+        InProcessBroker: 알림 broker
+    """
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            from utils.config import get_db_config
+            db_config = get_db_config()
+            _broker = DbNotificationBroker(
+                db_config["host"], db_config["user"], db_config["password"], db_config["db"]
+            )
+        return _broker
+
+
+def set_summary_broker(broker: InProcessBroker):
+    """
+    공유 broker를 교체합니다. (테스트에서 InProcessBroker를 주입할 때 사용)
+
+    Args:
+        broker (InProcessBroker): 사용할 broker (None이면 다음 호출 시 기본 broker 생성)
+    """
+    global _broker
+    with _broker_lock:
+        _broker = broker
+
+
+def publish_summary_event(host: str, user: str, password: str, db: str, category: str, status: str = SUMMARY_READY):
+    """
+    크롤링 워커에서 요약본 처리 완료를 알립니다.
+
+    Args:
+        host (str): DB 호스트 주소
+        user (str): DB 사용자명
+        password (str): DB 비밀번호
+        db (str): 데이터베이스명
+        category (str): 상품 카테고리명
+        status (str): SUMMARY_READY(요약본 저장) 또는 SUMMARY_EMPTY(수집된 리뷰 없음)
+    """
+    with _broker_lock:
+        broker = _broker
+    if broker is None:
+        broker = DbNotificationBroker(host, user, password, db)
+    broker.publish(category, status)
@@ -102,12 +102,19 @@ class InputHandler:
                 'input': product_data
             }
             
-            logger.debug(f"🛠️ 설정 구조 생성 완료: {len(config)} 섹션")
-            
             # config.yaml 파일 경로
             config_path = os.path.join(self.project_root, "config.yaml")
             logger.debug(f"🛠️ 설정 파일 경로: {config_path}")
             
+            # 기존 파일의 추가 섹션(token_budget 등)은 그대로 유지
+            if os.path.exists(config_path):
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    existing = yaml.safe_load(f) or {}
+                for key, value in existing.items():
+                    config.setdefault(key, value)
+            
+            logger.debug(f"🛠️ 설정 구조 생성 완료: {len(config)} 섹션")
+            
             # YAML 파일 생성
             logger.debug("🛠️ YAML 파일 쓰기 시작")
             with open(config_path, 'w', encoding='utf-8') as f:
@@ -14,6 +14,8 @@ from router.router import input_router
 from router.router import process_router
 from router.router import output_router
 from backend.input_handler.core.input_main import InputHandler
+from backend.page_generator.browser_pool import shutdown_browser_pool
+from backend.competitor_analysis.db_pool import close_db_pools
 
 # 로거 설정
 logger = get_logger(__name__)
@@ -68,6 +70,8 @@ async def lifespan(app: FastAPI):
     logger.debug("🛠️ FastAPI 애플리케이션 종료 프로세스 시작")
     if input_handler:
         logger.debug("🛠️ InputHandler 정리 작업 수행")
+    shutdown_browser_pool()
+    close_db_pools()
     logger.info("✅ FastAPI 애플리케이션 종료 완료")
 
 # FastAPI 애플리케이션 생성
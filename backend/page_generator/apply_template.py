@@ -1,25 +1,43 @@
 import os
+from functools import lru_cache
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape
 
-def apply_css_template(raw_html: str, css_path: str) -> str:
+@lru_cache(maxsize=8)
+def load_css(css_path: str) -> str:
     """
-    생성된 HTML에 지정한 CSS 파일을 <head> 태그 안에 삽입하여 반환합니다.
+    CSS 파일을 읽어 반환합니다. 같은 경로는 최초 1회만 디스크에서 읽습니다.
 
     Args:
-        raw_html (str): CSS가 적용되기 전의 HTML 문자열
-        css_path (str): 삽입할 CSS 파일의 경로
+        css_path (str): CSS 파일 경로
 
     Returns:
-        str: CSS가 적용된 최종 HTML 문자열
+        str: CSS 문자열
 
     Raises:
         FileNotFoundError: 지정한 CSS 파일이 존재하지 않을 경우 발생
     """
     try:
         with open(css_path, "r", encoding="utf-8") as f:
-            css = f.read()
+            return f.read()
     except FileNotFoundError:
         raise FileNotFoundError(f"❌ CSS 파일을 찾을 수 없습니다: {css_path}")
 
+
+def apply_css_template(raw_html: str, css_path: str) -> str:
+    """
+    생성된 HTML에 지정한 CSS 파일을 <head> 태그 안에 삽입하여 반환합니다.
+
+    Args:
+        raw_html (str): CSS가 적용되기 전의 HTML 문자열
+        css_path (str): 삽입할 CSS 파일의 경로
+
+    Returns:
+        str: CSS가 적용된 최종 HTML 문자열
+
+    Raises:
+        FileNotFoundError: 지정한 CSS 파일이 존재하지 않을 경우 발생
+    """
+    css = load_css(css_path)
     css_block = f"<style>\n{css}\n</style>"
 
     if "<head>" in raw_html:
@@ -28,3 +46,90 @@ def apply_css_template(raw_html: str, css_path: str) -> str:
         styled_html = raw_html.replace("<html>", f"<html>\n<head>\n{css_block}\n</head>")
 
     return styled_html
+
+
+# 구조화 콘텐츠(JSON) → HTML 렌더링용 버전별 Jinja2 템플릿
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+DEFAULT_TEMPLATE = "story_v1"
+# 템플릿이 콘텐츠 항목 수와 무관하게 고정된 아이콘을 쓰도록 함
+PLAN_ICONS = ["fa-hand-pointer", "fa-credit-card", "fa-truck"]
+
+
+@lru_cache(maxsize=1)
+def get_template_env() -> Environment:
+    """
+    템플릿 디렉토리와 CSS 디렉토리를 로더로 사용하는 Jinja2 Environment를 반환합니다. (최초 1회 생성)
+    """
+    return Environment(
+        loader=FileSystemLoader([TEMPLATE_DIR, os.path.dirname(__file__)]),
+        autoescape=select_autoescape(["html"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
+def render_content_template(content: dict, product: dict, images: dict, template: str = DEFAULT_TEMPLATE) -> str:
+    """
+    LLM이 생성한 구조화 콘텐츠(JSON)를 버전별 템플릿으로 렌더링합니다.
+
+    Args:
+        content (dict): headline, problems, features, reviews, faq 등 상세페이지 콘텐츠
+        product (dict): 제품 정보 딕셔너리 (name, brand, price 등)
+        images (dict): 섹션 키(hero, guide, product) -> [{"src": ..., "alt": ...}] 리스트
+        template (str): 템플릿 이름 (예: "story_v1", "default_v1")
+
+    Returns:
+        str: 렌더링된 상세페이지 HTML
+
+    Raises:
+        FileNotFoundError: 템플릿이 존재하지 않을 경우 발생
+    """
+    try:
+        page_template = get_template_env().get_template(f"{template}.html")
+    except TemplateNotFound:
+        raise FileNotFoundError(f"❌ 템플릿을 찾을 수 없습니다: {template}")
+
+    return page_template.render(
+        content=content,
+        product=product,
+        images=images,
+        jsonld=build_product_jsonld(content, product, images),
+        plan_icons=PLAN_ICONS,
+    )
+
+
+def build_product_jsonld(content: dict, product: dict, images: dict) -> dict:
+    """
+    제품 정보와 콘텐츠의 jsonld 항목으로 Schema.org Product JSON-LD를 만듭니다.
+
+    Args:
+        content (dict): 상세페이지 콘텐츠
+        product (dict): 제품 정보 딕셔너리
+        images (dict): 섹션별 이미지 딕셔너리
+
+    Returns:
+        dict: JSON-LD 딕셔너리
+    """
+    fields = content.get("jsonld") or {}
+    jsonld = {
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "name": product.get("name"),
+        "brand": {"@type": "Brand", "name": product.get("brand")},
+        "category": product.get("category"),
+        "description": fields.get("description") or content.get("summary"),
+        "image": [image["src"] for section in images.values() for image in section],
+        "offers": {
+            "@type": "Offer",
+            "price": str(product.get("price", "")),
+            "priceCurrency": "KRW",
+            "availability": "https://schema.org/InStock",
+        },
+    }
+    if fields.get("rating_value") and fields.get("review_count"):
+        jsonld["aggregateRating"] = {
+            "@type": "AggregateRating",
+            "ratingValue": str(fields["rating_value"]),
+            "reviewCount": str(fields["review_count"]),
+        }
+    return jsonld
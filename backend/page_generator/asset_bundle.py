@@ -0,0 +1,155 @@
+"""
+상세페이지 렌더링에 필요한 CDN 에셋(Tailwind, Noto Sans KR, Font Awesome)의 로컬 번들.
+
+번들 다운로드 (setup.sh에서 1회 실행):
+    python -m backend.page_generator.asset_bundle
+
+렌더링 시에는 Chromium 요청을 가로채 번들 파일로 응답하므로 네트워크 없이도 같은 결과가 나옵니다.
+"""
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from functools import lru_cache
+from urllib.parse import urlparse
+import requests
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+BUNDLE_VERSION = "v1"
+BUNDLE_DIR = os.path.join(os.path.dirname(__file__), "assets", BUNDLE_VERSION)
+MANIFEST_PATH = os.path.join(BUNDLE_DIR, "manifest.json")
+
+FONT_AWESOME_BASE = "https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@6.4.0"
+GOOGLE_FONTS_CSS = "https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700&display=swap"
+# 번들에 포함할 원본 URL (Google Fonts CSS가 참조하는 폰트 파일은 다운로드 시 자동으로 추가)
+ASSET_SOURCES = [
+    "https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css",
+    f"{FONT_AWESOME_BASE}/css/all.min.css",
+    f"{FONT_AWESOME_BASE}/webfonts/fa-solid-900.woff2",
+    f"{FONT_AWESOME_BASE}/webfonts/fa-regular-400.woff2",
+    f"{FONT_AWESOME_BASE}/webfonts/fa-brands-400.woff2",
+    f"{FONT_AWESOME_BASE}/webfonts/fa-v4compatibility.woff2",
+    GOOGLE_FONTS_CSS,
+]
+# Google Fonts는 User-Agent에 따라 다른 CSS를 주므로 Chromium과 같은 woff2 버전을 받도록 지정
+CHROME_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+CSS_URL_PATTERN = re.compile(r"url\((https://fonts\.gstatic\.com/[^)]+)\)")
+
+
+def _asset_filename(url: str, content_type: str) -> str:
+    ext = os.path.splitext(urlparse(url).path)[1] or mimetypes.guess_extension(content_type) or ""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ext
+
+
+def download_bundle():
+    """
+    ASSET_SOURCES의 에셋과 Google Fonts CSS가 참조하는 폰트 파일을 내려받아
+    BUNDLE_DIR에 저장하고 manifest.json을 생성합니다.
+    """
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+    session = requests.Session()
+    session.headers["User-Agent"] = CHROME_USER_AGENT
+
+    assets = {}
+    pending = list(ASSET_SOURCES)
+    while pending:
+        url = pending.pop(0)
+        if url in assets:
+            continue
+        try:
+            res = session.get(url, timeout=30)
+            res.raise_for_status()
+        except Exception as e:
+            raise RuntimeError(f"❌ 에셋 다운로드 실패: {url}: {e}")
+
+        content_type = res.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip()
+        filename = _asset_filename(url, content_type)
+        with open(os.path.join(BUNDLE_DIR, filename), "wb") as f:
+            f.write(res.content)
+        assets[url] = {"path": filename, "content_type": content_type}
+
+        if url == GOOGLE_FONTS_CSS:
+            pending += CSS_URL_PATTERN.findall(res.text)
+        logger.debug(f"🛠️ 에셋 다운로드: {url} ({len(res.content)} bytes)")
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump({"version": BUNDLE_VERSION, "assets": assets}, f, ensure_ascii=False, indent=2)
+    logger.info(f"✅ 에셋 번들 생성 완료: {len(assets)}개 → {BUNDLE_DIR}")
+
+
+_missing_warned = False
+
+
+def load_manifest() -> dict:
+    """
+    번들 manifest를 읽어 URL → {"path": 절대 경로, "content_type"} 딕셔너리로 반환합니다.
+    번들이 없으면 빈 딕셔너리를 반환합니다. (캐시하지 않으므로 download_bundle() 이후 재시작 없이 반영)
+    manifest 파일이 바뀌면(mtime) 다시 읽습니다.
+    """
+    global _missing_warned
+    try:
+        mtime = os.path.getmtime(MANIFEST_PATH)
+    except OSError:
+        if not _missing_warned:
+            _missing_warned = True
+            logger.warning(f"⚠️ 에셋 번들이 없습니다. CDN에서 직접 로드합니다: {MANIFEST_PATH}")
+        return {}
+    return _read_manifest(MANIFEST_PATH, mtime)
+
+
+@lru_cache(maxsize=1)
+def _read_manifest(manifest_path: str, mtime: float) -> dict:
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    bundle_dir = os.path.dirname(manifest_path)
+    assets = {
+        url: {"path": os.path.join(bundle_dir, info["path"]), "content_type": info["content_type"]}
+        for url, info in manifest.get("assets", {}).items()
+    }
+    logger.info(f"✅ 에셋 번들 로드 완료: {manifest.get('version')} ({len(assets)}개)")
+    return assets
+
+
+def is_bundled(url: str) -> bool:
+    """
+    URL이 로컬 번들에서 제공되는지 여부를 반환합니다.
+    """
+    return url in load_manifest()
+
+
+async def install_asset_routes(context, offline: bool = False):
+    """
+    브라우저 컨텍스트의 요청을 가로채 번들에 있는 에셋은 로컬 파일로 응답합니다.
+    offline이면 번들에 없는 외부(http/https) 요청은 기다리지 않고 즉시 차단합니다.
+
+    Args:
+        context (BrowserContext): Playwright 브라우저 컨텍스트
+        offline (bool): 번들에 없는 외부 요청 차단 여부
+    """
+    assets = load_manifest()
+
+    async def _handle(route):
+        url = route.request.url
+        asset = assets.get(url)
+        if asset is not None:
+            # 폰트는 교차 출처 로드이므로 CORS 헤더가 있어야 적용됨
+            await route.fulfill(
+                path=asset["path"],
+                headers={"Content-Type": asset["content_type"], "Access-Control-Allow-Origin": "*"}
+            )
+        elif offline and url.startswith(("http://", "https://")):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", _handle)
+
+
+if __name__ == "__main__":
+    download_bundle()
@@ -0,0 +1,408 @@
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+from typing import Awaitable, Callable
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from backend.page_generator.asset_bundle import install_asset_routes, is_bundled
+from backend.page_generator.render_output import load_render_options
+from utils.logger import get_logger
+from utils.config import load_config
+
+logger = get_logger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_RENDER_TIMEOUT = 60
+DEFAULT_VIEWPORT_HEIGHT = 720
+# 조각 저장(오픈마켓 상세페이지) 시 viewport 높이
+SLICED_VIEWPORT_HEIGHT = 1200
+# 메모리 HTML을 제공할 가상 origin (실제 네트워크로 나가지 않고 route로 응답)
+VIRTUAL_ORIGIN = "http://geopage.local"
+
+
+class PageSlot:
+    """
+    풀에서 빌려주는 렌더링 슬롯. 컨텍스트 하나와 그 안의 페이지 하나로 구성됩니다.
+    """
+
+    def __init__(self, context: BrowserContext, page: Page, generation: int):
+        self.context = context
+        self.page = page
+        # 어느 브라우저 인스턴스에서 만들어졌는지 (재실행 후 오래된 슬롯 판별용)
+        self.generation = generation
+        self.crashed = False
+        page.on("crash", lambda _: self._mark_crashed())
+
+    def _mark_crashed(self):
+        self.crashed = True
+        logger.warning("⚠️ 렌더링 페이지 crash 감지")
+
+
+class RenderStats:
+    """
+    페이지 한 장을 렌더링하는 동안의 요청 통계. 외부 네트워크 대기 시간이 얼마나 되는지 기록합니다.
+    """
+
+    def __init__(self):
+        self.bundled = 0
+        self.external = 0
+        self.blocked = 0
+        # 외부 요청들의 응답 완료까지 걸린 시간 (ms)
+        self.network_wait_total = 0.0
+        self.network_wait_max = 0.0
+        self.load_time = 0.0
+        self.total_time = 0.0
+
+    def on_finished(self, request):
+        if not request.url.startswith(("http://", "https://")) or request.url.startswith(VIRTUAL_ORIGIN):
+            return
+        if is_bundled(request.url):
+            self.bundled += 1
+            return
+        self.external += 1
+        wait = max(request.timing.get("responseEnd", 0.0), 0.0)
+        self.network_wait_total += wait
+        self.network_wait_max = max(self.network_wait_max, wait)
+
+    def on_failed(self, request):
+        if request.url.startswith(("http://", "https://")) and not request.url.startswith(VIRTUAL_ORIGIN):
+            self.blocked += 1
+
+    def summary(self) -> str:
+        return (
+            f"total={self.total_time:.2f}s, load={self.load_time:.2f}s, "
+            f"bundled={self.bundled}, external={self.external}, blocked={self.blocked}, "
+            f"network_wait_total={self.network_wait_total:.0f}ms, network_wait_max={self.network_wait_max:.0f}ms"
+        )
+
+
+class BrowserPool:
+    """
+    Chromium을 한 번만 띄워 두고, 재사용 가능한 컨텍스트/페이지 풀로 렌더링을 처리하는 브라우저 서비스.
+
+    Playwright async API는 전용 이벤트 루프 스레드에서 실행되며, 동기 코드에서는 run()으로
+    코루틴을 제출하고 결과를 기다립니다. 동시에 렌더링할 수 있는 세션 수는 pool_size로 제한됩니다.
+    브라우저가 종료되거나 페이지가 crash되면 다음 요청에서 자동으로 다시 만듭니다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        launch_kwargs: dict = None,
+        context_kwargs: dict = None,
+        context_setup: Callable[[BrowserContext], Awaitable] = None
+    ):
+        """
+        Args:
+            pool_size (int): 동시에 사용할 수 있는 페이지 수
+            launch_kwargs (dict, optional): chromium.launch()에 전달할 인자
+            context_kwargs (dict, optional): browser.new_context()에 전달할 인자 (viewport, device_scale_factor 등)
+            context_setup (Callable, optional): 새 컨텍스트마다 실행할 async 함수 (요청 가로채기 등록 등)
+        """
+        self.pool_size = pool_size
+        self.launch_kwargs = launch_kwargs or {}
+        self.context_kwargs = context_kwargs or {}
+        self.context_setup = context_setup
+
+        self._loop = None
+        self._thread = None
+        self._playwright = None
+        self._browser: Browser = None
+        self._generation = 0
+        self._slots: asyncio.Queue = None
+        self._relaunch_lock: asyncio.Lock = None
+        self._stats = {"renders": 0, "relaunches": 0, "slot_wait_total": 0.0}
+
+    def start(self):
+        """
+        이벤트 루프 스레드를 시작하고 브라우저와 페이지 풀을 준비합니다.
+        """
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="browser-pool", daemon=True)
+        self._thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(timeout=DEFAULT_RENDER_TIMEOUT)
+        except Exception:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread = None
+            raise
+        logger.info(f"✅ 브라우저 풀 시작 완료: pool_size={self.pool_size}")
+
+    def stop(self):
+        """
+        브라우저와 Playwright를 종료하고 이벤트 루프 스레드를 멈춥니다.
+        """
+        if self._thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result(timeout=DEFAULT_RENDER_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"⚠️ 브라우저 풀 종료 중 오류: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._thread = None
+        logger.info("✅ 브라우저 풀 종료 완료")
+
+    def run(self, render: Callable[[Page], Awaitable], timeout: float = DEFAULT_RENDER_TIMEOUT):
+        """
+        풀에서 페이지 하나를 빌려 render(page) 코루틴을 실행하고 결과를 반환합니다.
+        빈 페이지가 없으면 다른 렌더링이 끝날 때까지 기다립니다.
+
+        Args:
+            render (Callable[[Page], Awaitable]): 페이지를 받아 렌더링을 수행하는 async 함수
+            timeout (float): 페이지를 빌린 뒤 렌더링에 허용하는 최대 시간 (초, 슬롯 대기 시간은 제외)
+
+        Returns:
+            render 코루틴의 반환값
+
+        Raises:
+            TimeoutError: 렌더링이 timeout 안에 끝나지 않은 경우 (렌더링 작업은 취소되고 슬롯은 반납됨)
+        """
+        if self._thread is None:
+            raise RuntimeError("❌ 브라우저 풀이 시작되지 않았습니다")
+        future = asyncio.run_coroutine_threadsafe(self._run(render, timeout), self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            # 호출 측이 중단되면 이벤트 루프의 렌더링도 취소해 슬롯을 반납
+            future.cancel()
+            raise
+
+    def screenshot(self, html_path: str, outputs: list = None):
+        """
+        로컬 HTML 파일을 렌더링하고 전체 페이지 PNG 스크린샷을 반환합니다.
+
+        Args:
+            html_path (str): 렌더링할 로컬 HTML 파일의 경로
+            outputs (list, optional): 같은 페이지에서 추가로 만들 출력 목록 (_capture 참고)
+
+        Returns:
+            tuple: ({"main": PNG 바이트, 출력 이름: 바이트, ...}, RenderStats 렌더링 시간과 네트워크 대기 통계)
+        """
+        html_abs_path = Path(html_path).resolve()
+
+        async def _render(page: Page):
+            return await _capture(page, f"file://{html_abs_path}", outputs)
+
+        return self.run(_render)
+
+    def screenshot_html(self, html_text: str, data_dir: str, page_name: str = "page.html", outputs: list = None):
+        """
+        메모리에 있는 HTML을 파일로 쓰지 않고 바로 렌더링해 전체 페이지 PNG 스크린샷을 반환합니다.
+        HTML은 가상 origin(VIRTUAL_ORIGIN/result/<page_name>)으로 제공되므로,
+        ../output/xxx.png 같은 상대 경로 이미지는 data_dir 아래 파일로 응답합니다.
+
+        Args:
+            html_text (str): 렌더링할 HTML 문자열
+            data_dir (str): 상대 경로 이미지의 기준 디렉토리 (backend/data)
+            page_name (str): 가상 URL에 사용할 파일명
+            outputs (list, optional): 같은 페이지에서 추가로 만들 출력 목록 (_capture 참고)
+
+        Returns:
+            tuple: ({"main": PNG 바이트, 출력 이름: 바이트, ...}, RenderStats 렌더링 시간과 네트워크 대기 통계)
+        """
+        page_url = f"{VIRTUAL_ORIGIN}/result/{page_name}"
+        data_root = os.path.realpath(data_dir)
+
+        async def _serve(route):
+            url = route.request.url.split("?")[0]
+            if url == page_url:
+                await route.fulfill(body=html_text, content_type="text/html; charset=utf-8")
+                return
+            file_path = os.path.realpath(os.path.join(data_root, unquote(urlparse(url).path).lstrip("/")))
+            if file_path.startswith(data_root + os.sep) and os.path.isfile(file_path):
+                await route.fulfill(path=file_path)
+            else:
+                await route.fulfill(status=404)
+
+        async def _render(page: Page):
+            await page.route(f"{VIRTUAL_ORIGIN}/**", _serve)
+            try:
+                return await _capture(page, page_url, outputs)
+            finally:
+                await page.unroute(f"{VIRTUAL_ORIGIN}/**", _serve)
+
+        return self.run(_render)
+
+    def get_stats(self) -> dict:
+        """
+        렌더링 횟수, 브라우저 재실행 횟수, 슬롯 대기 시간 통계를 반환합니다.
+        """
+        stats = dict(self._stats)
+        stats["slot_wait_avg"] = stats["slot_wait_total"] / stats["renders"] if stats["renders"] else 0.0
+        return stats
+
+    async def _start(self):
+        self._relaunch_lock = asyncio.Lock()
+        self._slots = asyncio.Queue()
+        self._playwright = await async_playwright().start()
+        await self._launch()
+        for _ in range(self.pool_size):
+            self._slots.put_nowait(await self._new_slot())
+
+    async def _stop(self):
+        while not self._slots.empty():
+            slot = self._slots.get_nowait()
+            await self._close_slot(slot)
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    async def _launch(self):
+        self._browser = await self._playwright.chromium.launch(**self.launch_kwargs)
+        self._generation += 1
+        logger.debug(f"🛠️ Chromium 실행 (generation={self._generation})")
+
+    async def _new_slot(self) -> PageSlot:
+        context = await self._browser.new_context(**self.context_kwargs)
+        if self.context_setup is not None:
+            await self.context_setup(context)
+        page = await context.new_page()
+        return PageSlot(context, page, self._generation)
+
+    async def _close_slot(self, slot: PageSlot):
+        try:
+            await slot.context.close()
+        except Exception:
+            # 브라우저가 이미 종료된 경우 등
+            pass
+
+    async def _ensure_browser(self):
+        async with self._relaunch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            logger.warning("⚠️ Chromium 연결 끊김 감지, 재실행합니다")
+            self._stats["relaunches"] += 1
+            await self._launch()
+
+    async def _healthy_slot(self, slot: PageSlot) -> PageSlot:
+        await self._ensure_browser()
+        if slot.generation == self._generation and not slot.crashed and not slot.page.is_closed():
+            return slot
+        await self._close_slot(slot)
+        logger.debug("🛠️ 렌더링 슬롯 재생성")
+        return await self._new_slot()
+
+    async def _run(self, render: Callable[[Page], Awaitable], timeout: float):
+        wait_start = time.perf_counter()
+        slot = await self._slots.get()
+        self._stats["slot_wait_total"] += time.perf_counter() - wait_start
+        try:
+            slot = await self._healthy_slot(slot)
+            self._stats["renders"] += 1
+            # 시간 제한은 슬롯을 빌린 뒤부터 적용하고, 초과하면 렌더링 코루틴을 취소
+            try:
+                return await asyncio.wait_for(render(slot.page), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"❌ 렌더링 시간 초과 ({timeout}s)")
+        except BaseException:
+            # 실패한 페이지는 상태를 알 수 없으므로 다음 사용 시 새로 만들도록 표시
+            slot.crashed = True
+            raise
+        finally:
+            self._slots.put_nowait(slot)
+
+
+async def _capture(page: Page, url: str, outputs: list = None) -> tuple:
+    """
+    페이지를 한 번만 로드한 뒤 기본 스크린샷과 추가 출력(다른 뷰포트 너비, PDF)을 차례로 만듭니다.
+    파싱, 폰트 로딩은 한 번만 일어나고 출력마다 레이아웃만 다시 계산됩니다.
+
+    Args:
+        page (Page): 렌더링에 사용할 페이지
+        url (str): 로드할 URL
+        outputs (list, optional): {"name", "type": "image"|"pdf", "width"} 리스트
+
+    Returns:
+        tuple: ({"main": PNG 바이트, 출력 이름: 바이트, ...}, RenderStats)
+    """
+    stats = RenderStats()
+    captures = {}
+    default_viewport = page.viewport_size
+    media_emulated = False
+    page.on("requestfinished", stats.on_finished)
+    page.on("requestfailed", stats.on_failed)
+    try:
+        start = time.perf_counter()
+        await page.goto(url)
+        stats.load_time = time.perf_counter() - start
+        captures["main"] = await page.screenshot(full_page=True, type="png")
+
+        for output in outputs or []:
+            await page.set_viewport_size({"width": output["width"], "height": default_viewport["height"]})
+            if output["type"] == "pdf":
+                # 인쇄용 스타일이 아닌 화면 그대로, 페이지 나눔 없이 한 장으로 저장
+                media_emulated = True
+                await page.emulate_media(media="screen")
+                height = await page.evaluate("document.documentElement.scrollHeight")
+                captures[output["name"]] = await page.pdf(
+                    width=f"{output['width']}px",
+                    height=f"{height}px",
+                    print_background=True
+                )
+            else:
+                captures[output["name"]] = await page.screenshot(full_page=True, type="png")
+        stats.total_time = time.perf_counter() - start
+    finally:
+        if media_emulated:
+            # 풀의 페이지를 재사용하므로 media 에뮬레이션 해제 (None은 "변경 없음"이라 "null"을 전달)
+            await page.emulate_media(media="null")
+        if outputs and default_viewport:
+            await page.set_viewport_size(default_viewport)
+        page.remove_listener("requestfinished", stats.on_finished)
+        page.remove_listener("requestfailed", stats.on_failed)
+    logger.info(f"✅ 렌더링 통계: {stats.summary()}, outputs={len(captures)}")
+    return captures, stats
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    프로세스 전체에서 공유하는 브라우저 풀을 반환합니다. (최초 호출 시 시작)
+    풀 크기는 config.yaml의 render.pool_size로 지정하며, 모든 컨텍스트는 로컬 에셋 번들을 사용합니다.
+    render.offline이 true이면 번들에 없는 외부 요청은 차단합니다.
+
+    Returns:
+        BrowserPool: 실행 중인 브라우저 풀
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            render_config = load_config().get("render") or {}
+            offline = bool(render_config.get("offline", False))
+            options = load_render_options()
+            viewport_height = SLICED_VIEWPORT_HEIGHT if int(options["slice_height"] or 0) > 0 else DEFAULT_VIEWPORT_HEIGHT
+
+            async def _setup_context(context: BrowserContext):
+                await install_asset_routes(context, offline=offline)
+
+            pool = BrowserPool(
+                pool_size=int(render_config.get("pool_size", DEFAULT_POOL_SIZE)),
+                context_kwargs={
+                    "viewport": {"width": options["width"], "height": viewport_height},
+                    "device_scale_factor": options["device_scale_factor"],
+                },
+                context_setup=_setup_context
+            )
+            pool.start()
+            _pool = pool
+        return _pool
+
+
+def shutdown_browser_pool():
+    """
+    공유 브라우저 풀이 실행 중이면 종료합니다.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.stop()
+            _pool = None
@@ -1,24 +1,42 @@
-from pathlib import Path
-from playwright.sync_api import sync_playwright
+from backend.page_generator.browser_pool import get_browser_pool
+from backend.page_generator.render_output import load_render_options, save_render_outputs
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-def image_with_playwright(html_path: str, image_path: str):
+def image_with_playwright(html_path: str, result_path: str, session_id: str, options: dict = None) -> dict:
     """
-    Playwright를 사용해 HTML 파일을 렌더링하고, 전체 페이지 스크린샷을 저장합니다.
+    공유 브라우저 풀의 페이지로 HTML 파일을 렌더링하고, 설정된 포맷/조각/추가 출력으로 저장합니다.
+    Chromium은 프로세스당 한 번만 실행되며, 여러 세션을 풀 크기만큼 동시에 렌더링할 수 있습니다.
 
     Args:
         html_path (str): 렌더링할 로컬 HTML 파일의 경로
-        image_path (str): 저장할 스크린샷 이미지 파일의 경로
+        result_path (str): 결과 디렉토리 경로
+        session_id (str): 상세페이지 세션 ID
+        options (dict, optional): 출력 옵션 (기본값: config.yaml의 render 섹션)
 
     Returns:
-        None
+        dict: 저장된 파일 목록이 담긴 manifest
     """
-    html_abs_path = Path(html_path).resolve()
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto(f"file://{html_abs_path}")
-        page.screenshot(path=image_path, full_page=True)
-        browser.close()
+    options = options or load_render_options()
+    captures, _ = get_browser_pool().screenshot(html_path, outputs=options["outputs"])
+    return save_render_outputs(captures, result_path, session_id, options)
+
+def image_from_html(html_text: str, result_path: str, session_id: str, data_dir: str, options: dict = None) -> dict:
+    """
+    메모리에 있는 HTML을 파일로 저장하지 않고 바로 렌더링해, 설정된 포맷/조각/추가 출력으로 저장합니다.
+    상대 경로 이미지(../output/xxx.png 등)는 data_dir 기준으로 찾습니다.
+
+    Args:
+        html_text (str): 렌더링할 HTML 문자열
+        result_path (str): 결과 디렉토리 경로
+        session_id (str): 상세페이지 세션 ID
+        data_dir (str): 상대 경로 이미지의 기준 디렉토리 (backend/data)
+        options (dict, optional): 출력 옵션 (기본값: config.yaml의 render 섹션)
+
+    Returns:
+        dict: 저장된 파일 목록이 담긴 manifest
+    """
+    options = options or load_render_options()
+    captures, _ = get_browser_pool().screenshot_html(html_text, data_dir, f"page_{session_id}.html", outputs=options["outputs"])
+    return save_render_outputs(captures, result_path, session_id, options)
@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 최근 생성된 상세페이지 HTML (session_id -> html)
+MAX_RECENT_PAGES = 32
+_recent_pages = OrderedDict()
+_recent_lock = threading.Lock()
+
+# HTML 파일 저장은 단일 스레드에서 순서대로 처리 (같은 파일에 대한 쓰기 순서 보장)
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="html-writer")
+_pending_writes = {}
+_pending_lock = threading.Lock()
+
+
+def remember_html(session_id: str, html_text: str):
+    """
+    생성된 HTML을 메모리에 보관해 렌더링 단계에서 파일을 다시 읽지 않도록 합니다.
+
+    Args:
+        session_id (str): 상세페이지 세션 ID
+        html_text (str): 상세페이지 HTML
+    """
+    with _recent_lock:
+        _recent_pages[session_id] = html_text
+        _recent_pages.move_to_end(session_id)
+        while len(_recent_pages) > MAX_RECENT_PAGES:
+            _recent_pages.popitem(last=False)
+
+
+def get_recent_html(session_id: str) -> str:
+    """
+    메모리에 보관된 HTML을 반환합니다.
+
+    Args:
+        session_id (str): 상세페이지 세션 ID
+
+    Returns:
+        str: 상세페이지 HTML (없으면 None)
+    """
+    with _recent_lock:
+        return _recent_pages.get(session_id)
+
+
+def _write_html(html_path: str, html_text: str):
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(html_text)
+    logger.info(f"✅ HTML 상세페이지 저장 완료: {html_path}")
+
+
+def persist_html(html_path: str, html_text: str) -> Future:
+    """
+    HTML 파일 저장을 백그라운드에서 수행합니다.
+
+    Args:
+        html_path (str): 저장할 HTML 파일 경로
+        html_text (str): 상세페이지 HTML
+
+    Returns:
+        Future: 저장 작업 Future (실패 시 예외를 담음)
+    """
+    with _pending_lock:
+        future = _writer.submit(_write_html, html_path, html_text)
+        _pending_writes[html_path] = future
+
+    def _on_done(done: Future):
+        if done.exception() is not None:
+            # 실패한 Future는 flush_html()에서 예외를 전달할 수 있도록 남겨 둠
+            logger.error(f"❌ HTML 저장 실패: {html_path}: {done.exception()}")
+            return
+        with _pending_lock:
+            if _pending_writes.get(html_path) is done:
+                del _pending_writes[html_path]
+
+    future.add_done_callback(_on_done)
+    return future
+
+
+def flush_html(html_path: str, timeout: float = None):
+    """
+    해당 경로에 대한 백그라운드 저장이 끝날 때까지 기다립니다.
+
+    Args:
+        html_path (str): HTML 파일 경로
+        timeout (float, optional): 최대 대기 시간 (초)
+
+    Raises:
+        RuntimeError: 저장에 실패한 경우
+    """
+    with _pending_lock:
+        future = _pending_writes.get(html_path)
+    if future is None:
+        return
+    try:
+        future.result(timeout=timeout)
+    except Exception as e:
+        raise RuntimeError(f"❌ HTML 저장 실패: {e}")
+    finally:
+        with _pending_lock:
+            if _pending_writes.get(html_path) is future:
+                del _pending_writes[html_path]
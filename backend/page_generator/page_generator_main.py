@@ -1,9 +1,11 @@
 import os
-from playwright.sync_api import sync_playwright
 from utils.logger import get_logger
 from utils.config import load_config
 from backend.page_generator.apply_template import apply_css_template
-from backend.page_generator.convert_image import image_with_playwright
+from backend.page_generator.convert_image import image_with_playwright, image_from_html
+from backend.page_generator.html_store import get_recent_html, remember_html, persist_html, flush_html
+from backend.page_generator.render_cache import render_cache_key, lookup_render, store_render
+from backend.page_generator.render_output import load_render_options
 
 logger = get_logger(__name__)
 base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
@@ -18,31 +20,49 @@ def page_generator_main(product: dict):
     
     css_template_path = os.path.join(base_dir, f"backend/page_generator/css/default.css")
     html_path = os.path.join(result_path, f"page_{session_id}.html")
-    image_path = os.path.join(result_path, f"page_{session_id}.png")
 
-    # 원본 HTML 로드
-    try:
-        with open(html_path, "r", encoding="utf-8") as f:
-            draft_html = f.read()
-            logger.info("✅ 원본 HTML 로드 완료")
-    except FileNotFoundError:
-        raise FileNotFoundError(f"❌ HTML 원본 파일을 찾을 수 없습니다: {html_path}")
-    except Exception as e:
-        raise RuntimeError(f"❌ 원본 HTML 읽기 실패: {e}")
+    # 원본 HTML 로드 (text_generator가 메모리에 남긴 HTML 우선, 없으면 파일에서 읽음)
+    draft_html = get_recent_html(session_id)
+    if draft_html is not None:
+        logger.info("✅ 원본 HTML 로드 완료 (메모리)")
+    else:
+        try:
+            with open(html_path, "r", encoding="utf-8") as f:
+                draft_html = f.read()
+                logger.info("✅ 원본 HTML 로드 완료")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"❌ HTML 원본 파일을 찾을 수 없습니다: {html_path}")
+        except Exception as e:
+            raise RuntimeError(f"❌ 원본 HTML 읽기 실패: {e}")
     
-    # hf일 경우 CSS 적용
-    if engine == "hf":
+    # hf일 경우 CSS 적용 (이전 페이지를 재사용한 경우 이미 적용되어 있음)
+    if engine == "hf" and not product.get("reused_from"):
         draft_html = apply_css_template(draft_html, css_template_path)
+        # 이후 재사용(find_reusable_page)도 메모리를 먼저 읽으므로 CSS가 적용된 HTML로 교체
+        remember_html(session_id, draft_html)
+        persist_html(html_path, draft_html)
+        logger.info("✅ CSS 적용된 HTML 저장 예약 완료")
+
+    # 최종 HTML, 참조 이미지, 렌더링 옵션이 같은 결과가 이미 있으면 브라우저 없이 복사
+    options = load_render_options()
+    cache_key = render_cache_key(draft_html, result_path, options)
+    manifest = lookup_render(result_path, session_id, cache_key)
+
+    # HTML → 이미지 저장 (파일 저장은 렌더링과 동시에 백그라운드로 진행)
+    if manifest is None:
         try:
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(draft_html)
-                logger.info("✅ CSS 적용된 HTML 파일로 덮어쓰기 완료")
+            if "file://" in draft_html:
+                # file:// 이미지는 가상 origin에서 접근할 수 없으므로 저장된 파일로 렌더링
+                flush_html(html_path)
+                manifest = image_with_playwright(html_path, result_path, session_id, options)
+            else:
+                manifest = image_from_html(draft_html, result_path, session_id, os.path.dirname(result_path), options)
+            logger.info(f"✅ HTML → 이미지 변환 완료: {manifest['image']['path']}")
         except Exception as e:
-            raise RuntimeError(f"❌ CSS 적용된 HTML 저장 실패: {e}")
+            raise RuntimeError(f"❌ HTML → 이미지 변환 실패: {e}")
+        store_render(result_path, session_id, cache_key)
 
-    # HTML → 이미지 저장
-    try:
-        image_with_playwright(html_path, image_path)
-        logger.info(f"✅ HTML → 이미지 변환 완료: {image_path}")
-    except Exception as e:
-        raise RuntimeError(f"❌ HTML → 이미지 변환 실패: {e}")
\ No newline at end of file
+    flush_html(html_path)
+    product["image_path"] = manifest["image"]["path"]
+    product["image_slices"] = [item["path"] for item in manifest["slices"]]
+    product["render_outputs"] = {item["name"]: item["path"] for item in manifest.get("outputs", [])}
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from urllib.parse import unquote, urlparse
+from backend.page_generator.asset_bundle import BUNDLE_VERSION
+from backend.page_generator.render_output import load_render_manifest
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = "render_cache.json"
+# 인덱스에 보관할 최대 항목 수 (가장 오래 갱신되지 않은 항목부터 삭제)
+MAX_INDEX_ENTRIES = 500
+ASSET_REF_PATTERN = re.compile(r'\s(?:src|href)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+_index_lock = threading.Lock()
+MAX_FILE_HASHES = 1024
+# (경로, 수정 시각, 크기) -> 파일 해시 (같은 파일을 매번 다시 읽지 않도록)
+_file_hashes = {}
+
+
+def _file_hash(path: str) -> str:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    cache_key = (path, stat.st_mtime_ns, stat.st_size)
+    cached = _file_hashes.get(cache_key)
+    if cached is None:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        if len(_file_hashes) > MAX_FILE_HASHES:
+            _file_hashes.clear()
+        cached = _file_hashes[cache_key] = digest.hexdigest()
+    return cached
+
+
+def _resolve_asset(ref: str, html_dir: str) -> str:
+    if ref.startswith("file://"):
+        return unquote(urlparse(ref).path)
+    if ref.startswith(("http://", "https://", "data:", "#", "//")):
+        return None
+    return os.path.normpath(os.path.join(html_dir, unquote(ref.split("?")[0])))
+
+
+def render_cache_key(html_text: str, html_dir: str, options: dict) -> str:
+    """
+    최종 HTML, HTML이 참조하는 로컬 파일들의 해시, 렌더링 옵션으로 렌더링 캐시 키를 만듭니다.
+
+    Args:
+        html_text (str): 렌더링할 최종 HTML
+        html_dir (str): 상대 경로 기준 디렉토리 (HTML 파일이 저장되는 결과 디렉토리)
+        options (dict): 렌더링 출력 옵션
+
+    Returns:
+        str: sha256 해시 문자열
+    """
+    digest = hashlib.sha256()
+    digest.update(html_text.encode("utf-8"))
+    for ref in sorted(set(ASSET_REF_PATTERN.findall(html_text))):
+        path = _resolve_asset(ref, html_dir)
+        if path is not None:
+            digest.update(f"\n{ref}:{_file_hash(path)}".encode("utf-8"))
+    # 외부 에셋은 번들 버전으로 구분
+    digest.update(f"\nbundle:{BUNDLE_VERSION}".encode("utf-8"))
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_index(result_path: str) -> dict:
+    try:
+        with open(os.path.join(result_path, INDEX_FILENAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"⚠️ 렌더링 캐시 인덱스 읽기 실패, 새로 만듭니다: {e}")
+        return {}
+
+
+def _manifest_files(manifest: dict) -> list:
+    return [manifest["image"]] + manifest.get("slices", []) + manifest.get("outputs", [])
+
+
+def lookup_render(result_path: str, session_id: str, cache_key: str) -> dict:
+    """
+    같은 캐시 키로 렌더링된 결과가 있으면 새 세션 이름으로 복사한 manifest를 반환합니다.
+    브라우저를 띄우지 않고 파일 복사만 수행합니다.
+
+    Args:
+        result_path (str): 결과 디렉토리 경로
+        session_id (str): 새 상세페이지 세션 ID
+        cache_key (str): render_cache_key()가 반환한 키
+
+    Returns:
+        dict: 새 세션의 manifest (캐시가 없으면 None)
+    """
+    with _index_lock:
+        cached_session = _load_index(result_path).get(cache_key)
+    if not cached_session:
+        return None
+
+    manifest = load_render_manifest(result_path, cached_session)
+    if manifest is None or not all(os.path.isfile(item["path"]) for item in _manifest_files(manifest)):
+        logger.debug(f"🛠️ 렌더링 캐시 파일 누락: {cached_session}")
+        return None
+    if cached_session == session_id:
+        return manifest
+
+    # page_<이전 session_id>... → page_<새 session_id>... 로 복사
+    old_prefix, new_prefix = f"page_{cached_session}", f"page_{session_id}"
+    copied = json.loads(json.dumps(manifest))
+    copied["session_id"] = session_id
+    copied["cached_from"] = cached_session
+    for item in _manifest_files(copied):
+        new_path = os.path.join(os.path.dirname(item["path"]), os.path.basename(item["path"]).replace(old_prefix, new_prefix, 1))
+        shutil.copyfile(item["path"], new_path)
+        item["path"] = new_path
+
+    with open(os.path.join(result_path, f"{new_prefix}.manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(copied, f, ensure_ascii=False, indent=2)
+    logger.info(f"✅ 렌더링 캐시 적중, 브라우저 렌더링 생략: {cached_session} → {session_id}")
+    return copied
+
+
+def store_render(result_path: str, session_id: str, cache_key: str):
+    """
+    렌더링 결과를 캐시 인덱스에 등록합니다.
+
+    Args:
+        result_path (str): 결과 디렉토리 경로
+        session_id (str): 렌더링한 상세페이지 세션 ID
+        cache_key (str): render_cache_key()가 반환한 키
+    """
+    try:
+        with _index_lock:
+            index = _load_index(result_path)
+            # 최근 등록된 항목이 뒤에 오도록 다시 넣고, 상한을 넘으면 앞에서부터 삭제
+            index.pop(cache_key, None)
+            index[cache_key] = session_id
+            for stale in list(index)[:max(0, len(index) - MAX_INDEX_ENTRIES)]:
+                del index[stale]
+            tmp_path = os.path.join(result_path, f"{INDEX_FILENAME}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, os.path.join(result_path, INDEX_FILENAME))
+    except Exception as e:
+        # 캐시 등록 실패는 다음 요청이 다시 렌더링할 뿐이므로 요청을 실패시키지 않음
+        logger.warning(f"⚠️ 렌더링 캐시 등록 실패: {e}")
@@ -0,0 +1,199 @@
+import io
+import json
+import os
+from PIL import Image
+from utils.logger import get_logger
+from utils.config import load_config
+
+logger = get_logger(__name__)
+
+# config.yaml의 render 섹션이 없을 때 사용할 기본값
+DEFAULT_RENDER_OPTIONS = {
+    "format": "png",
+    "quality": 80,
+    "device_scale_factor": 1,
+    # auto: 조각 저장(slice_height > 0) 시 MARKETPLACE_WIDTH, 아니면 DESKTOP_WIDTH
+    "width": "auto",
+    "slice_height": 0,
+    # 같은 페이지에서 추가로 만들 출력 (예: {"name": "mobile", "width": 390, "format": "webp"}, {"name": "pdf", "format": "pdf"})
+    "outputs": [],
+}
+# 데스크톱 캡처 너비 (Playwright 기본 viewport와 같음)
+DESKTOP_WIDTH = 1280
+# 오픈마켓 상세페이지(조각 저장) 너비
+MARKETPLACE_WIDTH = 860
+# format -> (Pillow 포맷명, 확장자)
+IMAGE_FORMATS = {
+    "png": ("PNG", ".png"),
+    "webp": ("WEBP", ".webp"),
+    "jpeg": ("JPEG", ".jpg"),
+}
+# WebP가 지원하는 최대 가로/세로 픽셀
+WEBP_MAX_SIZE = 16383
+
+
+def load_render_options() -> dict:
+    """
+    config.yaml의 render 섹션에서 출력 옵션을 읽어 기본값과 합쳐 반환합니다.
+
+    Returns:
+        dict: format, quality, device_scale_factor, width, slice_height, outputs
+    """
+    render_config = load_config().get("render") or {}
+    options = {key: render_config.get(key, default) for key, default in DEFAULT_RENDER_OPTIONS.items()}
+    if options["width"] in (None, "", "auto", 0):
+        options["width"] = MARKETPLACE_WIDTH if int(options["slice_height"] or 0) > 0 else DESKTOP_WIDTH
+    options["width"] = int(options["width"])
+    options["format"] = str(options["format"]).lower()
+    if options["format"] == "jpg":
+        options["format"] = "jpeg"
+    if options["format"] not in IMAGE_FORMATS:
+        logger.warning(f"⚠️ 지원하지 않는 렌더링 포맷입니다. png로 저장합니다: {options['format']}")
+        options["format"] = "png"
+    options["outputs"] = [_normalize_output(output, options) for output in options["outputs"] or []]
+    return options
+
+
+def _normalize_output(output: dict, options: dict) -> dict:
+    fmt = str(output.get("format", options["format"])).lower()
+    if fmt == "jpg":
+        fmt = "jpeg"
+    if fmt != "pdf" and fmt not in IMAGE_FORMATS:
+        logger.warning(f"⚠️ 지원하지 않는 출력 포맷입니다. png로 저장합니다: {output}")
+        fmt = "png"
+    return {
+        "name": str(output.get("name") or f"{fmt}_{output.get('width', options['width'])}"),
+        "type": "pdf" if fmt == "pdf" else "image",
+        "format": fmt,
+        "width": int(output.get("width", options["width"])),
+        "quality": int(output.get("quality", options["quality"])),
+    }
+
+
+def encode_image(image: Image.Image, fmt: str, quality: int) -> bytes:
+    """
+    Pillow 이미지를 지정한 포맷으로 인코딩합니다.
+
+    Args:
+        image (Image.Image): 인코딩할 이미지
+        fmt (str): "png", "webp", "jpeg"
+        quality (int): WebP/JPEG 품질 (1~100)
+
+    Returns:
+        bytes: 인코딩된 이미지 바이트
+    """
+    pil_format, _ = IMAGE_FORMATS[fmt]
+    buffer = io.BytesIO()
+    if fmt == "png":
+        image.save(buffer, pil_format, optimize=True)
+    elif fmt == "jpeg":
+        image.convert("RGB").save(buffer, pil_format, quality=quality, optimize=True, progressive=True)
+    else:
+        image.save(buffer, pil_format, quality=quality, method=4)
+    return buffer.getvalue()
+
+
+def _write_file(path: str, data: bytes) -> dict:
+    with open(path, "wb") as f:
+        f.write(data)
+    return {"path": path, "bytes": len(data)}
+
+
+def save_render_outputs(captures: dict, result_path: str, session_id: str, options: dict) -> dict:
+    """
+    전체 페이지 PNG 스크린샷을 설정된 포맷으로 저장하고, slice_height가 있으면
+    고정 높이 조각(page_<session_id>_NN)으로 나누어 저장한 뒤 manifest를 기록합니다.
+    추가 출력(다른 뷰포트 너비, PDF)은 page_<session_id>_<출력 이름>으로 저장합니다.
+
+    Args:
+        captures (dict): {"main": 전체 페이지 PNG, 출력 이름: PNG 또는 PDF 바이트}
+        result_path (str): 결과 디렉토리 경로
+        session_id (str): 상세페이지 세션 ID
+        options (dict): load_render_options()가 반환한 출력 옵션
+
+    Returns:
+        dict: 저장된 파일 목록과 옵션이 담긴 manifest
+    """
+    png_bytes = captures["main"]
+    fmt, quality = options["format"], options["quality"]
+    image = Image.open(io.BytesIO(png_bytes))
+    image.load()
+    width, height = image.size
+
+    # 전체 페이지 이미지 (WebP 최대 크기를 넘으면 PNG로 저장)
+    main_format = fmt
+    if fmt == "webp" and max(width, height) > WEBP_MAX_SIZE:
+        logger.warning(f"⚠️ 페이지 높이({height}px)가 WebP 최대 크기를 넘어 전체 이미지는 PNG로 저장합니다")
+        main_format = "png"
+    main_path = os.path.join(result_path, f"page_{session_id}{IMAGE_FORMATS[main_format][1]}")
+    if main_format == "png" and fmt == "png":
+        main_file = _write_file(main_path, png_bytes)
+    else:
+        main_file = _write_file(main_path, encode_image(image, main_format, quality))
+    main_file.update({"width": width, "height": height, "format": main_format})
+
+    # 고정 높이 조각 (slice_height는 CSS 픽셀 기준이므로 device_scale_factor를 곱함)
+    slices = []
+    slice_height = int(options["slice_height"] or 0) * options["device_scale_factor"]
+    if slice_height > 0:
+        ext = IMAGE_FORMATS[fmt][1]
+        for index, top in enumerate(range(0, height, int(slice_height)), start=1):
+            bottom = min(top + int(slice_height), height)
+            piece = image.crop((0, top, width, bottom))
+            slice_path = os.path.join(result_path, f"page_{session_id}_{index:02d}{ext}")
+            slice_file = _write_file(slice_path, encode_image(piece, fmt, quality))
+            slice_file.update({"width": width, "height": bottom - top, "format": fmt})
+            slices.append(slice_file)
+
+    # 추가 출력 (다른 뷰포트 너비 스크린샷, PDF)
+    outputs = []
+    for output in options.get("outputs", []):
+        data = captures.get(output["name"])
+        if data is None:
+            continue
+        if output["type"] == "pdf":
+            output_path = os.path.join(result_path, f"page_{session_id}_{output['name']}.pdf")
+            output_file = _write_file(output_path, data)
+        else:
+            output_image = Image.open(io.BytesIO(data))
+            output_path = os.path.join(result_path, f"page_{session_id}_{output['name']}{IMAGE_FORMATS[output['format']][1]}")
+            output_file = _write_file(output_path, encode_image(output_image, output["format"], output["quality"]))
+            output_file.update({"width": output_image.width, "height": output_image.height})
+        output_file.update({"name": output["name"], "format": output["format"]})
+        outputs.append(output_file)
+
+    manifest = {
+        "session_id": session_id,
+        "options": options,
+        "image": main_file,
+        "slices": slices,
+        "outputs": outputs,
+        "total_bytes": main_file["bytes"] + sum(item["bytes"] for item in slices + outputs),
+        "screenshot_bytes": len(png_bytes),
+    }
+    with open(os.path.join(result_path, f"page_{session_id}.manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    logger.info(
+        f"✅ 렌더링 결과 저장 완료: {main_file['format']} {width}x{height}, 조각 {len(slices)}개, 추가 출력 {len(outputs)}개, "
+        f"{manifest['total_bytes'] / 1024:.0f}KB (원본 PNG {len(png_bytes) / 1024:.0f}KB)"
+    )
+    return manifest
+
+
+def load_render_manifest(result_path: str, session_id: str) -> dict:
+    """
+    세션의 렌더링 manifest를 읽습니다.
+
+    Args:
+        result_path (str): 결과 디렉토리 경로
+        session_id (str): 상세페이지 세션 ID
+
+    Returns:
+        dict: manifest (없으면 None)
+    """
+    try:
+        with open(os.path.join(result_path, f"page_{session_id}.manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
@@ -18,6 +18,8 @@ from backend.competitor_analysis.competitor_main import competitor_main
 from backend.image_generator.image_generator_main import ImgGenPipeline
 from backend.text_generator.text_generator_main import text_generator_main
 from backend.page_generator.page_generator_main import page_generator_main
+from backend.page_generator.render_output import load_render_manifest
+from backend.text_generator.progress import get_progress
 
 logger = get_logger(__name__)
 
@@ -516,13 +518,18 @@ async def receive_product_info(
     description="선택된 이미지 및 분석 데이터를 기반으로 텍스트 생성과 HTML 상세페이지를 생성하며, session_id를 반환합니다."
 )
 def generate_detail_page(
-    product: Dict[str, Any] = Body(...)
+    product: Dict[str, Any] = Body(...),
+    force_regenerate: bool = Query(False, description="true면 텍스트 입력이 같은 이전 페이지를 재사용하지 않고 새로 생성"),
+    stream: bool = Query(True, description="true면 생성 중인 HTML을 파일에 이어 쓰고 /output/progress로 진행 상태를 게시")
 ) -> Dict[str, Any]:
     """
     차별점/선택이미지 포함 product dict → 텍스트/상세페이지 생성 + session_id 추가
     """
-    logger.debug("🛠️ generate_detail_page 진입")
+    logger.debug(f"🛠️ generate_detail_page 진입 (force_regenerate={force_regenerate}, stream={stream})")
     try:
+        if force_regenerate:
+            product["force_regenerate"] = True
+        product["stream"] = stream
         # text_generator_main은 product 딕셔너리 전체를 반환하고, session_id가 추가됨
         updated_product = text_generator_main(product)
         session_id = updated_product.get("session_id")
@@ -542,6 +549,22 @@ def generate_detail_page(
         logger.error(f"❌ generate_detail_page 예외: {e}")
         return {"success": False, "error": str(e)}
 
+@output_router.get(
+    "/progress",
+    summary="상세페이지 생성 진행 상태 조회",
+    description="session_id 또는 user_session_id로 스트리밍 생성 중인 상세페이지의 진행 상태(status, 생성된 글자 수, HTML 경로)를 반환합니다."
+)
+async def get_generation_progress(
+    session_id: str = Query(..., description="상세페이지 session_id 또는 user_session_id")
+):
+    """
+    스트리밍 생성 진행 상태 반환 (생성 중인 HTML 파일은 html_path에서 바로 미리보기 가능)
+    """
+    progress = get_progress(session_id)
+    if progress is None:
+        return JSONResponse({"success": False, "error": "진행 상태 없음"}, status_code=404)
+    return {"success": True, "data": progress}
+
 @output_router.get(
     "/path",
     summary="생성된 상세페이지 경로 조회",
@@ -558,23 +581,29 @@ async def get_detail_page(
     result_dir = "backend/data/result"
     html_path = os.path.join(result_dir, f"page_{session_id}.html")
     image_path = os.path.join(result_dir, f"page_{session_id}.png")
+    manifest = load_render_manifest(result_dir, session_id)
+    if manifest:
+        image_path = os.path.join(result_dir, os.path.basename(manifest["image"]["path"]))
     if not os.path.isfile(html_path) or not os.path.isfile(image_path):
         logger.warning(f"⚠️ 결과 파일 없음: {html_path}, {image_path}")
         return JSONResponse({"success": False, "error": "상세페이지 결과 없음"}, status_code=404)
     return {
         "success": True,
         "html_path": html_path,
-        "image_path": image_path
+        "image_path": image_path,
+        "image_slices": [
+            os.path.join(result_dir, os.path.basename(item["path"])) for item in manifest["slices"]
+        ] if manifest else []
     }
 
 @output_router.get(
     "/download",
     summary="상세페이지 파일 다운로드",
-    description="session_id와 파일 타입(html 또는 png)을 기반으로 생성된 상세페이지 결과물을 다운로드합니다."
+    description="session_id와 파일 타입(html, png 또는 config의 추가 출력 이름/포맷 예: pdf)을 기반으로 생성된 상세페이지 결과물을 다운로드합니다."
 )
 async def download_detail_file(
     product: Dict[str, Any] = Body(...),
-    file_type: str = Query(..., description="html 또는 png")
+    file_type: str = Query(..., description="html, png 또는 추가 출력 이름/포맷 (예: mobile, pdf)")
 ):
     """
     session_id 기반 상세페이지 파일 다운로드 (html/png)
@@ -583,6 +612,15 @@ async def download_detail_file(
     result_dir = "backend/data/result"
     ext = ".html" if file_type == "html" else ".png"
     file_path = os.path.join(result_dir, f"page_{session_id}{ext}")
+    manifest = load_render_manifest(result_dir, session_id)
+    if file_type != "html" and manifest:
+        # 렌더링 포맷이 png가 아닐 수 있으므로 manifest의 대표 이미지를 사용
+        # 추가 출력(mobile, pdf 등)은 출력 이름이나 포맷으로 지정
+        file_path = os.path.join(result_dir, os.path.basename(manifest["image"]["path"]))
+        for output in manifest.get("outputs", []):
+            if file_type in (output["name"], output["format"]):
+                file_path = os.path.join(result_dir, os.path.basename(output["path"]))
+                break
     if not os.path.isfile(file_path):
         return JSONResponse({"success": False, "error": f"{file_type} 파일 없음"}, status_code=404)
     return FileResponse(file_path, filename=os.path.basename(file_path))
\ No newline at end of file
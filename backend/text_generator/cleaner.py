@@ -34,4 +34,69 @@ def clean_response(html_text: str, strict: bool = False) -> str:
             return trimmed
         return html_text
     
-    return html_text
\ No newline at end of file
+    return html_text
+
+class StreamingHtmlCleaner:
+    """
+    clean_response()의 스트리밍 버전.
+    응답 조각(chunk)을 순서대로 받아, 앞뒤 마크다운 코드 블록(```html, ```)을 제거한 텍스트만 즉시 반환합니다.
+    앞쪽 코드 블록 여부를 판단할 때까지, 그리고 닫는 ``` 후보가 될 수 있는 끝부분은 잠시 보류합니다.
+    """
+
+    FENCES = ("```html", "```")
+
+    def __init__(self):
+        self._head = ""
+        self._head_done = False
+        self._tail = ""
+
+    def feed(self, chunk: str) -> str:
+        """
+        새 응답 조각을 넣고, 지금 확정적으로 출력할 수 있는 텍스트를 반환합니다.
+
+        Args:
+            chunk (str): 스트리밍 응답 조각
+
+        Returns:
+            str: 출력 가능한 정제 텍스트 (없으면 빈 문자열)
+        """
+        if not chunk:
+            return ""
+
+        if not self._head_done:
+            self._head += chunk
+            text = self._head.lstrip()
+            # 여는 코드 블록 여부를 아직 판단할 수 없으면 보류
+            if any(fence.startswith(text) for fence in self.FENCES):
+                return ""
+            for fence in self.FENCES:
+                if text.startswith(fence):
+                    text = text[len(fence):]
+                    break
+            text = text.lstrip()
+            if not text:
+                return ""
+            self._head_done = True
+            chunk = text
+
+        pending = self._tail + chunk
+        # 닫는 ``` 후보(끝의 공백/백틱)는 다음 조각이 올 때까지 보류
+        match = re.search(r"[\s`]*$", pending)
+        self._tail = pending[match.start():]
+        return pending[:match.start()]
+
+    def finish(self) -> str:
+        """
+        스트림 종료 시 보류 중이던 끝부분을 정리해 반환합니다.
+
+        Returns:
+            str: 남은 정제 텍스트
+        """
+        if not self._head_done:
+            return clean_response(self._head)
+
+        tail = self._tail.rstrip()
+        if tail.endswith("```"):
+            tail = tail[:-3].rstrip()
+        self._tail = ""
+        return tail
@@ -0,0 +1,138 @@
+import json
+from typing import Callable, Optional
+from openai import OpenAI
+from backend.page_generator.apply_template import render_content_template, DEFAULT_TEMPLATE
+from backend.text_generator.prompt_builder import *
+from backend.text_generator.section_generator import IMAGE_SLOTS, EXTRA_IMAGE_SLOT
+from backend.text_generator.text_generator import to_html_image_path, log_openai_usage
+from utils.logger import get_logger
+from utils.config import get_openai_api_key
+
+logger = get_logger(__name__)
+
+# 리스트여야 하는 콘텐츠 키 (모델이 다른 타입을 주면 빈 리스트로 대체)
+LIST_KEYS = ["keywords", "problems", "features", "plan", "success", "failure", "reviews", "faq", "image_alts"]
+
+
+def content_system_prompt() -> str:
+    """
+    구조화 콘텐츠 생성 요청이 공유하는 정적 system 프롬프트를 반환합니다. (상품 정보 미포함)
+    """
+    return "\n".join([
+        content_json_prompt(),
+        natural_tone_prompt(),
+        keyword_variation_prompt(),
+        quantitative_prompt(),
+        expert_quote_prompt(),
+    ])
+
+
+def build_content_prompt(product: dict) -> str:
+    """
+    상품 정보, 차별점, 이미지 개수 등 요청마다 달라지는 프롬프트를 생성합니다.
+
+    Args:
+        product (dict): 제품 정보 딕셔너리
+
+    Returns:
+        str: 상품별 프롬프트 문자열
+    """
+    prompt_parts = [product_schema_prompt(product)]
+
+    if product.get("differences"):
+        prompt_parts.append("\n".join([
+            "이 상품은 경쟁사 대비 다음과 같은 차별점을 가지고 있습니다:",
+            *[f"- {item}" for item in product["differences"]],
+            "위 차별점들을 문구에서 자연스럽게 강조해 주세요."
+        ]))
+
+    image_count = len(product.get("image_path_list", []))
+    prompt_parts.append(f"image_alts는 이미지 {image_count}개에 대해 순서대로 작성해주세요.")
+    return "\n".join(prompt_parts)
+
+
+def normalize_content(content: dict) -> dict:
+    """
+    모델이 생성한 콘텐츠의 타입을 템플릿에서 안전하게 쓸 수 있도록 정리합니다.
+
+    Args:
+        content (dict): 모델이 생성한 JSON 콘텐츠
+
+    Returns:
+        dict: 정리된 콘텐츠
+    """
+    for key in LIST_KEYS:
+        if not isinstance(content.get(key), list):
+            content[key] = []
+    for key in ["guide", "expert_quote", "jsonld"]:
+        if not isinstance(content.get(key), dict):
+            content[key] = {}
+    return content
+
+
+def assign_template_images(image_paths: list, alts: list, product: dict) -> dict:
+    """
+    이미지 목록을 템플릿 섹션별로 나누고 alt 문구를 붙입니다.
+
+    Args:
+        image_paths (list): 이미지 경로 리스트
+        alts (list): 이미지 순서대로 생성된 alt 문구 리스트
+        product (dict): 제품 정보 딕셔너리 (alt 기본값용)
+
+    Returns:
+        dict: 섹션 키 -> [{"src": ..., "alt": ...}] 리스트
+    """
+    images = {"hero": [], "guide": [], "product": []}
+    for i, path in enumerate(image_paths or []):
+        key = IMAGE_SLOTS[i] if i < len(IMAGE_SLOTS) else EXTRA_IMAGE_SLOT
+        alt = alts[i] if i < len(alts) and isinstance(alts[i], str) else f"{product['brand']} {product['name']}"
+        images[key].append({"src": to_html_image_path(path), "alt": alt})
+    return images
+
+
+def generate_template(product: dict, stream_callback: Optional[Callable[[str], None]] = None) -> dict:
+    """
+    OpenAI로 상세페이지 문구만 JSON으로 생성하고, 버전별 Jinja2 템플릿으로 렌더링합니다.
+    HTML 마크업과 스타일은 템플릿이 담당하므로 출력 토큰이 크게 줄고 레이아웃이 일정해집니다.
+    템플릿은 product["template"]로 지정합니다. (기본값: story_v1)
+
+    Args:
+        product (dict): 상세페이지 생성에 필요한 제품 정보가 담긴 딕셔너리
+        stream_callback (Callable[[str], None], optional): 렌더링된 HTML을 받을 콜백
+
+    Returns:
+        dict: 렌더링된 상세페이지 HTML과 생성된 콘텐츠가 포함된 딕셔너리
+    """
+    client = OpenAI(api_key=get_openai_api_key())
+    template = product.get("template", DEFAULT_TEMPLATE)
+
+    logger.info(f"🛠️ OpenAI 구조화 콘텐츠 요청 시작 (template={template})")
+    try:
+        response = client.chat.completions.create(
+            model="gpt-4.1-mini",
+            messages=[
+                {"role": "system", "content": content_system_prompt()},
+                {"role": "user", "content": build_content_prompt(product)},
+            ],
+            temperature=0.9,
+            response_format={"type": "json_object"}
+        )
+        logger.info("✅ OpenAI API 응답 수신 완료")
+    except Exception as e:
+        raise RuntimeError(f"❌ OpenAI API 요청 실패: {e}")
+
+    log_openai_usage(response, "구조화 콘텐츠 생성")
+
+    try:
+        content = normalize_content(json.loads(response.choices[0].message.content))
+    except (json.JSONDecodeError, TypeError) as e:
+        raise RuntimeError(f"❌ 구조화 콘텐츠 JSON 파싱 실패: {e}")
+
+    images = assign_template_images(product.get("image_path_list", []), content["image_alts"], product)
+    html_text = render_content_template(content, product, images, template=template)
+    logger.info(f"✅ 템플릿 렌더링 완료: {template}")
+
+    if stream_callback:
+        stream_callback(html_text)
+
+    return {"html_text": html_text, "content": content}
@@ -0,0 +1,119 @@
+import torch
+from transformers import DynamicCache, StoppingCriteria
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HTML_END_TAG = "</html>"
+
+
+class HtmlEndStoppingCriteria(StoppingCriteria):
+    """
+    생성된 토큰에 닫는 </html> 태그가 등장하면 생성을 중단시키는 StoppingCriteria.
+
+    프롬프트 안에도 "</html>" 문자열이 포함되어 있으므로, 프롬프트 이후에 생성된
+    토큰의 마지막 일부(window)만 디코딩해서 검사합니다.
+    """
+
+    def __init__(self, tokenizer, prompt_length: int, window: int = 8):
+        """
+        Args:
+            tokenizer: 디코딩에 사용할 토크나이저
+            prompt_length (int): 입력 프롬프트의 토큰 길이 (패딩 포함)
+            window (int): 검사할 마지막 토큰 개수
+        """
+        self.tokenizer = tokenizer
+        self.prompt_length = prompt_length
+        self.window = window
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        start = max(self.prompt_length, input_ids.shape[1] - self.window)
+        tails = self.tokenizer.batch_decode(input_ids[:, start:], skip_special_tokens=True)
+        is_done = [HTML_END_TAG in tail.lower() for tail in tails]
+        return torch.tensor(is_done, dtype=torch.bool, device=input_ids.device)
+
+
+def truncate_after_html_end(text: str) -> str:
+    """
+    텍스트에서 첫 번째 </html> 태그 이후의 내용을 잘라냅니다.
+
+    Args:
+        text (str): 생성된 텍스트
+
+    Returns:
+        str: </html>까지만 남긴 텍스트 (태그가 없으면 원본 그대로)
+    """
+    end = text.lower().find(HTML_END_TAG)
+    if end == -1:
+        return text
+    return text[:end + len(HTML_END_TAG)]
+
+
+class PrefixKVCache:
+    """
+    모든 요청이 공유하는 정적 프롬프트 prefix의 KV 캐시.
+
+    prefix는 한 번만 prefill하고, 이후 요청에서는 배치 크기만큼 복제한 캐시를
+    generate()의 past_key_values로 넘겨 상품별 suffix만 prefill하도록 합니다.
+    """
+
+    def __init__(self, model, tokenizer, prefix_text: str):
+        """
+        Args:
+            model: HuggingFace causal LM 모델
+            tokenizer: 모델 토크나이저
+            prefix_text (str): 모든 프롬프트 앞에 공통으로 붙는 정적 텍스트
+        """
+        self.prefix_text = prefix_text
+        self.input_ids = tokenizer(prefix_text, return_tensors="pt")["input_ids"].to(model.device)
+
+        logger.debug(f"🛠️ 공통 prefix KV 캐시 계산 시작: {self.input_ids.shape[1]} 토큰")
+        with torch.no_grad():
+            outputs = model(input_ids=self.input_ids, use_cache=True)
+        past = outputs.past_key_values
+        self.legacy_cache = past.to_legacy_cache() if hasattr(past, "to_legacy_cache") else past
+        logger.info(f"✅ 공통 prefix KV 캐시 준비 완료: {self.length} 토큰")
+
+    @property
+    def length(self) -> int:
+        return self.input_ids.shape[1]
+
+    def build(self, batch_size: int) -> DynamicCache:
+        """
+        배치 크기에 맞춰 prefix 캐시를 복제한 DynamicCache를 반환합니다.
+        generate()가 캐시를 확장해도 원본 prefix 캐시는 변하지 않습니다.
+
+        Args:
+            batch_size (int): 배치 크기
+
+        Returns:
+            DynamicCache: generate()에 past_key_values로 전달할 캐시
+        """
+        return DynamicCache.from_legacy_cache(tuple(
+            (
+                key.expand(batch_size, -1, -1, -1).contiguous(),
+                value.expand(batch_size, -1, -1, -1).contiguous(),
+            )
+            for key, value in self.legacy_cache
+        ))
+
+    def prepend(self, input_ids: torch.LongTensor, attention_mask: torch.LongTensor):
+        """
+        left padding된 suffix 배치 앞에 prefix 토큰을 붙입니다.
+        패딩이 prefix와 suffix 사이에 위치하지만 attention_mask로 가려지고,
+        position id는 attention_mask 누적합으로 계산되므로 suffix 위치가 prefix에 바로 이어집니다.
+
+        Args:
+            input_ids (torch.LongTensor): (batch, suffix_len) suffix 토큰
+            attention_mask (torch.LongTensor): (batch, suffix_len) suffix 마스크
+
+        Returns:
+            tuple: (prefix가 붙은 input_ids, prefix가 붙은 attention_mask)
+        """
+        batch_size = input_ids.shape[0]
+        prefix_ids = self.input_ids.expand(batch_size, -1)
+        prefix_mask = torch.ones_like(prefix_ids, dtype=attention_mask.dtype)
+        return (
+            torch.cat([prefix_ids, input_ids], dim=1),
+            torch.cat([prefix_mask, attention_mask], dim=1),
+        )
@@ -0,0 +1,331 @@
+import threading
+import time
+import torch
+from typing import Callable, List, Optional
+from transformers import StoppingCriteriaList
+from transformers.generation.streamers import BaseStreamer
+from backend.text_generator.hf_generation import HTML_END_TAG, HtmlEndStoppingCriteria, PrefixKVCache, truncate_after_html_end
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GenerationRequest:
+    """
+    생성 서버에 제출된 단일 프롬프트 요청.
+    호출자는 wait()으로 결과를 기다리고, stream_callback으로 텍스트 조각을 실시간으로 받습니다.
+    """
+
+    def __init__(self, prompt_ids: List[int], stream_callback: Optional[Callable[[str], None]] = None):
+        self.prompt_ids = prompt_ids
+        self.stream_callback = stream_callback
+        self.enqueued_at = time.perf_counter()
+        self.queue_wait = 0.0
+        self.chunks = []
+        self.error = None
+        self._done = threading.Event()
+
+    def emit(self, text: str):
+        """새로 디코딩된 텍스트 조각을 누적하고 콜백으로 전달합니다."""
+        if not text:
+            return
+        self.chunks.append(text)
+        if self.stream_callback:
+            try:
+                self.stream_callback(text)
+            except Exception as e:
+                logger.warning(f"⚠️ 스트리밍 콜백 오류: {type(e).__name__}: {e!r}")
+
+    def finish(self, error: Exception = None):
+        self.error = error
+        self._done.set()
+
+    def wait(self, timeout: float = None) -> str:
+        """
+        생성이 끝날 때까지 대기한 뒤 생성된 전체 텍스트를 반환합니다.
+
+        Raises:
+            TimeoutError: timeout 내에 생성이 끝나지 않은 경우
+            RuntimeError: 생성 중 오류가 발생한 경우
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError("❌ HuggingFace 생성 대기 시간 초과")
+        if self.error:
+            raise RuntimeError(f"❌ HuggingFace 배치 생성 실패: {self.error}")
+        return "".join(self.chunks)
+
+
+class BatchTextStreamer(BaseStreamer):
+    """
+    배치 generate()의 새 토큰을 행(row)별로 디코딩해 각 요청으로 전달하는 스트리머.
+    </html>이 생성된 행은 이후 토큰(패딩 포함)을 더 이상 전달하지 않습니다.
+    """
+
+    def __init__(self, tokenizer, requests: List[GenerationRequest]):
+        self.tokenizer = tokenizer
+        self.requests = requests
+        self.token_cache = [[] for _ in requests]
+        self.printed_len = [0] * len(requests)
+        self.finished = [False] * len(requests)
+        self.generated_tokens = 0
+        self._prompt_skipped = False
+
+    def put(self, value):
+        # 첫 호출은 프롬프트 토큰이므로 건너뜀
+        if not self._prompt_skipped:
+            self._prompt_skipped = True
+            return
+
+        tokens = value.view(-1).tolist()
+        for i, token_id in enumerate(tokens):
+            if self.finished[i]:
+                continue
+            self.generated_tokens += 1
+            self.token_cache[i].append(token_id)
+            text = self.tokenizer.decode(self.token_cache[i], skip_special_tokens=True)
+
+            if HTML_END_TAG in text.lower():
+                self._flush_row(i, truncate_after_html_end(text))
+                self.finished[i] = True
+            elif text.endswith("\n"):
+                self._flush_row(i, text)
+                self.token_cache[i] = []
+                self.printed_len[i] = 0
+            elif not text.endswith("�"):
+                # 멀티바이트 문자가 완성된 경우에만 출력
+                self._flush_row(i, text)
+
+    def end(self):
+        for i in range(len(self.requests)):
+            if self.finished[i] or not self.token_cache[i]:
+                continue
+            text = self.tokenizer.decode(self.token_cache[i], skip_special_tokens=True)
+            self._flush_row(i, text)
+            self.finished[i] = True
+
+    def _flush_row(self, i: int, text: str):
+        self.requests[i].emit(text[self.printed_len[i]:])
+        self.printed_len[i] = len(text)
+
+
+class HFGenerationServer:
+    """
+    로컬 HuggingFace 모델용 동적 배치 생성 서버.
+
+    여러 요청 스레드가 제출한 프롬프트를 큐에 모았다가, 토큰 길이가 비슷한 요청끼리
+    묶어(left padding) 한 번의 generate()로 처리하고, 결과는 요청별로 스트리밍합니다.
+    prefix_text가 주어지면 그 KV 캐시를 한 번만 계산해 재사용하며,
+    이때 submit()에는 prefix 뒤에 이어지는 나머지 프롬프트만 전달합니다.
+    """
+
+    def __init__(
+        self,
+        model,
+        tokenizer,
+        max_batch_size: int = 4,
+        max_wait_ms: int = 50,
+        length_ratio: float = 1.5,
+        max_input_tokens: int = None,
+        prefix_text: str = None,
+        generate_kwargs: dict = None
+    ):
+        """
+        Args:
+            model: generate()를 지원하는 HuggingFace 모델
+            tokenizer: 모델 토크나이저
+            max_batch_size (int): 한 배치의 최대 요청 수
+            max_wait_ms (int): 첫 요청 도착 후 배치를 채우기 위해 기다리는 최대 시간(ms)
+            length_ratio (float): 같은 배치로 묶을 수 있는 프롬프트 길이 비율 상한 (패딩 낭비 제한)
+            max_input_tokens (int, optional): prefix를 포함한 프롬프트 최대 토큰 수 (초과 시 suffix 앞부분부터 truncation)
+            prefix_text (str, optional): 모든 프롬프트가 공유하는 정적 prefix (KV 캐시 재사용 대상)
+            generate_kwargs (dict, optional): generate()에 전달할 샘플링 옵션
+        """
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.length_ratio = length_ratio
+        self.max_input_tokens = max_input_tokens
+        self.prefix_text = prefix_text
+        self.prefix_cache = None
+        self.generate_kwargs = generate_kwargs or {}
+
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token_id is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+
+        self._pending = []
+        self._cond = threading.Condition()
+        self._running = False
+        self._worker = None
+        self.stats = {"batches": 0, "requests": 0, "generated_tokens": 0, "generate_seconds": 0.0}
+
+    def start(self):
+        """워커 스레드를 시작합니다."""
+        if self._running:
+            return
+        if self.prefix_text and self.prefix_cache is None:
+            self.prefix_cache = PrefixKVCache(self.model, self.tokenizer, self.prefix_text)
+        with self._cond:
+            self._running = True
+        self._worker = threading.Thread(target=self._worker_loop, name="hf-generation-server", daemon=True)
+        self._worker.start()
+        logger.info(f"✅ HuggingFace 배치 생성 서버 시작 (max_batch_size={self.max_batch_size}, max_wait_ms={self.max_wait * 1000:.0f})")
+
+    def stop(self):
+        """워커 스레드를 종료합니다. 대기 중인 요청은 오류로 종료됩니다."""
+        with self._cond:
+            self._running = False
+            pending, self._pending = self._pending, []
+            self._cond.notify_all()
+        for request in pending:
+            request.finish(RuntimeError("생성 서버가 종료되었습니다"))
+        logger.info("✅ HuggingFace 배치 생성 서버 종료")
+
+    def submit(self, prompt: str, stream_callback: Optional[Callable[[str], None]] = None) -> GenerationRequest:
+        """
+        프롬프트를 큐에 등록하고 요청 객체를 반환합니다.
+
+        Args:
+            prompt (str): 생성 프롬프트 (prefix_text가 설정된 경우 prefix 이후 부분)
+            stream_callback (Callable[[str], None], optional): 생성된 텍스트 조각을 받을 콜백
+
+        Returns:
+            GenerationRequest: wait()으로 결과를 받을 수 있는 요청 객체
+        """
+        prompt_ids = self.tokenizer(prompt)["input_ids"]
+        max_suffix_tokens = self.max_suffix_tokens()
+        if max_suffix_tokens and len(prompt_ids) > max_suffix_tokens:
+            # 프롬프트 끝의 생성 시작 지시("<!DOCTYPE html>")가 잘리지 않도록 앞쪽을 잘라냄
+            logger.warning(f"⚠️ 프롬프트 토큰 예산 초과로 앞부분 축소: {len(prompt_ids)} → {max_suffix_tokens}")
+            prompt_ids = prompt_ids[-max_suffix_tokens:]
+
+        request = GenerationRequest(prompt_ids, stream_callback)
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("❌ HuggingFace 생성 서버가 실행 중이 아닙니다")
+            self._pending.append(request)
+            self._cond.notify_all()
+        logger.debug(f"🛠️ 생성 요청 등록: 프롬프트 {len(prompt_ids)} 토큰, 대기열 {len(self._pending)}건")
+        return request
+
+    def max_suffix_tokens(self) -> Optional[int]:
+        """
+        submit()에 전달할 수 있는 프롬프트 최대 토큰 수 (max_input_tokens에서 캐시된 prefix 길이를 뺀 값).
+        """
+        if not self.max_input_tokens:
+            return None
+        prefix_length = self.prefix_cache.length if self.prefix_cache is not None else 0
+        return max(1, self.max_input_tokens - prefix_length)
+
+    def generate(self, prompt: str, stream_callback: Optional[Callable[[str], None]] = None, timeout: float = None) -> str:
+        """submit() 후 결과를 기다려 생성된 텍스트를 반환합니다."""
+        return self.submit(prompt, stream_callback).wait(timeout)
+
+    def get_stats(self) -> dict:
+        """누적 처리량 통계를 반환합니다."""
+        with self._cond:
+            stats = dict(self.stats)
+        seconds = stats["generate_seconds"]
+        stats["tokens_per_second"] = stats["generated_tokens"] / seconds if seconds else 0.0
+        stats["avg_batch_size"] = stats["requests"] / stats["batches"] if stats["batches"] else 0.0
+        return stats
+
+    def _next_batch(self) -> List[GenerationRequest]:
+        with self._cond:
+            while self._running and not self._pending:
+                self._cond.wait()
+            if not self._running:
+                return []
+
+            # 배치를 채우기 위해 잠시 대기
+            deadline = time.perf_counter() + self.max_wait
+            while len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            # 가장 오래 기다린 요청을 기준으로 길이가 비슷한 요청끼리 묶음
+            anchor = self._pending[0]
+            anchor_len = len(anchor.prompt_ids)
+            candidates = sorted(
+                self._pending[1:],
+                key=lambda r: abs(len(r.prompt_ids) - anchor_len)
+            )
+            batch = [anchor]
+            for request in candidates:
+                if len(batch) >= self.max_batch_size:
+                    break
+                lengths = (len(request.prompt_ids), anchor_len)
+                if max(lengths) <= min(lengths) * self.length_ratio:
+                    batch.append(request)
+
+            batch_ids = {id(r) for r in batch}
+            self._pending = [r for r in self._pending if id(r) not in batch_ids]
+            return batch
+
+    def _worker_loop(self):
+        while self._running:
+            batch = self._next_batch()
+            if not batch:
+                continue
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                logger.error(f"❌ 배치 생성 실패: {type(e).__name__}: {e!r}")
+                for request in batch:
+                    request.finish(e)
+
+    def _run_batch(self, batch: List[GenerationRequest]):
+        started = time.perf_counter()
+        for request in batch:
+            request.queue_wait = started - request.enqueued_at
+
+        padded = self.tokenizer.pad(
+            {"input_ids": [r.prompt_ids for r in batch]},
+            padding=True,
+            return_tensors="pt"
+        )
+        input_ids = padded["input_ids"].to(self.model.device)
+        attention_mask = padded["attention_mask"].to(self.model.device)
+
+        generate_kwargs = dict(self.generate_kwargs)
+        if self.prefix_cache is not None:
+            # 공통 prefix는 캐시를 재사용하고 suffix만 prefill
+            input_ids, attention_mask = self.prefix_cache.prepend(input_ids, attention_mask)
+            generate_kwargs["past_key_values"] = self.prefix_cache.build(len(batch))
+        prompt_length = input_ids.shape[1]
+
+        streamer = BatchTextStreamer(self.tokenizer, batch)
+        stopping_criteria = StoppingCriteriaList([HtmlEndStoppingCriteria(self.tokenizer, prompt_length)])
+
+        with torch.no_grad():
+            self.model.generate(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                pad_token_id=self.tokenizer.pad_token_id,
+                stopping_criteria=stopping_criteria,
+                streamer=streamer,
+                **generate_kwargs
+            )
+
+        elapsed = time.perf_counter() - started
+        for request in batch:
+            request.finish()
+
+        # get_stats()는 요청 스레드에서 호출되므로 lock 안에서 갱신
+        with self._cond:
+            self.stats["batches"] += 1
+            self.stats["requests"] += len(batch)
+            self.stats["generated_tokens"] += streamer.generated_tokens
+            self.stats["generate_seconds"] += elapsed
+
+        max_wait = max(r.queue_wait for r in batch)
+        tokens_per_second = streamer.generated_tokens / elapsed if elapsed else 0.0
+        logger.info(
+            f"✅ 배치 생성 완료: batch_size={len(batch)}, prompt_len={prompt_length}, "
+            f"cached_prefix={self.prefix_cache.length if self.prefix_cache else 0}, "
+            f"queue_wait_max={max_wait:.2f}s, tokens={streamer.generated_tokens}, "
+            f"{elapsed:.1f}s, {tokens_per_second:.1f} tokens/s"
+        )
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from backend.page_generator.apply_template import render_content_template, DEFAULT_TEMPLATE
+from backend.page_generator.html_store import get_recent_html
+from backend.text_generator.content_generator import assign_template_images
+from backend.text_generator.text_generator import to_html_image_path
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = "page_index.json"
+# 인덱스에 보관할 최대 항목 수 (가장 오래 갱신되지 않은 항목부터 삭제)
+MAX_INDEX_ENTRIES = 500
+# 텍스트 생성 결과에 영향을 주는 입력 (이미지는 제외)
+TEXT_INPUT_KEYS = ["engine", "mode", "template", "name", "category", "brand", "price", "features", "differences"]
+
+IMG_TAG_PATTERN = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+SRC_ATTR_PATTERN = re.compile(r'(\ssrc\s*=\s*)(["\'])(.*?)\2', re.IGNORECASE | re.DOTALL)
+
+_index_lock = threading.Lock()
+
+
+def text_input_key(product: dict) -> str:
+    """
+    상품 텍스트 입력(상품 정보, 차별점, 엔진/모드)의 해시를 반환합니다.
+    이미지가 바뀌어도 이 값이 같으면 기존 페이지를 재사용할 수 있습니다.
+
+    Args:
+        product (dict): 제품 정보 딕셔너리
+
+    Returns:
+        str: sha256 해시 문자열
+    """
+    text_inputs = {key: product.get(key) for key in TEXT_INPUT_KEYS}
+    text_inputs["engine"] = text_inputs["engine"] or "openai"
+    text_inputs["mode"] = text_inputs["mode"] or "full"
+    encoded = json.dumps(text_inputs, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _meta_path(result_path: str, session_id: str) -> str:
+    return os.path.join(result_path, f"page_{session_id}.meta.json")
+
+
+def _write_json(path: str, data: dict):
+    # 다른 요청이 읽는 도중 깨진 파일을 보지 않도록 임시 파일에 쓰고 교체
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _load_index(result_path: str) -> dict:
+    try:
+        with open(os.path.join(result_path, INDEX_FILENAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"⚠️ 페이지 인덱스 읽기 실패, 새로 만듭니다: {e}")
+        return {}
+
+
+def save_page_meta(result_path: str, session_id: str, product: dict, content: dict = None, reused_from: str = None):
+    """
+    생성된 페이지의 입력 정보를 page_<session_id>.meta.json으로 저장하고,
+    텍스트 입력 해시 → session_id 인덱스를 갱신합니다.
+
+    Args:
+        result_path (str): 결과 디렉토리 경로
+        session_id (str): 상세페이지 세션 ID
+        product (dict): 제품 정보 딕셔너리
+        content (dict, optional): 템플릿 모드에서 생성된 구조화 콘텐츠
+        reused_from (str, optional): 재사용한 원본 페이지의 session_id
+    """
+    key = text_input_key(product)
+    meta = {
+        "session_id": session_id,
+        "text_key": key,
+        "engine": product.get("engine", "openai"),
+        "mode": product.get("mode", "full"),
+        "template": product.get("template", DEFAULT_TEMPLATE),
+        "image_path_list": list(product.get("image_path_list", [])),
+        "content": content,
+        "reused_from": reused_from,
+        "created_at": time.time(),
+    }
+    try:
+        _write_json(_meta_path(result_path, session_id), meta)
+        with _index_lock:
+            index = _load_index(result_path)
+            # 최근 갱신된 항목이 뒤에 오도록 다시 넣고, 상한을 넘으면 앞에서부터 삭제
+            index.pop(key, None)
+            index[key] = session_id
+            for stale in list(index)[:max(0, len(index) - MAX_INDEX_ENTRIES)]:
+                del index[stale]
+            _write_json(os.path.join(result_path, INDEX_FILENAME), index)
+        logger.debug(f"🛠️ 페이지 메타 저장 완료: {session_id}")
+    except Exception as e:
+        # 메타 저장 실패는 다음 재생성이 전체 생성으로 처리될 뿐이므로 요청을 실패시키지 않음
+        logger.warning(f"⚠️ 페이지 메타 저장 실패: {e}")
+
+
+def find_reusable_page(result_path: str, product: dict) -> dict:
+    """
+    텍스트 입력이 같은 이전 페이지의 메타 정보를 찾습니다.
+
+    Args:
+        result_path (str): 결과 디렉토리 경로
+        product (dict): 제품 정보 딕셔너리
+
+    Returns:
+        dict: 이전 페이지 메타 정보 (없으면 None)
+    """
+    key = text_input_key(product)
+    with _index_lock:
+        session_id = _load_index(result_path).get(key)
+    if not session_id:
+        return None
+
+    html_path = os.path.join(result_path, f"page_{session_id}.html")
+    try:
+        with open(_meta_path(result_path, session_id), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        meta["html_text"] = get_recent_html(session_id)
+        if meta["html_text"] is None:
+            with open(html_path, "r", encoding="utf-8") as f:
+                meta["html_text"] = f.read()
+    except Exception as e:
+        logger.debug(f"🛠️ 재사용 후보 페이지 로드 실패({session_id}): {e}")
+        return None
+
+    if meta.get("text_key") != key:
+        return None
+    return meta
+
+
+def patch_image_tags(html_text: str, old_paths: list, new_paths: list) -> str:
+    """
+    HTML의 이미지 태그 src를 이전 이미지 목록에서 새 이미지 목록으로 순서대로 교체합니다.
+    새 이미지가 더 많으면 마지막 이미지 태그 뒤에 같은 형태의 태그를 추가하고,
+    더 적으면 남는 이미지 태그를 제거합니다.
+
+    Args:
+        html_text (str): 이전 상세페이지 HTML
+        old_paths (list): 이전 페이지 생성에 사용한 이미지 경로 리스트
+        new_paths (list): 새로 선택한 이미지 경로 리스트
+
+    Returns:
+        str: 이미지가 교체된 HTML (교체할 이미지 태그를 찾지 못하면 None)
+    """
+    old_srcs = [to_html_image_path(path) for path in old_paths]
+    new_srcs = [to_html_image_path(path) for path in new_paths]
+    if old_srcs == new_srcs:
+        return html_text
+
+    last_tag = None
+
+    def _replace_tag(match):
+        nonlocal last_tag
+        tag = match.group(0)
+        src_match = SRC_ATTR_PATTERN.search(tag)
+        if not src_match or src_match.group(3) not in old_srcs:
+            return tag
+
+        index = old_srcs.index(src_match.group(3))
+        if index >= len(new_srcs):
+            return ""
+        new_tag = SRC_ATTR_PATTERN.sub(lambda m: f"{m.group(1)}{m.group(2)}{new_srcs[index]}{m.group(2)}", tag, count=1)
+        last_tag = new_tag
+        return new_tag
+
+    patched = IMG_TAG_PATTERN.sub(_replace_tag, html_text)
+    if last_tag is None:
+        return None if new_srcs else patched
+
+    # 새로 추가된 이미지는 마지막 이미지 태그와 같은 형태로 그 뒤에 이어 붙임
+    extra_srcs = new_srcs[len(old_srcs):]
+    if extra_srcs:
+        extra_tags = "".join(
+            "\n" + SRC_ATTR_PATTERN.sub(lambda m, src=src: f"{m.group(1)}{m.group(2)}{src}{m.group(2)}", last_tag, count=1)
+            for src in extra_srcs
+        )
+        insert_at = patched.rfind(last_tag) + len(last_tag)
+        patched = patched[:insert_at] + extra_tags + patched[insert_at:]
+    return patched
+
+
+def rebuild_page(meta: dict, product: dict) -> str:
+    """
+    이전 페이지를 새 이미지 목록에 맞게 LLM 호출 없이 다시 만듭니다.
+    템플릿 모드는 저장된 콘텐츠로 다시 렌더링하고, 그 외에는 이미지 태그만 교체합니다.
+
+    Args:
+        meta (dict): find_reusable_page()가 반환한 이전 페이지 메타 정보
+        product (dict): 새 제품 정보 딕셔너리
+
+    Returns:
+        str: 새 상세페이지 HTML (재사용할 수 없으면 None)
+    """
+    image_paths = product.get("image_path_list", [])
+    if meta.get("mode") == "template" and meta.get("content"):
+        content = meta["content"]
+        images = assign_template_images(image_paths, content.get("image_alts", []), product)
+        return render_content_template(content, product, images, template=meta.get("template", DEFAULT_TEMPLATE))
+
+    return patch_image_tags(meta["html_text"], meta.get("image_path_list", []), image_paths)
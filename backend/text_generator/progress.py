@@ -0,0 +1,75 @@
+import threading
+import time
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# session_id -> 진행 상태 dict
+_progress = {}
+# 사용자 세션 ID 등 별칭 -> 가장 최근 session_id
+_aliases = {}
+_lock = threading.Lock()
+# 보관할 최대 세션 수 (오래된 것부터 삭제)
+MAX_SESSIONS = 200
+# 더 이상 바뀌지 않는 최종 상태
+TERMINAL_STATUSES = ("done", "failed")
+
+
+def publish_progress(session_id: str, alias: str = None, **fields):
+    """
+    상세페이지 생성 진행 상태를 갱신합니다.
+
+    Args:
+        session_id (str): 상세페이지 세션 ID
+        alias (str, optional): 같은 진행 상태를 조회할 수 있는 별칭 (예: user_session_id)
+        **fields: 갱신할 상태 값 (status, chars 등)
+    """
+    with _lock:
+        state = _progress.setdefault(session_id, {"session_id": session_id})
+        state.update(fields)
+        state["updated_at"] = time.time()
+        if alias:
+            _aliases[alias] = session_id
+
+        if len(_progress) > MAX_SESSIONS:
+            oldest = min(_progress, key=lambda sid: _progress[sid]["updated_at"])
+            _progress.pop(oldest)
+            for stale in [a for a, sid in _aliases.items() if sid == oldest]:
+                del _aliases[stale]
+
+
+def fail_progress(session_id: str) -> bool:
+    """
+    진행 중인 세션만 "failed"로 바꿉니다. 이미 끝난 세션(done/failed)의 상태는 덮어쓰지 않습니다.
+    (백그라운드 파일 저장처럼 완료 보고 이후에 끝날 수 있는 작업의 실패 처리용)
+
+    Args:
+        session_id (str): 상세페이지 세션 ID
+
+    Returns:
+        bool: 상태를 "failed"로 바꿨는지 여부
+    """
+    with _lock:
+        state = _progress.get(session_id)
+        if state is None or state.get("status") in TERMINAL_STATUSES:
+            return False
+        state["status"] = "failed"
+        state["updated_at"] = time.time()
+        return True
+
+
+def get_progress(key: str) -> dict:
+    """
+    session_id 또는 별칭으로 진행 상태를 조회합니다.
+
+    Args:
+        key (str): session_id 또는 publish_progress()에 전달한 별칭
+
+    Returns:
+        dict: 진행 상태 사본 (없으면 None)
+    """
+    with _lock:
+        session_id = _aliases.get(key, key)
+        state = _progress.get(session_id)
+        return dict(state) if state else None
+
@@ -1,15 +1,9 @@
-
 # GEO 프롬프트
-def apply_schema_prompt(product):
+# 상품과 무관한 정적 프롬프트는 모두 앞쪽(prefix)에 두어 OpenAI 프롬프트 캐싱이 적중하도록 합니다.
+def apply_schema_prompt():
     return f"""
     당신은 상품 상세페이지 작성 전문가입니다.
-    다음 상품 정보를 Schema.org 포맷을 참고해 구조화된 HTML로 작성해주세요:
-
-    - 상품명: {product['name']}
-    - 카테고리: {product['category']}
-    - 브랜드: {product['brand']}
-    - 가격: {product['price']}원
-    - 특징: {product['features']}
+    마지막에 주어지는 상품 정보를 Schema.org 포맷을 참고해 구조화된 HTML로 작성해주세요.
 
     HTML에는 <script type="application/ld+json"> 블록도 포함해 주세요.
     aggregateRating는 높은 평점과 많은 리뷰수로 설정해주세요.
@@ -86,20 +80,30 @@ def expert_quote_prompt():
     """
 
 
+def product_schema_prompt(product):
+    return f"""
+    상품 정보:
+    - 상품명: {product['name']}
+    - 카테고리: {product['category']}
+    - 브랜드: {product['brand']}
+    - 가격: {product['price']}원
+    - 특징: {product['features']}
+    """
+
+
 # 상세페이지 보완 프롬프트
-def storytelling_prompt():
-    return """
-    도널드밀러의 스토리텔링 기법을 사용해서 반드시 다음 구조를 따라주세요:
-    
-    1. Hero Section (브랜드명, 임팩트 있는 헤드라인)
-    
+# 스토리텔링 섹션별 지침 (섹션 병렬 생성 모드에서도 그대로 사용)
+STORY_SECTIONS = [
+    ("hero", """
+    1. Hero Section (브랜드명, 임팩트 있는 헤드라인)"""),
+    ("problem", """
     2. Problem Section (고객의 고민/문제점 3가지)
         - "이런 경험 있으신가요?"로 감정적 어필
         - 고객이 겪는 문제 상황 3가지 제시
         - 각 문제에 대한 감정적 공감과 이해
         - 우리 제품이 제공하는 명확한 해결책
-        - 각 문제 상황은 3개의 열로 나열
-    
+        - 각 문제 상황은 3개의 열로 나열"""),
+    ("guide", """
     3. Guide Section (브랜드가 이해한다는 공감 + 약속)
         - 전체 레이아웃은 2단 그리드로 구성: 왼쪽은 텍스트, 오른쪽은 제품 이미지
         - 왼쪽 텍스트 블록에는 다음 구성 요소를 포함
@@ -108,28 +112,35 @@ def storytelling_prompt():
             3) 고객이 신뢰할 수 있는 강점을 강조한 포인트박스 2개, 각각은 다음 스타일을 포함할 것:
                - `bg-blue-50`, `border-l-4`, `border-blue-600`, `p-6`, `rounded-lg`, `shadow-lg`
                - 상단엔 소제목 `<h3 class="text-xl font-semibold mb-2 text-blue-700">`, 아래엔 본문 `<p>` 포함
-        - 오른쪽에는 제품 이미지 1장을 포함 (`rounded-xl`, `shadow-xl`, `mx-auto`, `max-w-sm` 등으로 스타일 지정)
-    
+        - 오른쪽에는 제품 이미지 1장을 포함 (`rounded-xl`, `shadow-xl`, `mx-auto`, `max-w-sm` 등으로 스타일 지정)"""),
+    ("product", """
     4. Product Section (제품 특징)
         - 리스트 전체는 <ul class="grid md:grid-cols-3 gap-10 max-w-6xl mx-auto text-gray-800">로 감싸고, 각 항목은 <li class="bg-white p-6 rounded-xl shadow-lg">로 구성
-        - 특징 이름(소제목)은 <blockquote class="text-xl font-semibold mb-3 text-blue-700"> 형식으로 강조, 설명은 그 아래 <p> 태그로 자연스럽게 이어서 작성
-    
+        - 특징 이름(소제목)은 <blockquote class="text-xl font-semibold mb-3 text-blue-700"> 형식으로 강조, 설명은 그 아래 <p> 태그로 자연스럽게 이어서 작성"""),
+    ("plan", """
     5. Plan Section (선택-주문-배송의 간단한 3단계 프로세스)
         - 각 단계는 FontAwesome 아이콘을 사용하여 시각적으로 표현
-        - 아이콘 색은 text-blue-600색으로 구성
-    
+        - 아이콘 색은 text-blue-600색으로 구성"""),
+    ("success", """
     6. Success/Failure Section (선택했을 때 vs 선택하지 않았을 때)
         - 성공 시나리오와 실패 시나리오를 대비하여 작성
         - 선택했을 때: <i class="fas fa-check text-green-600 mr-2"></i>
-        - 선택하지 않았을 때: <i class="fas fa-times text-red-600 mr-2"></i>
-    
+        - 선택하지 않았을 때: <i class="fas fa-times text-red-600 mr-2"></i>"""),
+    ("reviews", """
     7. Reviews Section (고객 후기 4개)
         - 총 4개의 고객 후기를 2x2 형태로 배치
         - <div class="grid md:grid-cols-2 gap-10">를 사용해 2열 그리드로 구성
         - 각 후기는 <div class="bg-sky-50 p-6 rounded-xl shadow-lg text-left"> 형식의 카드 스타일로 작성
         - 고객 이름과 직업은 <p class="font-semibold text-blue-700">로 표시
-        - <i class="fas fa-star text-yellow-400 mr-1"></i> 아이콘을 반복 사용하여 별 5개를 표현
-    """
+        - <i class="fas fa-star text-yellow-400 mr-1"></i> 아이콘을 반복 사용하여 별 5개를 표현"""),
+]
+
+def storytelling_prompt():
+    header = """
+    도널드밀러의 스토리텔링 기법을 사용해서 반드시 다음 구조를 따라주세요:
+    
+"""
+    return header + "\n    \n".join(text.strip("\n") for _, text in STORY_SECTIONS) + "\n    "
 
 def modern_design_prompt():
     return """
@@ -174,4 +185,37 @@ def modern_design_prompt():
         - .hero-bg {{ background: linear-gradient(120deg, #48c6ef 0%, #6f86d6 100%); }} 준수
 
     8. CTA(Call-To-Action) 버튼은 생성 금지
-    """
\ No newline at end of file
+    """
+
+# 구조화 콘텐츠(JSON) 생성 프롬프트 (템플릿 렌더링 모드)
+def content_json_prompt():
+    return """
+    당신은 상품 상세페이지 작성 전문가입니다.
+    마지막에 주어지는 상품 정보를 바탕으로 상세페이지에 들어갈 문구만 JSON으로 작성해주세요.
+    HTML, CSS, 마크다운은 출력하지 말고 아래 키를 가진 JSON 객체 하나만 출력해주세요.
+
+    {
+        "headline": "브랜드 또는 제품을 강조하는 임팩트 있는 헤드라인",
+        "keywords": ["제품 장점 키워드 3~4개"],
+        "summary": "무엇을 위한 제품인지, 어떤 특징이 핵심인지 1~2줄 소개",
+        "problems": [{"title": "고객이 겪는 문제 상황", "description": "감정적 공감 문장"}],
+        "solution": "우리 제품이 제공하는 명확한 해결책 한 문장",
+        "guide": {
+            "headline": "고객의 문제를 공감하고 해결책을 찾았음을 선언하는 헤드라인",
+            "paragraphs": ["브랜드의 가치와 철학 2~3문단"],
+            "points": [{"title": "신뢰할 수 있는 강점", "description": "설명"}]
+        },
+        "features": [{"title": "특징 이름", "description": "정량적 수치를 포함한 설명"}],
+        "expert_quote": {"quote": "관련 전문가 또는 유명인의 인용문", "author": "인용 출처"},
+        "plan": [{"title": "선택/주문/배송 단계 이름", "description": "설명"}],
+        "success": ["선택했을 때의 변화"],
+        "failure": ["선택하지 않았을 때의 불편"],
+        "reviews": [{"name": "고객 이름", "job": "직업", "content": "후기"}],
+        "faq": [{"question": "소비자가 궁금해할 질문", "answer": "답변"}],
+        "image_alts": ["주어진 이미지 순서대로, 제품명과 특징을 바탕으로 한 alt 문구"],
+        "jsonld": {"description": "Schema.org Product description", "rating_value": 4.8, "review_count": 1200}
+    }
+
+    problems는 3개, guide.points는 2개, features는 3~6개, plan은 3개, reviews는 4개, faq는 5개 이상 작성해주세요.
+    aggregateRating에 들어갈 rating_value와 review_count는 높은 평점과 많은 리뷰수로 설정해주세요.
+    """
@@ -1,14 +1,8 @@
-
 # GEO 프롬프트
-def system_instruction(product: dict) -> str:
-    return f"""
-당신은 상품 상세페이지 전문 작성가입니다. 아래 제품 정보를 바탕으로, 친절하고 설득력 있는 문체로 GEO 최적화된 상세페이지 HTML을 작성해주세요.
-
-- 상품명: {product['name']}
-- 카테고리: {product['category']}
-- 브랜드: {product['brand']}
-- 가격: {product['price']}원
-- 특징: {product['features']}
+# 아래 두 함수는 상품과 무관한 정적 텍스트로, 모든 HF 프롬프트의 공통 prefix가 됩니다. (KV 캐시 재사용)
+def system_instruction() -> str:
+    return """
+당신은 상품 상세페이지 전문 작성가입니다. 마지막에 주어지는 제품 정보를 바탕으로, 친절하고 설득력 있는 문체로 GEO 최적화된 상세페이지 HTML을 작성해주세요.
 
 작성 시 유의사항:
 - 핵심 키워드는 반복하되 표현은 다양하게
@@ -45,3 +39,14 @@ inline 스타일은 사용하지 말고, 시맨틱 태그와 class명을 활용
 인용하는 전문가의 말은 반드시 <blockquote> 태그로 감싸주세요.
 강조할 키워드는 <strong> 태그로 감싸주세요.
 """
+
+# 상품별 프롬프트 (공통 prefix 뒤에 붙는 suffix)
+def product_info_prompt(product: dict) -> str:
+    return f"""
+제품 정보:
+- 상품명: {product['name']}
+- 카테고리: {product['category']}
+- 브랜드: {product['brand']}
+- 가격: {product['price']}원
+- 특징: {product['features']}
+"""
@@ -0,0 +1,205 @@
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from typing import Callable, Optional
+from openai import OpenAI
+from backend.text_generator.cleaner import clean_response
+from backend.text_generator.prompt_builder import *
+from backend.text_generator.text_generator import to_html_image_path, log_openai_usage
+from utils.logger import get_logger
+from utils.config import get_openai_api_key
+
+logger = get_logger(__name__)
+
+# 섹션별 생성 지침 (출력 순서 = 리스트 순서)
+JSONLD_INSTRUCTION = """
+    상품 정보를 Schema.org Product 포맷의 <script type="application/ld+json"> 블록 하나로만 작성해주세요.
+    aggregateRating는 높은 평점과 많은 리뷰수로 설정해주세요.
+    """
+SECTION_SPECS = STORY_SECTIONS + [
+    ("qna", qna_format_prompt()),
+    ("jsonld", JSONLD_INSTRUCTION),
+]
+
+# 섹션별로 배치할 이미지 (첫 번째 → hero, 두 번째 → guide, 나머지 → product, 템플릿 모드와 공유)
+IMAGE_SLOTS = ["hero", "guide"]
+EXTRA_IMAGE_SLOT = "product"
+
+SECTION_PATTERN = re.compile(r"<section\b.*</section>", re.IGNORECASE | re.DOTALL)
+JSONLD_PATTERN = re.compile(r'<script[^>]*application/ld\+json[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+
+PAGE_HEAD = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
+    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@6.4.0/css/all.min.css">
+    <style>
+        body { font-family: 'Noto Sans KR', sans-serif; }
+        .hero-bg { background: linear-gradient(120deg, #48c6ef 0%, #6f86d6 100%); }
+    </style>
+</head>
+<body class="bg-gray-50">
+"""
+PAGE_TAIL = """</body>
+</html>
+"""
+
+
+def section_system_prompt() -> str:
+    """
+    모든 섹션 요청이 공유하는 정적 system 프롬프트를 반환합니다. (상품 정보 미포함)
+    """
+    return "\n".join([
+        """
+    당신은 상품 상세페이지 작성 전문가입니다.
+    상세페이지는 여러 섹션으로 나누어 동시에 작성되며, 당신은 그중 요청받은 섹션 하나만 작성합니다.
+    <html>, <head>, <body> 태그 없이 요청받은 섹션만 출력해주세요.
+    섹션은 <section> ~ </section> 태그 하나로 감싸주세요. (JSON-LD 요청은 <script> 블록만 출력)
+    """,
+        natural_tone_prompt(),
+        keyword_variation_prompt(),
+        html_structure_prompt(),
+        quantitative_prompt(),
+        expert_quote_prompt(),
+        modern_design_prompt(),
+    ])
+
+
+def assign_images(image_paths: list) -> dict:
+    """
+    이미지 목록을 섹션별로 나눕니다.
+
+    Args:
+        image_paths (list): 이미지 경로 리스트
+
+    Returns:
+        dict: 섹션 키 -> HTML용 이미지 경로 리스트
+    """
+    assigned = {}
+    for i, path in enumerate(image_paths or []):
+        key = IMAGE_SLOTS[i] if i < len(IMAGE_SLOTS) else EXTRA_IMAGE_SLOT
+        assigned.setdefault(key, []).append(to_html_image_path(path))
+    return assigned
+
+
+def build_section_prompt(product: dict, key: str, instruction: str, images: list) -> str:
+    """
+    섹션 하나를 생성하기 위한 user 프롬프트를 만듭니다.
+
+    Args:
+        product (dict): 제품 정보 딕셔너리
+        key (str): 섹션 키
+        instruction (str): 섹션별 작성 지침
+        images (list): 이 섹션에 배치할 이미지 경로 리스트
+
+    Returns:
+        str: 섹션 프롬프트 문자열
+    """
+    prompt_parts = [product_schema_prompt(product)]
+
+    if product.get("differences"):
+        prompt_parts.append("\n".join([
+            "이 상품은 경쟁사 대비 다음과 같은 차별점을 가지고 있습니다:",
+            *[f"- {item}" for item in product["differences"]],
+            "섹션 내용과 관련이 있다면 위 차별점을 자연스럽게 강조해 주세요."
+        ]))
+
+    if images:
+        prompt_parts.append("이 섹션에 다음 상품 이미지를 모두 포함시켜주세요:")
+        prompt_parts += [f'- <img class="product-image" src="{src}" alt="...">' for src in images]
+        prompt_parts.append("각 이미지의 alt 속성은 제품명과 특징을 바탕으로 자동 생성해주세요")
+
+    prompt_parts.append(f"작성할 섹션({key}):")
+    prompt_parts.append(instruction)
+    return "\n".join(prompt_parts)
+
+
+def extract_section(key: str, text: str) -> str:
+    """
+    모델 응답에서 섹션 HTML(또는 JSON-LD 블록)만 추출합니다.
+
+    Args:
+        key (str): 섹션 키
+        text (str): 코드 블록이 제거된 모델 응답
+
+    Returns:
+        str: 추출된 HTML (찾지 못하면 None)
+    """
+    pattern = JSONLD_PATTERN if key == "jsonld" else SECTION_PATTERN
+    match = pattern.search(text)
+    return match.group(0).strip() if match else None
+
+
+def _generate_section(client: OpenAI, system_prompt: str, product: dict, key: str, instruction: str, images: list) -> str:
+    start = time.perf_counter()
+    response = client.chat.completions.create(
+        model="gpt-4.1-mini",
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": build_section_prompt(product, key, instruction, images)},
+        ],
+        temperature=0.9
+    )
+    log_openai_usage(response, f"섹션 생성({key})")
+
+    html = extract_section(key, clean_response(response.choices[0].message.content))
+    if html is None:
+        raise ValueError("응답에서 섹션 태그를 찾지 못했습니다")
+    logger.debug(f"🛠️ 섹션 생성 완료({key}): {time.perf_counter() - start:.1f}s")
+    return html
+
+
+def generate_sections(product: dict, stream_callback: Optional[Callable[[str], None]] = None) -> dict:
+    """
+    상세페이지를 섹션 단위로 동시에 생성한 뒤, 고정된 HTML 골격에 순서대로 조립합니다.
+    전체 소요 시간은 모든 섹션의 합이 아니라 가장 느린 섹션에 맞춰집니다.
+    stream_callback이 주어지면 앞선 섹션이 모두 끝난 섹션부터 순서대로 전달합니다.
+
+    Args:
+        product (dict): 상세페이지 생성에 필요한 제품 정보가 담긴 딕셔너리
+        stream_callback (Callable[[str], None], optional): 완성된 HTML 조각을 받을 콜백
+
+    Returns:
+        dict: 생성된 상세페이지 HTML이 포함된 딕셔너리
+    """
+    client = OpenAI(api_key=get_openai_api_key())
+    system_prompt = section_system_prompt()
+    images = assign_images(product.get("image_path_list", []))
+
+    html_parts = []
+
+    def _emit(text: str):
+        html_parts.append(text)
+        if stream_callback:
+            stream_callback(text)
+
+    logger.info(f"🛠️ 섹션 병렬 생성 시작: {len(SECTION_SPECS)}개")
+    start = time.perf_counter()
+    _emit(PAGE_HEAD.format(title=escape(f"{product['name']} - {product['brand']}")))
+
+    succeeded = 0
+    with ThreadPoolExecutor(max_workers=len(SECTION_SPECS), thread_name_prefix="section") as executor:
+        futures = [
+            (key, executor.submit(_generate_section, client, system_prompt, product, key, instruction, images.get(key, [])))
+            for key, instruction in SECTION_SPECS
+        ]
+        # 출력 순서는 고정: 앞 섹션이 끝날 때까지 기다린 뒤 순서대로 조립
+        for key, future in futures:
+            try:
+                _emit(future.result() + "\n")
+                succeeded += 1
+            except Exception as e:
+                logger.warning(f"⚠️ 섹션 생성 실패({key}), 해당 섹션을 제외합니다: {e}")
+
+    if succeeded == 0:
+        raise RuntimeError("❌ 모든 섹션 생성에 실패했습니다")
+
+    _emit(PAGE_TAIL)
+    logger.info(f"✅ 섹션 병렬 생성 완료: {succeeded}/{len(SECTION_SPECS)}개, {time.perf_counter() - start:.1f}s")
+
+    return {"html_text": "".join(html_parts)}
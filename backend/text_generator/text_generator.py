@@ -1,33 +1,71 @@
 import os
-import torch
+import threading
+from typing import Callable, Optional
 from dotenv import load_dotenv
 from openai import OpenAI
 from transformers import AutoTokenizer
 from backend.models.model_handler import get_model_pipeline
-from backend.text_generator.cleaner import clean_response
+from backend.text_generator.cleaner import clean_response, StreamingHtmlCleaner
+from backend.text_generator.hf_generation import truncate_after_html_end
+from backend.text_generator.hf_server import HFGenerationServer
 from backend.text_generator.prompt_builder import *
-from backend.text_generator.prompt_builder_hf import system_instruction, css_friendly_prompt
+from backend.text_generator.prompt_builder_hf import system_instruction, css_friendly_prompt, product_info_prompt
 from utils.logger import get_logger
 from utils.config import get_openai_api_key
+from utils.token_budget import fit_prompt_parts, get_token_budget
 
 load_dotenv()
 logger = get_logger(__name__)
 
-# OpenAI
-def generate_openai(product: dict) -> dict:
+def to_html_image_path(path: str) -> str:
     """
-    제공된 제품 정보를 바탕으로 OpenAI를 통해 상세페이지 HTML을 생성합니다.
-    
+    이미지 경로를 backend/data/result/의 HTML에서 사용할 수 있는 상대 경로로 변환합니다.
+
     Args:
-        product (dict): 상세페이지 생성에 필요한 제품 정보가 담긴 딕셔너리
+        path (str): 이미지 경로
 
     Returns:
-        dict: 생성된 상세페이지 HTML이 포함된 딕셔너리
+        str: HTML용 상대 경로
     """
-    client = OpenAI(api_key=get_openai_api_key())
-    
-    prompt_parts = [
-        apply_schema_prompt(product),
+    # backend/data/result/에서 backend/data/output/로 접근: ../output/
+    if path.startswith("backend/data/output/"):
+        # backend/data/output/xxx.png -> ../output/xxx.png
+        return path.replace("backend/data/output/", "../output/")
+    if path.startswith("backend/data/input/"):
+        # backend/data/input/xxx.jpg -> ../input/xxx.jpg
+        return path.replace("backend/data/input/", "../input/")
+    # 다른 경로는 그대로 사용
+    return path
+
+def build_image_prompt_lines(image_paths: list) -> list:
+    """
+    상세페이지에 포함할 이미지 목록을 프롬프트 문장 리스트로 변환합니다.
+
+    Args:
+        image_paths (list): 이미지 경로 리스트
+
+    Returns:
+        list: 이미지 관련 프롬프트 문장 리스트 (이미지가 없으면 빈 리스트)
+    """
+    if not image_paths:
+        return []
+
+    image_prompt_lines = ["상세페이지 내에 다음 상품 이미지를 모두 포함시켜주세요:"]
+    for path in image_paths:
+        image_prompt_lines.append(f'- <img class="product-image" src="{to_html_image_path(path)}" alt="...">')
+    image_prompt_lines.append("각 이미지의 alt 속성은 제품명과 특징을 바탕으로 자동 생성해주세요")
+    image_prompt_lines.append("각 이미지는 적절한 섹션에 분산하여 배치해주세요.")
+    return image_prompt_lines
+
+
+# OpenAI
+def openai_static_prompt() -> str:
+    """
+    모든 OpenAI 상세페이지 프롬프트가 공유하는 정적 prefix를 반환합니다. (상품 정보 미포함)
+    매 요청마다 바이트 단위로 동일해야 OpenAI 프롬프트 캐싱이 적중합니다.
+    """
+    return "\n".join([
+        apply_schema_prompt(),
         natural_tone_prompt(),
         keyword_variation_prompt(),
         html_structure_prompt(),
@@ -36,7 +74,19 @@ def generate_openai(product: dict) -> dict:
         expert_quote_prompt(),
         storytelling_prompt(),
         modern_design_prompt(),
-    ]
+    ])
+
+def build_openai_product_parts(product: dict) -> list:
+    """
+    상품 정보, 차별점, 이미지 목록 등 요청마다 달라지는 프롬프트(suffix) 조각들을 생성합니다.
+
+    Args:
+        product (dict): 상세페이지 생성에 필요한 제품 정보가 담긴 딕셔너리
+
+    Returns:
+        list: fit_prompt_parts()에 전달할 {"name", "text", "priority"} 조각 리스트
+    """
+    prompt_parts = [{"name": "product", "text": product_schema_prompt(product), "priority": None}]
 
     # 차별점 반영
     if product.get("differences"):
@@ -45,57 +95,135 @@ def generate_openai(product: dict) -> dict:
             *[f"- {item}" for item in product["differences"]],
             "위 차별점들을 상세페이지 내용에서 자연스럽게 강조해 주세요."
         ])
-        prompt_parts.insert(1, diff_prompt)
+        prompt_parts.append({"name": "differences", "text": diff_prompt, "priority": 1})
         
     # 이미지 반영
-    image_prompt_lines = []
-    image_paths = product.get("image_path_list", [])
-
-    if image_paths:
-        image_prompt_lines = ["상세페이지 내에 다음 상품 이미지를 모두 포함시켜주세요:"]
-        for path in image_paths:
-            # HTML에서 사용할 수 있는 상대 경로로 변환
-            # backend/data/result/에서 backend/data/output/로 접근: ../output/
-            if path.startswith("backend/data/output/"):
-                # backend/data/output/xxx.png -> ../output/xxx.png
-                relative_path = path.replace("backend/data/output/", "../output/")
-            elif path.startswith("backend/data/input/"):
-                # backend/data/input/xxx.jpg -> ../input/xxx.jpg  
-                relative_path = path.replace("backend/data/input/", "../input/")
-            else:
-                # 다른 경로는 그대로 사용
-                relative_path = path
-            
-            image_prompt_lines.append(f'- <img class="product-image" src="{relative_path}" alt="...">')
-        image_prompt_lines.append("각 이미지의 alt 속성은 제품명과 특징을 바탕으로 자동 생성해주세요")
-        image_prompt_lines.append("각 이미지는 적절한 섹션에 분산하여 배치해주세요.")
-
-    prompt_parts += image_prompt_lines
-    prompt_parts.append("모든 정보를 HTML로 출력해주세요. 결과는 <html> ~ </html> 태그 안에 있어야 합니다")
+    image_prompt_lines = build_image_prompt_lines(product.get("image_path_list", []))
+    if image_prompt_lines:
+        prompt_parts.append({"name": "images", "text": "\n".join(image_prompt_lines), "priority": None})
+
+    prompt_parts.append({
+        "name": "instruction",
+        "text": "모든 정보를 HTML로 출력해주세요. 결과는 <html> ~ </html> 태그 안에 있어야 합니다",
+        "priority": None
+    })
+    return prompt_parts
+
+def log_openai_usage(response, label: str = "OpenAI"):
+    """
+    OpenAI 응답의 토큰 사용량과 프롬프트 캐시 적중 토큰 수를 로그로 남깁니다.
+
+    Args:
+        response: chat.completions 응답 객체 (또는 usage가 포함된 마지막 스트림 청크)
+        label (str): 로그에 표시할 요청 이름
+    """
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        logger.debug(f"🛠️ {label} 토큰 사용량 정보 없음")
+        return
+
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", 0) or 0
+    prompt_tokens = usage.prompt_tokens or 0
+    hit_ratio = cached_tokens / prompt_tokens * 100 if prompt_tokens else 0.0
+    logger.info(
+        f"✅ {label} 토큰 사용량: prompt={prompt_tokens} (cached={cached_tokens}, {hit_ratio:.0f}%), "
+        f"completion={usage.completion_tokens}"
+    )
+
+def generate_openai(product: dict, stream_callback: Optional[Callable[[str], None]] = None) -> dict:
+    """
+    제공된 제품 정보를 바탕으로 OpenAI를 통해 상세페이지 HTML을 생성합니다.
+    정적 프롬프트는 system 메시지(prefix)로, 상품별 내용은 user 메시지(suffix)로 보내
+    OpenAI 프롬프트 캐싱이 적중하도록 합니다.
+    stream_callback이 주어지면 응답을 스트리밍으로 받아, 코드 블록이 제거된 HTML 조각을 순서대로 전달합니다.
     
-    prompt = "\n".join(prompt_parts)
+    Args:
+        product (dict): 상세페이지 생성에 필요한 제품 정보가 담긴 딕셔너리
+        stream_callback (Callable[[str], None], optional): 정제된 HTML 조각을 받을 콜백
+
+    Returns:
+        dict: 생성된 상세페이지 HTML이 포함된 딕셔너리
+    """
+    client = OpenAI(api_key=get_openai_api_key())
+    
+    prompt_parts = [{"name": "static", "text": openai_static_prompt(), "priority": None}]
+    prompt_parts += build_openai_product_parts(product)
+    texts = fit_prompt_parts(prompt_parts, get_token_budget("openai_page"), model="gpt-4.1-mini", label="상세페이지 생성")
+
+    messages = [
+        {"role": "system", "content": texts[0]},
+        {"role": "user", "content": "\n".join(text for text in texts[1:] if text)},
+    ]
     logger.info("🛠️ OpenAI 요청 시작")
 
+    if stream_callback:
+        return _generate_openai_stream(client, messages, stream_callback)
+
     try:
         response = client.chat.completions.create(
             model="gpt-4.1-mini",
-            messages=[{"role": "user", "content": prompt}],
+            messages=messages,
             temperature=0.9
         )
         logger.info("✅ OpenAI API 응답 수신 완료")
     except Exception as e:
         raise RuntimeError(f"❌ OpenAI API 요청 실패: {e}")
 
+    log_openai_usage(response, "상세페이지 생성")
+
     html_text = response.choices[0].message.content
     html_text = clean_response(html_text)
     logger.info("✅ 코드 마크다운 블록 제거 완료")
     
     return {"html_text": html_text}
 
+def _generate_openai_stream(client, messages: list, stream_callback: Callable[[str], None]) -> dict:
+    """
+    OpenAI 응답을 스트리밍으로 받아 마크다운 코드 블록을 실시간으로 제거하며 콜백에 전달합니다.
+
+    Args:
+        client (OpenAI): OpenAI 클라이언트
+        messages (list): chat.completions 메시지 리스트
+        stream_callback (Callable[[str], None]): 정제된 HTML 조각을 받을 콜백
+
+    Returns:
+        dict: 생성된 상세페이지 HTML이 포함된 딕셔너리
+    """
+    cleaner = StreamingHtmlCleaner()
+    html_parts = []
+
+    def _emit(text: str):
+        if text:
+            html_parts.append(text)
+            stream_callback(text)
+
+    try:
+        stream = client.chat.completions.create(
+            model="gpt-4.1-mini",
+            messages=messages,
+            temperature=0.9,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        for chunk in stream:
+            if chunk.choices:
+                _emit(cleaner.feed(chunk.choices[0].delta.content or ""))
+            if chunk.usage:
+                log_openai_usage(chunk, "상세페이지 생성(스트리밍)")
+        _emit(cleaner.finish())
+        logger.info("✅ OpenAI 스트리밍 응답 수신 완료")
+    except Exception as e:
+        raise RuntimeError(f"❌ OpenAI API 스트리밍 요청 실패: {e}")
+
+    return {"html_text": "".join(html_parts)}
+
 
 # HuggingFace
 hf_model = None
 hf_tokenizer = None
+hf_server = None
+hf_server_lock = threading.Lock()
 
 def load_hf_model():
     """
@@ -117,30 +245,71 @@ def load_hf_model():
     tokenizer = AutoTokenizer.from_pretrained(lora_path, use_fast=False, local_files_only=True)
     return model, tokenizer
 
-def generate_hf(product: dict) -> dict:
+def hf_static_prefix() -> str:
     """
-    제공된 제품 정보를 바탕으로 HuggingFace를 통해 상세페이지 HTML을 생성합니다.
+    모든 HF 프롬프트가 공유하는 정적 prefix를 반환합니다. (상품 정보 미포함)
+    """
+    return "\n".join([
+        system_instruction().strip(),
+        css_friendly_prompt().strip(),
+    ]) + "\n"
 
-    Args:
-        product (dict): 상세페이지 생성에 필요한 제품 정보가 담긴 딕셔너리
+def get_hf_server() -> HFGenerationServer:
+    """
+    HuggingFace 모델을 한 번만 로딩하고, 동시 요청을 배치로 처리하는 생성 서버를 반환합니다.
 
     Returns:
-        dict: 생성된 상세페이지 HTML이 포함된 딕셔너리
+        HFGenerationServer: 실행 중인 배치 생성 서버
     """
-    global hf_model, hf_tokenizer
-    
-    if hf_model is None:
+    global hf_model, hf_tokenizer, hf_server
+
+    with hf_server_lock:
+        if hf_server is not None:
+            return hf_server
+
         try:
             logger.info("🛠️ HuggingFace 모델 로딩 중")
             hf_model, hf_tokenizer = load_hf_model()
             logger.info("✅ 모델 로딩 완료")
         except Exception as e:
             raise RuntimeError(f"HuggingFace 모델 로딩 실패: {e}")
-        
-    prompt_parts = [
-        system_instruction(product).strip(),
-        css_friendly_prompt().strip(),
-    ]
+
+        hf_server = HFGenerationServer(
+            hf_model,
+            hf_tokenizer,
+            max_batch_size=4,
+            max_wait_ms=50,
+            max_input_tokens=get_token_budget("hf_page"),
+            prefix_text=hf_static_prefix(),
+            generate_kwargs=dict(
+                max_new_tokens=2048,
+                do_sample=True,
+                temperature=0.9,
+                top_p=0.95,
+                repetition_penalty=1.1
+            )
+        )
+        hf_server.start()
+        return hf_server
+
+def generate_hf(product: dict, stream_callback: Optional[Callable[[str], None]] = None) -> dict:
+    """
+    제공된 제품 정보를 바탕으로 HuggingFace를 통해 상세페이지 HTML을 생성합니다.
+    요청은 배치 생성 서버에 제출되어 다른 동시 요청과 함께 처리됩니다.
+    닫는 </html> 태그가 생성되면 즉시 생성을 중단하고, 생성된 텍스트는 스트리머를 통해 점진적으로 전달됩니다.
+
+    Args:
+        product (dict): 상세페이지 생성에 필요한 제품 정보가 담긴 딕셔너리
+        stream_callback (Callable[[str], None], optional): 새로 생성된 텍스트 조각을 받을 콜백
+
+    Returns:
+        dict: 생성된 상세페이지 HTML이 포함된 딕셔너리
+    """
+    server = get_hf_server()
+
+    # 상품별 suffix (정적 prefix는 생성 서버가 KV 캐시로 재사용)
+    # 예산 초과 시 차별점 → 상품 정보 순으로 축소하고, 끝의 생성 지시는 유지
+    prompt_parts = [{"name": "product", "text": product_info_prompt(product).strip(), "priority": 2}]
     
     # 차별점 반영
     if product.get("differences"):
@@ -149,58 +318,39 @@ def generate_hf(product: dict) -> dict:
             *[f"- {item}" for item in product["differences"]],
             "위 차별점들을 상세페이지 내용에서 자연스럽게 강조해 주세요."
         ])
-        prompt_parts.insert(1, diff_prompt)
+        prompt_parts.append({"name": "differences", "text": diff_prompt, "priority": 1})
         
     # 이미지 반영
-    image_prompt_lines = []
-    image_paths = product.get("image_path_list", [])
-
-    if image_paths:
-        image_prompt_lines = ["상세페이지 내에 다음 상품 이미지를 모두 포함시켜주세요:"]
-        for path in image_paths:
-            # HTML에서 사용할 수 있는 상대 경로로 변환
-            # backend/data/result/에서 backend/data/output/로 접근: ../output/
-            if path.startswith("backend/data/output/"):
-                # backend/data/output/xxx.png -> ../output/xxx.png
-                relative_path = path.replace("backend/data/output/", "../output/")
-            elif path.startswith("backend/data/input/"):
-                # backend/data/input/xxx.jpg -> ../input/xxx.jpg  
-                relative_path = path.replace("backend/data/input/", "../input/")
-            else:
-                # 다른 경로는 그대로 사용
-                relative_path = path
-            
-            image_prompt_lines.append(f'- <img class="product-image" src="{relative_path}" alt="...">')
-        image_prompt_lines.append("각 이미지의 alt 속성은 제품명과 특징을 바탕으로 자동 생성해주세요")
-        image_prompt_lines.append("각 이미지는 적절한 섹션에 분산하여 배치해주세요.")
-
-    prompt_parts += image_prompt_lines
-    prompt_parts += [
-        "모든 정보를 HTML로 출력해주세요. 결과는 <html> ~ </html> 태그 안에 있어야 합니다",
-        "다음은 제품 상세페이지 HTML입니다.",
-        "<!DOCTYPE html>"
-    ]
+    image_prompt_lines = build_image_prompt_lines(product.get("image_path_list", []))
+    if image_prompt_lines:
+        prompt_parts.append({"name": "images", "text": "\n".join(image_prompt_lines), "priority": None})
+
+    prompt_parts.append({
+        "name": "instruction",
+        "text": "\n".join([
+            "모든 정보를 HTML로 출력해주세요. 결과는 <html> ~ </html> 태그 안에 있어야 합니다",
+            "다음은 제품 상세페이지 HTML입니다.",
+            "<!DOCTYPE html>"
+        ]),
+        "priority": None
+    })
 
-    prompt = "\n".join(prompt_parts)
+    # prefix 토큰은 예산에서 제외하고 suffix만 맞춤
+    texts = fit_prompt_parts(
+        prompt_parts,
+        server.max_suffix_tokens() or get_token_budget("hf_page"),
+        tokenizer=hf_tokenizer,
+        label="HF 상세페이지 생성"
+    )
+    prompt = "\n".join(text for text in texts if text)
 
     logger.info("🛠️ HuggingFace 요청 시작")
     try:
-        inputs = hf_tokenizer(prompt, return_tensors="pt", truncation=True)
-        input_ids = inputs["input_ids"].to(hf_model.device)
-        attention_mask = inputs["attention_mask"].to(hf_model.device)
-
-        with torch.no_grad():
-            output_ids = hf_model.generate(
-                input_ids=input_ids,
-                attention_mask=attention_mask,
-                max_new_tokens=2048,
-                do_sample=True,
-                temperature=0.9,
-                top_p=0.95,
-                repetition_penalty=1.1
-            )
-
-        output_text = hf_tokenizer.decode(output_ids[0], skip_special_tokens=True)
+        # 프롬프트가 "<!DOCTYPE html>"로 끝나므로 생성 결과 앞에 붙여서 완전한 문서로 만듦
+        if stream_callback:
+            stream_callback("<!DOCTYPE html>")
+        generated = server.generate(prompt, stream_callback=stream_callback)
+        output_text = truncate_after_html_end("<!DOCTYPE html>" + generated)
         logger.info("✅ HuggingFace 상세페이지 생성 완료")
     except Exception as e:
         raise RuntimeError(f"HuggingFace 상세페이지 생성 실패: {e}")
@@ -3,6 +3,11 @@ from datetime import datetime, timedelta, timezone
 from utils.logger import get_logger
 from utils.config import load_config
 from backend.text_generator.text_generator import generate_openai, generate_hf
+from backend.text_generator.section_generator import generate_sections
+from backend.text_generator.content_generator import generate_template
+from backend.text_generator.page_store import find_reusable_page, rebuild_page, save_page_meta
+from backend.text_generator.progress import fail_progress, publish_progress
+from backend.page_generator.html_store import remember_html, persist_html
 
 logger = get_logger(__name__)
 
@@ -12,10 +17,8 @@ def text_generator_main(product: dict):
     result_path = config["data"]["result_path"]
     
     engine = product.get("engine", "openai")
-    if engine == "openai":
-        result = generate_openai(product)
-    else:
-        result = generate_hf(product)
+    stream = product.get("stream", False)
+    generate = select_generator(engine, product.get("mode", "full"))
     
     logger.debug(f"🛠️ 파일명 생성 시작")
     KST = timezone(timedelta(hours=9))
@@ -24,13 +27,137 @@ def text_generator_main(product: dict):
 
     os.makedirs(result_path, exist_ok=True)
     full_result_path = os.path.join(result_path, filename)
+    alias = product.get("user_session_id")
 
-    try:
-        with open(full_result_path, "w", encoding="utf-8") as f:
-            f.write(result["html_text"])
-            logger.info(f"✅ HTML 상세페이지 저장 완료: {full_result_path}")
-    except Exception as e:
-        raise RuntimeError(f"❌ HTML 저장 실패: {e}")
+    # 텍스트 입력이 같은 이전 페이지가 있으면 LLM 호출 없이 이미지만 반영
+    reused = None if product.get("force_regenerate") else _reuse_previous_page(result_path, product)
+    product["reused_from"] = reused[1] if reused else None
+    if reused:
+        result = reused[0]
+        publish_progress(session_id, alias=alias, status="generating", chars=0, html_path=full_result_path)
+        _save_html(full_result_path, result["html_text"], session_id)
+    elif stream:
+        result = _generate_streaming(generate, product, full_result_path, session_id, alias)
+    else:
+        publish_progress(session_id, alias=alias, status="generating", chars=0, html_path=full_result_path)
+        try:
+            result = generate(product)
+        except Exception:
+            publish_progress(session_id, status="failed")
+            raise
+        _save_html(full_result_path, result["html_text"], session_id)
     
+    save_page_meta(result_path, session_id, product, content=result.get("content"), reused_from=product.get("reused_from"))
+    publish_progress(session_id, status="done", chars=len(result["html_text"]))
     product["session_id"] = session_id
-    return product
\ No newline at end of file
+    return product
+
+
+def _reuse_previous_page(result_path: str, product: dict):
+    """
+    상품 텍스트와 차별점이 같은 이전 페이지를 찾아 새 이미지 목록으로 다시 만듭니다.
+
+    Args:
+        result_path (str): 결과 디렉토리 경로
+        product (dict): 상품 정보 딕셔너리
+
+    Returns:
+        tuple: (생성 결과 딕셔너리, 원본 session_id) (재사용할 수 없으면 None)
+    """
+    meta = find_reusable_page(result_path, product)
+    if meta is None:
+        return None
+
+    try:
+        html_text = rebuild_page(meta, product)
+    except Exception as e:
+        logger.warning(f"⚠️ 이전 페이지 재사용 실패, 전체 생성으로 진행합니다: {e}")
+        return None
+    if html_text is None:
+        logger.info("🛠️ 이전 페이지에서 교체할 이미지를 찾지 못해 전체 생성으로 진행합니다")
+        return None
+
+    logger.info(f"✅ 이전 페이지 재사용 (LLM 호출 생략): {meta['session_id']}")
+    return {"html_text": html_text, "content": meta.get("content")}, meta["session_id"]
+
+
+def select_generator(engine: str, mode: str):
+    """
+    엔진과 생성 모드에 맞는 생성 함수를 반환합니다.
+
+    Args:
+        engine (str): "openai" 또는 "hf"
+        mode (str): "full"(한 번에 전체 HTML), "sections"(섹션 병렬 생성), "template"(JSON 콘텐츠 + 템플릿)
+
+    Returns:
+        Callable: generate(product, stream_callback=None) 형태의 생성 함수
+    """
+    if engine != "openai":
+        if mode != "full":
+            logger.warning(f"⚠️ {mode} 모드는 openai 엔진만 지원합니다. 전체 생성으로 진행합니다: engine={engine}")
+        return generate_hf
+
+    if mode == "sections":
+        return generate_sections
+    if mode == "template":
+        return generate_template
+    return generate_openai
+
+
+def _generate_streaming(generate, product: dict, html_path: str, session_id: str, alias: str = None) -> dict:
+    """
+    생성 결과를 스트리밍으로 받아 HTML 파일에 조각 단위로 이어 쓰고, 진행 상태를 게시합니다.
+    프론트엔드는 생성 도중에도 파일과 진행 상태(/output/progress)로 미리보기를 할 수 있습니다.
+
+    Args:
+        generate (Callable): generate_openai 또는 generate_hf
+        product (dict): 상품 정보 딕셔너리
+        html_path (str): 저장할 HTML 파일 경로
+        session_id (str): 상세페이지 세션 ID
+        alias (str, optional): 진행 상태 조회용 별칭 (user_session_id)
+
+    Returns:
+        dict: 생성된 상세페이지 HTML이 포함된 딕셔너리
+    """
+    written = 0
+    streamed = []
+    publish_progress(session_id, alias=alias, status="streaming", chars=0, html_path=html_path)
+
+    try:
+        with open(html_path, "w", encoding="utf-8") as f:
+            def _on_chunk(text: str):
+                nonlocal written
+                f.write(text)
+                f.flush()
+                streamed.append(text)
+                written += len(text)
+                publish_progress(session_id, chars=written)
+
+            result = generate(product, stream_callback=_on_chunk)
+        logger.info(f"✅ 스트리밍 HTML 저장 완료: {html_path} ({written}자)")
+    except Exception:
+        publish_progress(session_id, status="failed")
+        raise
+
+    # 최종 정제 결과가 스트리밍된 내용과 다르면(HF strict 정제 등) 한 번 더 덮어씀
+    if "".join(streamed) != result["html_text"]:
+        _save_html(html_path, result["html_text"], session_id)
+    else:
+        remember_html(session_id, result["html_text"])
+
+    return result
+
+
+def _save_html(html_path: str, html_text: str, session_id: str):
+    """
+    HTML을 메모리에 보관하고 파일 저장은 백그라운드로 넘깁니다.
+    렌더링 단계는 메모리의 HTML을 바로 사용하므로 파일 쓰기를 기다리지 않습니다.
+    """
+    remember_html(session_id, html_text)
+
+    def _on_saved(done):
+        # 렌더링은 메모리의 HTML을 사용하므로, 이미 done으로 보고된 세션은 실패로 바꾸지 않음
+        if done.exception() is not None and not fail_progress(session_id):
+            logger.warning(f"⚠️ 완료된 세션의 HTML 파일 저장 실패 (진행 상태 유지): {session_id}")
+
+    persist_html(html_path, html_text).add_done_callback(_on_saved)
@@ -224,10 +224,15 @@ def compose_images(composition_data: Dict[str, Any]) -> Optional[Dict[str, Any]]
     result = api_client._make_request("POST", "/input/compose", json=composition_data)
     return result
 
-def generate_detail_page(generation_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """상세페이지 생성 API 호출"""
-    logger.debug("🛠️ 상세페이지 생성 API 호출 함수")
-    result = api_client._make_request("POST", "/output/create-page", json=generation_data)
+def generate_detail_page(
+    generation_data: Dict[str, Any], force_regenerate: bool = False, stream: bool = True
+) -> Optional[Dict[str, Any]]:
+    """상세페이지 생성 API 호출 (force_regenerate=True면 텍스트부터 새로 생성, stream=True면 /output/progress로 진행 상태 조회 가능)"""
+    logger.debug(f"🛠️ 상세페이지 생성 API 호출 함수 (force_regenerate={force_regenerate}, stream={stream})")
+    params = {"stream": "true" if stream else "false"}
+    if force_regenerate:
+        params["force_regenerate"] = "true"
+    result = api_client._make_request("POST", "/output/create-page", json=generation_data, params=params)
     return result
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ import sys
 from typing import Dict, Any, Optional
 from pathlib import Path
 import json
+import mimetypes
 import zipfile
 import tempfile
 from datetime import datetime
@@ -12,6 +13,10 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.logger import get_logger
 
+# API 클라이언트 임포트
+sys.path.append(str(Path(__file__).parent.parent))
+from api import generate_detail_page
+
 # 로거 설정
 logger = get_logger(__name__)
 
@@ -54,8 +59,8 @@ def display_result_image(result_data: Dict[str, Any]):
     # session_id 기반으로 이미지 경로 생성
     session_id = result_data.get('session_id')
     if session_id:
-        # 상세페이지 생성 결과 이미지 (PNG)
-        image_filename = f"page_{session_id}.png"
+        # 상세페이지 생성 결과 이미지 (렌더링 포맷에 따라 PNG/WebP/JPEG)
+        image_filename = os.path.basename(result_data.get('image_path') or f"page_{session_id}.png")
         image_path = f"backend/data/result/{image_filename}"
         logger.debug(f"🛠️ session_id 기반 이미지 경로: {image_path}")
     else:
@@ -323,7 +328,7 @@ def display_download_section(image_path: Path, html_path: Path = None, result_da
                     label="🖼️ 이미지 다운로드",
                     data=file.read(),
                     file_name=image_path.name,
-                    mime="image/png",
+                    mime=mimetypes.guess_type(image_path.name)[0] or "image/png",
                     use_container_width=True
                 )
         else:
@@ -410,6 +415,24 @@ def display_generation_details(result_data: Dict[str, Any]):
         if result_data.get('session_id'):
             st.write(f"**세션 ID:** `{result_data['session_id']}`")
 
+def handle_force_regeneration(result_data: Dict[str, Any]):
+    """같은 입력으로 이전 페이지를 재사용하지 않고 텍스트부터 새로 생성"""
+    logger.debug("🛠️ 상세페이지 새로 생성 시작")
+    generation_data = {
+        key: value for key, value in result_data.items()
+        if key not in ('session_id', 'reused_from', 'force_regenerate')
+    }
+    with st.spinner("상세페이지를 새로 생성하는 중... (30초~1분 소요)"):
+        result = generate_detail_page(generation_data, force_regenerate=True)
+    if result and result.get('success') and result.get('data'):
+        st.session_state[get_user_session_key('detail_page_result')] = result['data']
+        st.session_state.detail_page_result = result['data']
+        logger.info(f"✅ 상세페이지 새로 생성 완료: {result['data'].get('session_id')}")
+        st.rerun()
+    else:
+        error_msg = result.get('error', '알 수 없는 오류') if result else 'API 호출 실패'
+        st.error(f"❌ 상세페이지 새로 생성 실패: {error_msg}")
+
 def main():
     """결과 페이지 메인"""
     logger.debug("🛠️ 결과 페이지 시작")
@@ -485,6 +508,12 @@ def main():
     
     # 생성 상세 정보
     # display_generation_details(result_data)
+
+    # 같은 입력이면 이전 페이지를 재사용하므로, 새 문구가 필요할 때만 강제로 다시 생성
+    if result_data.get('reused_from'):
+        st.caption(f"ℹ️ 입력이 같은 이전 페이지(`{result_data['reused_from']}`)의 문구를 재사용했습니다.")
+    if st.button("♻️ 문구 새로 생성", use_container_width=True, key="force_regenerate_detail_page"):
+        handle_force_regeneration(result_data)
     
     # 네비게이션 버튼
     st.markdown("---")
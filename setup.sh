@@ -12,4 +12,6 @@ pip install -r requirements.txt
 
 # 4. Playwright 설치
 playwright install chromium
-python -m playwright install-deps
\ No newline at end of file
+python -m playwright install-deps
+# 5. 렌더링용 오프라인 에셋 번들 다운로드 (Tailwind, Noto Sans KR, Font Awesome)
+python -m backend.page_generator.asset_bundle
@@ -0,0 +1,162 @@
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+
+
+class FakeConnection:
+    """
+    실행된 SQL을 기록하는 가짜 DB 연결 (커서 역할도 겸합니다).
+    SELECT 결과로 fetchone()은 row, fetchall()은 rows를 돌려주고, fail_on이 포함된 SQL을 실행하면 예외를 냅니다.
+    """
+
+    def __init__(self, row=None, rows=(), fail_on: str = None):
+        self.row = row
+        self.rows = list(rows)
+        self.fail_on = fail_on
+        self.executed = []
+        self.began = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+        self.ping_error = None
+        self.rollback_error = None
+
+    def begin(self):
+        self.began = True
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+        if self.rollback_error:
+            raise self.rollback_error
+
+    def ping(self, reconnect=False):
+        if self.ping_error:
+            raise self.ping_error
+
+    def close(self):
+        self.closed = True
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    def _check(self, sql: str):
+        if self.fail_on and self.fail_on in sql:
+            raise ConnectionError("lost")
+
+    def execute(self, sql: str, params=None):
+        self._check(sql)
+        self.executed.append((" ".join(sql.split()), params))
+        return 1
+
+    def executemany(self, sql: str, rows):
+        self._check(sql)
+        self.executed.append((" ".join(sql.split()), list(rows)))
+        return len(rows)
+
+    def fetchone(self):
+        return self.row
+
+    def fetchall(self):
+        return self.rows
+
+    def updates(self) -> list:
+        return [(sql, params) for sql, params in self.executed if sql.startswith("UPDATE")]
+
+
+@pytest.fixture
+def db_connection(monkeypatch):
+    """
+    모듈의 db_connection을 가짜 연결을 내주는 함수로 바꾸는 patch(module, conn=None)를 반환합니다.
+    patch()는 사용할 FakeConnection을 반환합니다.
+    """
+    def patch(module, conn: FakeConnection = None) -> FakeConnection:
+        conn = conn or FakeConnection()
+
+        @contextmanager
+        def fake_db_connection(*args):
+            yield conn
+
+        monkeypatch.setattr(module, "db_connection", fake_db_connection)
+        return conn
+
+    return patch
+
+
+def search_page(*product_ids: str) -> str:
+    """
+    상품 번호 목록으로 검색 결과 페이지를 만듭니다. (링크가 없는 광고 항목을 끝에 포함)
+    """
+    items = "".join(
+        f'<li class="ProductUnit_productUnit__a1"><a href="/vp/products/{product_id}">상품{product_id}</a></li>\n'
+        for product_id in product_ids
+    )
+    return (
+        '<html><body><ul id="product-list">\n' + items
+        + '<li class="ProductUnit_productUnit__a1"><span>광고</span></li>\n</ul></body></html>'
+    )
+
+
+class _ShopHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requested.append(self.path)
+        body = self.server.route(urlparse(self.path))
+        if body is None:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ShopServer(ThreadingHTTPServer):
+    """
+    route 테이블로 응답하는 가짜 쇼핑몰 서버. 요청된 경로(쿼리 포함)는 requested에 기록합니다.
+
+    route 테이블은 {경로: 응답}이며, 응답은 HTML 문자열이거나 (나머지 경로, 쿼리 dict)를 받아
+    HTML을 반환하는 함수입니다. "/"로 끝나는 경로는 그 하위 경로 전체에 대응하고, None을 반환하면 404입니다.
+    """
+
+    def __init__(self, routes: dict):
+        super().__init__(("127.0.0.1", 0), _ShopHandler)
+        self.routes = routes
+        self.requested = []
+        self.url = f"http://127.0.0.1:{self.server_port}"
+
+    def route(self, parsed):
+        for path, response in self.routes.items():
+            if parsed.path == path or (path.endswith("/") and parsed.path.startswith(path)):
+                if isinstance(response, str):
+                    return response
+                return response(parsed.path[len(path):], parse_qs(parsed.query))
+        return None
+
+
+@pytest.fixture(scope="module")
+def shop_server():
+    """
+    shop_server(routes)로 가짜 쇼핑몰 서버를 띄워 ShopServer를 반환하는 함수를 제공합니다. (모듈이 끝나면 종료)
+    """
+    servers = []
+
+    def start(routes: dict) -> ShopServer:
+        server = ShopServer(routes)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
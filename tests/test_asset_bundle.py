@@ -0,0 +1,37 @@
+import json
+import os
+import backend.page_generator.asset_bundle as asset_bundle
+
+TAILWIND_URL = "https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css"
+
+
+def _write_manifest(path, assets: dict, mtime: float):
+    path.write_text(json.dumps({"version": "test", "assets": assets}), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_bundle_downloaded_after_first_use_is_picked_up(tmp_path, monkeypatch):
+    manifest_path = tmp_path / "manifest.json"
+    monkeypatch.setattr(asset_bundle, "MANIFEST_PATH", str(manifest_path))
+
+    # 번들이 없을 때의 빈 결과는 캐시되지 않음
+    assert asset_bundle.load_manifest() == {}
+    assert not asset_bundle.is_bundled(TAILWIND_URL)
+
+    _write_manifest(manifest_path, {TAILWIND_URL: {"path": "a.css", "content_type": "text/css"}}, 1_000_000)
+
+    assert asset_bundle.load_manifest() == {
+        TAILWIND_URL: {"path": str(tmp_path / "a.css"), "content_type": "text/css"}
+    }
+    assert asset_bundle.is_bundled(TAILWIND_URL)
+
+
+def test_rewritten_manifest_is_reloaded(tmp_path, monkeypatch):
+    manifest_path = tmp_path / "manifest.json"
+    monkeypatch.setattr(asset_bundle, "MANIFEST_PATH", str(manifest_path))
+    _write_manifest(manifest_path, {}, 1_000_000)
+    assert asset_bundle.load_manifest() == {}
+
+    _write_manifest(manifest_path, {TAILWIND_URL: {"path": "b.css", "content_type": "text/css"}}, 2_000_000)
+
+    assert asset_bundle.is_bundled(TAILWIND_URL)
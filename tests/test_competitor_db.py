@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+import pytest
+import backend.competitor_analysis.competitor_db as competitor_db
+import backend.competitor_analysis.crawl_signal_server as crawl_signal_server
+from backend.competitor_analysis.db_pool import run_in_db_executor
+from backend.competitor_analysis.review_parser import review_hash
+from conftest import FakeConnection
+
+DB_ARGS = ("localhost", "user", "password", "db")
+BLOCKING_SECONDS = 0.3
+PRODUCT_REVIEWS = [
+    ("https://shop.example.com/vp/products/1", ["사이즈가 작아요"]),
+    ("https://shop.example.com/vp/products/2", ["사이즈가 작아요", "색이 달라요"]),
+]
+
+
+async def _count_ticks(coro) -> tuple:
+    """
+    coro를 기다리는 동안 이벤트 루프가 다른 작업을 처리한 횟수를 셉니다.
+    """
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        result = await coro
+    finally:
+        done.set()
+        await ticker_task
+    return result, ticks
+
+
+def _blocking(calls: list, result=None):
+    def _call(*args, **kwargs):
+        calls.append((threading.current_thread().name, args))
+        time.sleep(BLOCKING_SECONDS)
+        return result
+    return _call
+
+
+@pytest.mark.asyncio
+async def test_run_in_db_executor_does_not_block_loop():
+    calls = []
+
+    result, ticks = await _count_ticks(run_in_db_executor(_blocking(calls, "row"), "a", key="b"))
+
+    assert result == "row"
+    assert calls[0][0].startswith("competitor-db")
+    # 블로킹 호출 동안 ticker가 여러 번 실행되어야 함 (루프가 막혔다면 1회)
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_aget_latest_review_summary_runs_in_db_executor(monkeypatch):
+    calls = []
+    monkeypatch.setattr(competitor_db, "get_latest_review_summary", _blocking(calls, "요약"))
+
+    summary, ticks = await _count_ticks(
+        competitor_db.aget_latest_review_summary(*DB_ARGS, "양복", use_cache=False)
+    )
+
+    assert summary == "요약"
+    assert calls == [(calls[0][0], (*DB_ARGS, "양복", False))]
+    assert calls[0][0].startswith("competitor-db")
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_ainsert_review_summary_runs_in_db_executor(monkeypatch):
+    calls = []
+    monkeypatch.setattr(competitor_db, "insert_review_summary", _blocking(calls))
+
+    _, ticks = await _count_ticks(competitor_db.ainsert_review_summary(*DB_ARGS, "양복", "요약", 3))
+
+    assert calls[0][1] == (*DB_ARGS, "양복", "요약", 3)
+    assert calls[0][0].startswith("competitor-db")
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_asend_crawl_request_signal_runs_in_db_executor(monkeypatch):
+    calls = []
+    monkeypatch.setattr(crawl_signal_server, "send_crawl_request_signal", _blocking(calls))
+
+    _, ticks = await _count_ticks(crawl_signal_server.asend_crawl_request_signal(*DB_ARGS, "양복"))
+
+    assert calls[0][1] == (*DB_ARGS, "양복")
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_overlap():
+    calls = []
+    started = time.perf_counter()
+
+    await asyncio.gather(*(run_in_db_executor(_blocking(calls)) for _ in range(3)))
+
+    # DB 전용 스레드 풀(max_size >= 3)에서 동시에 실행되므로 순차 실행보다 빨라야 함
+    assert len(calls) == 3
+    assert time.perf_counter() - started < BLOCKING_SECONDS * 2.5
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    calls = []
+
+    class FakeCache:
+        def invalidate(self, category, min_version=None):
+            calls.append((category, min_version))
+
+    monkeypatch.setattr(competitor_db, "get_summary_cache", lambda *args: FakeCache())
+    return calls
+
+
+def test_reviews_and_summary_are_saved_in_one_transaction(db_connection, invalidated):
+    conn = db_connection(competitor_db, FakeConnection(row=(4,)))
+
+    inserted = competitor_db.insert_reviews_with_summary(*DB_ARGS, "양복", PRODUCT_REVIEWS, "요약", num_stored=5)
+
+    assert inserted == 3
+    assert conn.began
+    assert conn.commits == 1
+    (review_sql, rows), (summary_sql, summary_params), _ = conn.executed
+    assert review_sql.startswith("INSERT IGNORE INTO competitor_reviews")
+    # 같은 리뷰라도 상품이 다르면 각각 저장
+    assert [(row[0], row[2]) for row in rows] == [
+        (review_hash("사이즈가 작아요"), "https://shop.example.com/vp/products/1"),
+        (review_hash("사이즈가 작아요"), "https://shop.example.com/vp/products/2"),
+        (review_hash("색이 달라요"), "https://shop.example.com/vp/products/2"),
+    ]
+    assert summary_sql.startswith("INSERT INTO competitor_review_summary")
+    assert summary_params[:3] == ("양복", "요약", 8)
+    assert invalidated == [("양복", 4)]
+
+
+def test_failed_summary_write_is_not_committed(db_connection, invalidated):
+    conn = db_connection(competitor_db, FakeConnection(fail_on="competitor_review_summary"))
+
+    with pytest.raises(ConnectionError):
+        competitor_db.insert_reviews_with_summary(*DB_ARGS, "양복", PRODUCT_REVIEWS, "요약", num_stored=0)
+
+    # 원본 리뷰 INSERT도 commit되지 않음 (연결 풀이 rollback)
+    assert conn.commits == 0
+    assert invalidated == []
+
+
+def test_insert_review_summary_reports_failure(db_connection, invalidated):
+    db_connection(competitor_db, FakeConnection(fail_on="competitor_review_summary"))
+
+    assert competitor_db.insert_review_summary(*DB_ARGS, "양복", "요약", 3) is False
+    assert invalidated == []
+
+
+def test_insert_review_summary_reports_success(db_connection, invalidated):
+    db_connection(competitor_db, FakeConnection(row=(4,)))
+
+    assert competitor_db.insert_review_summary(*DB_ARGS, "양복", "요약", 3) is True
+    assert invalidated == [("양복", 4)]
+
+
+def test_touch_review_summary_passes_timestamp(db_connection):
+    conn = db_connection(competitor_db)
+
+    competitor_db.touch_review_summary(*DB_ARGS, "양복")
+
+    [(sql, (crawled_at, category))] = conn.executed
+    assert "NOW()" not in sql
+    assert category == "양복"
+    assert len(crawled_at) == len("2025-01-01 00:00:00")
@@ -0,0 +1,102 @@
+import pytest
+import backend.competitor_analysis.crawl_signal_server as crawl_signal_server
+from backend.competitor_analysis.crawl_signal_server import (
+    DEFAULT_LEASE_SECONDS,
+    MAX_ATTEMPTS,
+    RETRY_BACKOFF_SECONDS,
+    claim_crawl_request,
+    finish_crawl_request,
+)
+from backend.competitor_analysis.summary_notifier import SUMMARY_EMPTY
+
+DB_ARGS = ("localhost", "user", "password", "db")
+
+
+@pytest.fixture
+def conn(db_connection):
+    return db_connection(crawl_signal_server)
+
+
+@pytest.fixture
+def published(monkeypatch):
+    events = []
+    monkeypatch.setattr(
+        crawl_signal_server, "publish_summary_event",
+        lambda host, user, password, db, category, status: events.append((category, status))
+    )
+    return events
+
+
+def test_claim_returns_none_without_pending_signal(conn, published):
+    assert claim_crawl_request(*DB_ARGS, "worker-1") is None
+
+    assert conn.began
+    assert conn.commits == 1
+    assert conn.updates() == []
+    assert published == []
+
+
+def test_claim_skips_signals_waiting_for_retry(conn):
+    claim_crawl_request(*DB_ARGS, "worker-1")
+
+    select_sql = conn.executed[0][0]
+    assert "FOR UPDATE SKIP LOCKED" in select_sql
+    assert "(next_attempt_at IS NULL OR next_attempt_at <= NOW())" in select_sql
+    assert "lease_expires_at < NOW()" in select_sql
+
+
+def test_claim_leases_signal_and_counts_attempt(conn, published):
+    conn.row = (7, "양복", 0)
+
+    claimed = claim_crawl_request(*DB_ARGS, "worker-1")
+
+    assert claimed == (7, "양복", 1)
+    [(sql, params)] = conn.updates()
+    assert "status='running'" in sql
+    assert "attempts=attempts+1" in sql
+    assert params == ("worker-1", DEFAULT_LEASE_SECONDS, 7)
+    assert conn.commits == 1
+    assert published == []
+
+
+def test_claim_of_expired_lease_continues_attempt_count(conn, published):
+    # lease가 만료된 running 신호를 다른 워커가 다시 가져가는 경우
+    conn.row = (7, "양복", MAX_ATTEMPTS - 1)
+
+    claimed = claim_crawl_request(*DB_ARGS, "worker-2", lease_seconds=60)
+
+    assert claimed == (7, "양복", MAX_ATTEMPTS)
+    assert conn.updates()[0][1] == ("worker-2", 60, 7)
+
+
+def test_claim_marks_exhausted_signal_failed_and_notifies(conn, published):
+    conn.row = (7, "양복", MAX_ATTEMPTS)
+
+    assert claim_crawl_request(*DB_ARGS, "worker-1") is None
+
+    [(sql, params)] = conn.updates()
+    assert "status='failed'" in sql
+    assert "active_key=NULL" in sql
+    assert params == (7,)
+    # 기다리는 요청이 시간 초과까지 기다리지 않도록 알림
+    assert published == [("양복", SUMMARY_EMPTY)]
+
+
+def test_finish_success_marks_signal_done(conn):
+    finish_crawl_request(*DB_ARGS, 7, "worker-1", success=True)
+
+    [(sql, params)] = conn.updates()
+    assert "status='done'" in sql
+    assert "active_key=NULL" in sql
+    assert params[1:] == (7, "worker-1")
+
+
+def test_finish_failure_returns_signal_with_backoff(conn):
+    finish_crawl_request(*DB_ARGS, 7, "worker-1", success=False)
+
+    [(sql, params)] = conn.updates()
+    assert "status='pending'" in sql
+    assert "worker_id=NULL" in sql
+    # 바로 다시 점유되지 않도록 다음 시도 시각을 뒤로 미룸
+    assert "next_attempt_at=NOW() + INTERVAL %s * POW(2, GREATEST(attempts - 1, 0)) SECOND" in sql
+    assert params == (RETRY_BACKOFF_SECONDS, 7, "worker-1")
@@ -0,0 +1,127 @@
+import json
+import shutil
+import pytest
+import backend.competitor_analysis.crawler as crawler
+from backend.competitor_analysis.driver_pool import shutdown_driver_pool
+from backend.competitor_analysis.review_parser import review_hash
+from conftest import search_page
+
+# 상품 번호 → 필터별 리뷰 페이지 목록
+PRODUCT_REVIEWS = {
+    "1": {
+        "나쁨": [["사이즈가 작아요", "색이 달라요"], ["바느질이 엉망"]],
+        "별로": [["배송이 느려요"]],
+    },
+    "2": {
+        "나쁨": [["원단이 얇아요"]],
+        "별로": [["냄새가 나요", "단추가 떨어져요"]],
+    },
+    "3": {
+        "나쁨": [["보풀이 생겨요"]],
+        "별로": [],
+    },
+}
+
+# 필터 드롭다운과 페이지 버튼을 누르면 리뷰 목록을 새 노드로 다시 그리는 상품 페이지
+PRODUCT_PAGE = """<html><body>
+<div class="review-star-search-current-selection">전체</div>
+<ul class="review-star-search-selector" style="display:none">
+  <li><div class="review-star-search-item"><span class="review-star-search-item-desc">나쁨</span></div></li>
+  <li><div class="review-star-search-item"><span class="review-star-search-item-desc">별로</span></div></li>
+</ul>
+<div class="js_reviewArticleListContainer"></div>
+<button class="sdp-review__article__page__button--next disabled">다음</button>
+<script>
+const REVIEWS = __REVIEWS__;
+const container = document.querySelector(".js_reviewArticleListContainer");
+const selector = document.querySelector(".review-star-search-selector");
+const next = document.querySelector(".sdp-review__article__page__button--next");
+let current = null, page = 0;
+function render() {
+  const pages = REVIEWS[current] || [];
+  container.innerHTML = (pages[page] || []).map(text =>
+    '<article><div class="sdp-review__article__list__review__content"><span>' + text + '</span></div></article>'
+  ).join("");
+  next.className = "sdp-review__article__page__button--next" + (page + 1 < pages.length ? "" : " disabled");
+}
+document.querySelector(".review-star-search-current-selection").onclick = () => { selector.style.display = "block"; };
+for (const li of selector.querySelectorAll("li")) {
+  li.onclick = () => {
+    current = li.textContent.trim(); page = 0; selector.style.display = "none";
+    setTimeout(render, 50);
+  };
+}
+next.onclick = () => { page += 1; setTimeout(render, 50); };
+</script>
+</body></html>"""
+
+
+def _product_page(product_id: str, query: dict) -> str:
+    if product_id not in PRODUCT_REVIEWS:
+        return None
+    return PRODUCT_PAGE.replace("__REVIEWS__", json.dumps(PRODUCT_REVIEWS[product_id], ensure_ascii=False))
+
+
+@pytest.fixture(scope="module")
+def shop(shop_server):
+    return shop_server({"/np/search": search_page("1", "2", "3"), "/vp/products/": _product_page}).url
+
+
+@pytest.fixture(scope="module")
+def driver():
+    if not any(shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser", "chrome")):
+        pytest.skip("Chrome이 설치되어 있지 않음")
+    try:
+        driver = crawler.init_safe_driver(headless=True, crawl_profile=True)
+    except Exception as e:
+        pytest.skip(f"Chrome 드라이버를 시작할 수 없음: {type(e).__name__}: {e}")
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def search_url(shop, monkeypatch):
+    monkeypatch.setenv("BASE_SEARCH_URL", f"{shop}/np/search")
+    return shop
+
+
+def test_collect_product_links(driver, search_url):
+    links = crawler.collect_product_links(driver, "양복", max_products=2)
+
+    assert links == [f"{search_url}/vp/products/1", f"{search_url}/vp/products/2"]
+
+
+def test_crawl_reviews_by_link_pages_through_both_filters(driver, search_url):
+    reviews = crawler.crawl_reviews_by_link(driver, f"{search_url}/vp/products/1", max_reviews=10)
+
+    assert reviews == ["사이즈가 작아요", "색이 달라요", "바느질이 엉망", "배송이 느려요"]
+
+
+def test_crawl_reviews_by_link_stops_at_max_reviews(driver, search_url):
+    reviews = crawler.crawl_reviews_by_link(driver, f"{search_url}/vp/products/1", max_reviews=2)
+
+    assert reviews == ["사이즈가 작아요", "색이 달라요"]
+
+
+def test_known_reviews_stop_paging(driver, search_url):
+    known = {review_hash("사이즈가 작아요"), review_hash("색이 달라요")}
+
+    reviews = crawler.crawl_reviews_by_link(driver, f"{search_url}/vp/products/1", max_reviews=10, known=known)
+
+    # '나쁨' 첫 페이지가 모두 저장된 리뷰이므로 다음 페이지는 넘기지 않고 '별로'로 넘어감
+    assert reviews == ["배송이 느려요"]
+
+
+def test_crawl_product_reviews_by_category_in_browser_mode(driver, search_url, monkeypatch):
+    monkeypatch.setattr(crawler, "_get_crawl_mode", lambda: "browser")
+    try:
+        results = crawler.crawl_product_reviews_by_category("양복", max_products=3, max_reviews_per_product=10)
+    finally:
+        shutdown_driver_pool()
+
+    # 드라이버 풀에서 동시에 크롤링해도 결과는 상품 순서대로
+    assert results == [
+        (f"{search_url}/vp/products/1", ["사이즈가 작아요", "색이 달라요", "바느질이 엉망", "배송이 느려요"]),
+        (f"{search_url}/vp/products/2", ["원단이 얇아요", "냄새가 나요", "단추가 떨어져요"]),
+        (f"{search_url}/vp/products/3", ["보풀이 생겨요"]),
+    ]
@@ -0,0 +1,147 @@
+import threading
+import pytest
+import backend.competitor_analysis.db_pool as db_pool
+from backend.competitor_analysis.db_pool import ConnectionPool
+from conftest import FakeConnection
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """pymysql.connect를 가짜 연결을 만드는 함수로 바꾸고, 만들어진 연결 목록을 반환합니다."""
+    created = []
+
+    def fake_connect(**kwargs):
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    monkeypatch.setattr(db_pool.pymysql, "connect", fake_connect)
+    return created
+
+
+def _pool(**options) -> ConnectionPool:
+    return ConnectionPool("localhost", "user", "password", "db", **options)
+
+
+def test_returned_connection_is_reused(connections):
+    pool = _pool(max_size=2)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert len(connections) == 1
+    stats = pool.get_stats()
+    assert stats["checkouts"] == 2
+    assert stats["created"] == 1
+    assert stats["idle"] == 1
+
+
+def test_concurrent_checkouts_open_separate_connections(connections):
+    pool = _pool(max_size=2)
+
+    with pool.connection() as first:
+        with pool.connection() as second:
+            assert first is not second
+    assert pool.get_stats()["opened"] == 2
+
+
+def test_checkout_times_out_when_pool_is_exhausted(connections):
+    pool = _pool(max_size=1, checkout_timeout=0.1)
+
+    with pool.connection():
+        with pytest.raises(TimeoutError):
+            with pool.connection():
+                pass
+    assert pool.get_stats()["timeouts"] == 1
+
+
+def test_waiting_checkout_gets_connection_on_return(connections):
+    pool = _pool(max_size=1, checkout_timeout=5)
+    acquired = threading.Event()
+    release = threading.Event()
+    borrowed = []
+
+    def hold():
+        with pool.connection() as conn:
+            borrowed.append(conn)
+            acquired.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    acquired.wait(5)
+    threading.Timer(0.1, release.set).start()
+    with pool.connection() as conn:
+        assert conn is borrowed[0]
+    holder.join(5)
+    assert len(connections) == 1
+
+
+def test_connection_failing_ping_is_discarded(connections):
+    pool = _pool(max_size=1, ping_interval=0)
+
+    with pool.connection() as broken:
+        pass
+    broken.ping_error = ConnectionError("gone away")
+
+    with pool.connection() as conn:
+        assert conn is not broken
+    assert broken.closed
+    stats = pool.get_stats()
+    assert stats["ping_failures"] == 1
+    assert stats["discarded"] == 1
+    assert stats["opened"] == 1
+
+
+def test_error_in_block_rolls_back_and_returns_connection(connections):
+    pool = _pool(max_size=1)
+
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            raise ValueError("query failed")
+
+    assert conn.rollbacks == 1
+    assert not conn.closed
+    with pool.connection() as again:
+        assert again is conn
+
+
+def test_failed_rollback_discards_connection(connections):
+    pool = _pool(max_size=1)
+
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            conn.rollback_error = ConnectionError("lost")
+            raise ValueError("query failed")
+
+    assert conn.closed
+    with pool.connection() as replacement:
+        assert replacement is not conn
+    assert pool.get_stats()["discarded"] == 1
+
+
+def test_expired_connection_is_recycled(connections):
+    pool = _pool(max_size=1, max_lifetime=0)
+
+    with pool.connection() as old:
+        pass
+    with pool.connection() as new:
+        assert new is not old
+    assert old.closed
+    assert pool.get_stats()["recycled"] == 1
+
+
+def test_close_closes_idle_connections(connections):
+    pool = _pool(max_size=2)
+    with pool.connection() as conn:
+        pass
+
+    pool.close()
+
+    assert conn.closed
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            pass
@@ -0,0 +1,139 @@
+import threading
+import time
+import pytest
+from backend.competitor_analysis.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Chrome 없이 DriverPool을 시험하는 가짜 드라이버. alive가 False면 execute_script가 실패합니다."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script: str):
+        if not self.alive:
+            raise ConnectionError("chrome not reachable")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def drivers():
+    return []
+
+
+@pytest.fixture
+def factory(drivers):
+    def create() -> FakeDriver:
+        driver = FakeDriver(len(drivers))
+        drivers.append(driver)
+        return driver
+    return create
+
+
+def test_returned_driver_is_reused(factory, drivers):
+    pool = DriverPool(factory, pool_size=2)
+
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+    assert len(drivers) == 1
+    stats = pool.get_stats()
+    assert stats["acquires"] == 2
+    assert stats["created"] == 1
+    assert stats["drivers"] == 1
+
+
+def test_concurrent_acquires_are_bounded_by_pool_size(factory, drivers):
+    pool = DriverPool(factory, pool_size=2)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def crawl():
+        nonlocal active, peak
+        with pool.acquire(timeout=5):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=crawl) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert peak == 2
+    assert len(drivers) == 2
+    assert pool.get_stats()["acquires"] == 6
+
+
+def test_acquire_times_out_when_pool_is_exhausted(factory):
+    pool = DriverPool(factory, pool_size=1)
+
+    with pool.acquire():
+        with pytest.raises(TimeoutError):
+            with pool.acquire(timeout=0.1):
+                pass
+
+
+def test_dead_idle_driver_is_replaced(factory, drivers):
+    pool = DriverPool(factory, pool_size=1)
+
+    with pool.acquire() as dead:
+        pass
+    dead.alive = False
+
+    with pool.acquire() as driver:
+        assert driver is not dead
+    assert dead.quit_called
+    stats = pool.get_stats()
+    assert stats["replaced"] == 1
+    assert stats["drivers"] == 1
+
+
+def test_driver_dying_during_crawl_is_discarded(factory, drivers):
+    pool = DriverPool(factory, pool_size=1)
+
+    with pytest.raises(TimeoutError):
+        with pool.acquire() as dead:
+            dead.alive = False
+            raise TimeoutError("page load")
+
+    assert dead.quit_called
+    with pool.acquire() as driver:
+        assert driver is not dead
+    assert len(drivers) == 2
+
+
+def test_error_with_live_driver_keeps_it(factory, drivers):
+    pool = DriverPool(factory, pool_size=1)
+
+    with pytest.raises(ValueError):
+        with pool.acquire() as driver:
+            raise ValueError("parse failed")
+
+    with pool.acquire() as again:
+        assert again is driver
+    assert not driver.quit_called
+
+
+def test_close_quits_drivers(factory, drivers):
+    pool = DriverPool(factory, pool_size=2)
+    with pool.acquire():
+        pass
+
+    pool.close()
+
+    assert drivers[0].quit_called
+    assert pool.get_stats()["drivers"] == 0
@@ -0,0 +1,124 @@
+import pytest
+from backend.competitor_analysis.http_crawler import HttpCrawler, parse_reviews
+from backend.competitor_analysis.review_parser import review_hash
+from conftest import search_page
+
+# 상품 번호 → 별점별 리뷰 페이지 목록
+PRODUCT_REVIEWS = {
+    "1": {
+        "1": [["사이즈가 작아요", "색이 달라요"], ["바느질이 엉망"]],
+        "2": [["배송이 느려요"]],
+    },
+    "2": {
+        "1": [["원단이 얇아요"]],
+        "2": [],
+    },
+}
+
+def _review_fragment(texts: list) -> str:
+    return "".join(
+        f'<article><div class="sdp-review__article__list__review__content"><span>{text}</span></div></article>'
+        for text in texts
+    )
+
+
+def _review_page(product_id: str, query: dict) -> str:
+    if product_id not in PRODUCT_REVIEWS:
+        return None
+    pages = PRODUCT_REVIEWS[product_id][query["rating"][0]]
+    page = int(query["page"][0])
+    return _review_fragment(pages[page - 1] if page <= len(pages) else [])
+
+
+@pytest.fixture(scope="module")
+def server(shop_server):
+    return shop_server({"/np/search": search_page("1", "2"), "/reviews/": _review_page})
+
+
+@pytest.fixture
+def shop(server, monkeypatch):
+    server.requested.clear()
+    monkeypatch.setenv("BASE_SEARCH_URL", f"{server.url}/np/search")
+    monkeypatch.setenv("REVIEW_ENDPOINT_URL", server.url + "/reviews/{product_id}?rating={rating}&page={page}")
+    return server.url
+
+
+@pytest.fixture
+def http_crawler():
+    crawler = HttpCrawler(min_interval=0, timeout=5)
+    crawler.start()
+    yield crawler
+    crawler.stop()
+
+
+def _review_requests(server, product_id: str) -> list:
+    return [path for path in server.requested if path.startswith(f"/reviews/{product_id}?")]
+
+
+def test_parse_reviews_reads_container_articles():
+    html = (
+        '<div class="js_reviewArticleListContainer">'
+        + _review_fragment(["사이즈가 작아요😢", "★★★"])
+        + "<article><p>본문 없음</p></article></div>"
+    )
+
+    # 이모지만 있는 리뷰와 본문이 없는 article은 제외
+    assert parse_reviews(html) == ["사이즈가 작아요"]
+
+
+def test_parse_reviews_reads_bare_article_fragment():
+    assert parse_reviews(_review_fragment(["색이 달라요", "배송이 느려요"])) == ["색이 달라요", "배송이 느려요"]
+
+
+def test_parse_reviews_of_page_without_reviews_is_empty():
+    assert parse_reviews("<html><body><p>리뷰가 없습니다</p></body></html>") == []
+
+
+def test_collect_product_links(shop, http_crawler):
+    links = http_crawler.collect_product_links("양복", max_products=5)
+
+    assert links == [f"{shop}/vp/products/1", f"{shop}/vp/products/2"]
+
+
+def test_crawl_reviews_pages_through_ratings_in_product_order(shop, server, http_crawler):
+    links = [f"{shop}/vp/products/1", f"{shop}/vp/products/2"]
+
+    results = http_crawler.crawl_reviews(links, max_reviews=10)
+
+    assert results == [
+        ["사이즈가 작아요", "색이 달라요", "바느질이 엉망", "배송이 느려요"],
+        ["원단이 얇아요"],
+    ]
+    # 빈 페이지를 받으면 다음 별점으로 넘어감
+    assert "/reviews/1?rating=1&page=3" in server.requested
+    assert "/reviews/1?rating=2&page=3" not in server.requested
+
+
+def test_crawl_link_stops_at_max_reviews(shop, server, http_crawler):
+    reviews = http_crawler._run(http_crawler._crawl_link(f"{shop}/vp/products/1", max_reviews=2))
+
+    assert reviews == ["사이즈가 작아요", "색이 달라요"]
+    assert _review_requests(server, "1") == ["/reviews/1?rating=1&page=1"]
+
+
+def test_crawl_link_stops_paging_at_known_reviews(shop, server, http_crawler):
+    known = {review_hash("사이즈가 작아요"), review_hash("색이 달라요")}
+
+    reviews = http_crawler._run(http_crawler._crawl_link(f"{shop}/vp/products/1", max_reviews=10, known=known))
+
+    # 1점 첫 페이지가 모두 저장된 리뷰이므로 2페이지는 요청하지 않고 2점으로 넘어감
+    assert reviews == ["배송이 느려요"]
+    assert "/reviews/1?rating=1&page=2" not in server.requested
+    assert "/reviews/1?rating=2&page=1" in server.requested
+
+
+def test_crawl_link_needs_browser_without_review_endpoint(shop, http_crawler, monkeypatch):
+    monkeypatch.delenv("REVIEW_ENDPOINT_URL")
+
+    assert http_crawler._run(http_crawler._crawl_link(f"{shop}/vp/products/1", max_reviews=10)) is None
+
+
+def test_crawl_link_needs_browser_when_first_request_fails(shop, http_crawler):
+    # 리뷰 엔드포인트에 없는 상품은 404 → 브라우저로 대체
+    assert http_crawler._run(http_crawler._crawl_link(f"{shop}/vp/products/9", max_reviews=10)) is None
+    assert http_crawler.get_stats()["failed"] == 1
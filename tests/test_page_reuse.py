@@ -0,0 +1,96 @@
+import os
+import pytest
+import backend.page_generator.page_generator_main as page_generator_main_module
+import backend.page_generator.render_output as render_output_module
+import backend.text_generator.text_generator_main as text_generator_main_module
+from backend.page_generator.html_store import flush_html
+from backend.text_generator.text_generator import to_html_image_path
+
+
+def _product(image_path: str) -> dict:
+    return {
+        "engine": "hf",
+        "name": "테스트 자켓",
+        "category": "양복",
+        "brand": "테스트",
+        "price": 58000,
+        "features": "고급스러운 원단",
+        "differences": ["구김 없는 원단"],
+        "image_path_list": [image_path],
+    }
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """결과 디렉토리를 tmp_path로 바꾸고, LLM 생성과 브라우저 렌더링을 가짜로 대체합니다."""
+    config = {"data": {"result_path": str(tmp_path)}}
+    for module in (text_generator_main_module, page_generator_main_module, render_output_module):
+        monkeypatch.setattr(module, "load_config", lambda: config)
+
+    generated = []
+
+    def fake_generate(product, stream_callback=None):
+        generated.append(product["name"])
+        src = to_html_image_path(product["image_path_list"][0])
+        html_text = f'<html><head><title>p</title></head><body><img src="{src}"></body></html>'
+        if stream_callback:
+            stream_callback(html_text)
+        return {"html_text": html_text}
+
+    monkeypatch.setattr(text_generator_main_module, "select_generator", lambda engine, mode: fake_generate)
+
+    rendered = []
+
+    def fake_image_from_html(html_text, result_path, session_id, data_dir, options):
+        rendered.append(html_text)
+        image_path = os.path.join(result_path, f"page_{session_id}.png")
+        with open(image_path, "wb") as f:
+            f.write(b"png")
+        return {"session_id": session_id, "image": {"path": image_path}, "slices": [], "outputs": []}
+
+    monkeypatch.setattr(page_generator_main_module, "image_from_html", fake_image_from_html)
+    return generated, rendered
+
+
+def _run(product: dict) -> dict:
+    product = text_generator_main_module.text_generator_main(product)
+    page_generator_main_module.page_generator_main(product)
+    return product
+
+
+def test_hf_image_only_regeneration_keeps_css(pipeline, tmp_path):
+    generated, rendered = pipeline
+
+    first = _run(_product("backend/data/output/first.png"))
+    second = _run(_product("backend/data/output/second.png"))
+
+    # 두 번째 요청은 LLM 호출 없이 이전 페이지를 재사용
+    assert generated == ["테스트 자켓"]
+    assert second["reused_from"] == first["session_id"]
+
+    assert len(rendered) == 2
+    assert "<style>" in rendered[0]
+    assert "<style>" in rendered[1]
+    assert "../output/second.png" in rendered[1]
+    assert "../output/first.png" not in rendered[1]
+
+    # 저장된 파일도 CSS가 적용된 HTML
+    html_path = tmp_path / f"page_{second['session_id']}.html"
+    flush_html(str(html_path))
+    assert "<style>" in html_path.read_text(encoding="utf-8")
+
+
+def test_streamed_generation_is_visible_in_progress(pipeline, tmp_path, monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        text_generator_main_module, "publish_progress",
+        lambda session_id, alias=None, **fields: seen.append(fields.get("status"))
+    )
+    product = dict(_product("backend/data/output/first.png"), stream=True)
+
+    product = text_generator_main_module.text_generator_main(product)
+
+    assert seen[0] == "streaming"
+    assert seen[-1] == "done"
+    html_path = tmp_path / f"page_{product['session_id']}.html"
+    assert html_path.read_text(encoding="utf-8").startswith("<html>")
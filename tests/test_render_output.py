@@ -0,0 +1,36 @@
+import pytest
+import backend.page_generator.render_output as render_output
+from backend.page_generator.render_output import DESKTOP_WIDTH, MARKETPLACE_WIDTH, load_render_options
+
+
+@pytest.fixture
+def render_config(monkeypatch):
+    config = {"render": {}}
+    monkeypatch.setattr(render_output, "load_config", lambda: config)
+    return config["render"]
+
+
+def test_default_is_desktop_png_without_slices(render_config):
+    options = load_render_options()
+
+    assert options["width"] == DESKTOP_WIDTH
+    assert options["format"] == "png"
+    assert options["slice_height"] == 0
+
+
+def test_slicing_uses_marketplace_width(render_config):
+    render_config.update({"width": "auto", "slice_height": 2000})
+
+    assert load_render_options()["width"] == MARKETPLACE_WIDTH
+
+
+def test_explicit_width_is_kept(render_config):
+    render_config.update({"width": 1000, "slice_height": 2000})
+
+    assert load_render_options()["width"] == 1000
+
+
+def test_jpg_format_is_normalized(render_config):
+    render_config.update({"format": "JPG"})
+
+    assert load_render_options()["format"] == "jpeg"
@@ -0,0 +1,42 @@
+from backend.competitor_analysis.review_parser import (
+    build_search_url,
+    clean_product_url,
+    clean_review_text,
+    product_url_from_href,
+    review_hash,
+)
+
+
+def test_clean_product_url_strips_query():
+    url = "https://shop.example.com/vp/products/123?itemId=4&vendorItemId=5"
+
+    assert clean_product_url(url) == "https://shop.example.com/vp/products/123"
+
+
+def test_clean_product_url_keeps_unmatched_url():
+    assert clean_product_url("https://shop.example.com/other") == "https://shop.example.com/other"
+
+
+def test_clean_review_text_removes_emoji_and_symbols():
+    assert clean_review_text("  너무 작아요😢 ㅠ★ 환불!  ") == "너무 작아요 ㅠ 환불!"
+
+
+def test_clean_review_text_of_symbols_only_is_empty():
+    assert clean_review_text("★★★") == ""
+
+
+def test_review_hash_ignores_whitespace_differences():
+    assert review_hash("사이즈가  작아요\n") == review_hash("사이즈가 작아요")
+    assert review_hash("사이즈가 작아요") != review_hash("사이즈가 커요")
+
+
+def test_build_search_url_quotes_category(monkeypatch):
+    monkeypatch.setenv("BASE_SEARCH_URL", "https://shop.example.com/np/search")
+
+    assert build_search_url("남성 양복") == "https://shop.example.com/np/search?q=%EB%82%A8%EC%84%B1%20%EC%96%91%EB%B3%B5&sorter=scoreDesc"
+
+
+def test_product_url_from_href_uses_search_host(monkeypatch):
+    monkeypatch.setenv("BASE_SEARCH_URL", "https://shop.example.com/np/search")
+
+    assert product_url_from_href("/vp/products/123?itemId=4") == "https://shop.example.com/vp/products/123"
@@ -0,0 +1,115 @@
+import pytest
+import backend.competitor_analysis.differentiator as differentiator
+import backend.competitor_analysis.review_refresh as review_refresh
+from backend.competitor_analysis.review_parser import review_hash
+from backend.competitor_analysis.summary_notifier import SUMMARY_EMPTY, SUMMARY_READY
+
+DB_ARGS = ("localhost", "user", "password", "db")
+PRODUCT_REVIEWS = [
+    ("https://shop.example.com/vp/products/1", ["사이즈가 작아요"]),
+    ("https://shop.example.com/vp/products/2", ["사이즈가 작아요", "색이 달라요"]),
+]
+
+
+@pytest.fixture
+def refresh(monkeypatch):
+    """review_refresh의 DB/크롤링/요약 함수를 기록용 가짜로 바꿉니다."""
+    state = {
+        "known": {"https://shop.example.com/vp/products/1": {review_hash("배송이 느려요")}},
+        "crawled": PRODUCT_REVIEWS,
+        "existing": "기존 요약",
+        "summary": "합친 요약",
+        "fits": None,
+        "calls": [],
+    }
+
+    def fake_crawl(category, max_products, max_reviews_per_product, known):
+        state["calls"].append(("crawl", known))
+        return state["crawled"]
+
+    def fake_save(**kwargs):
+        state["calls"].append(("save", kwargs["product_reviews"], kwargs["review_summary"], kwargs["num_stored"]))
+        return 3
+
+    monkeypatch.setattr(review_refresh, "get_stored_review_hashes", lambda *args: state["known"])
+    monkeypatch.setattr(review_refresh, "crawl_product_reviews_by_category", fake_crawl)
+    monkeypatch.setattr(review_refresh, "get_latest_review_summary", lambda *args, **kwargs: state["existing"])
+    monkeypatch.setattr(
+        review_refresh, "select_summary_reviews", lambda reviews, existing: reviews[:state["fits"]]
+    )
+    monkeypatch.setattr(
+        review_refresh, "merge_review_summary",
+        lambda existing, reviews, key: state["calls"].append(("merge", reviews)) or state["summary"]
+    )
+    monkeypatch.setattr(
+        review_refresh, "summarize_competitor_reviews",
+        lambda reviews, key: state["calls"].append(("summarize", reviews)) or state["summary"]
+    )
+    monkeypatch.setattr(review_refresh, "insert_reviews_with_summary", fake_save)
+    monkeypatch.setattr(
+        review_refresh, "touch_review_summary", lambda *args: state["calls"].append(("touch", args[-1]))
+    )
+    return state
+
+
+def test_refresh_saves_new_reviews_with_merged_summary(refresh):
+    status = review_refresh.refresh_category_summary(*DB_ARGS, "양복", "sk-test")
+
+    assert status == SUMMARY_READY
+    assert refresh["calls"] == [
+        ("crawl", refresh["known"]),
+        ("merge", ["사이즈가 작아요", "사이즈가 작아요", "색이 달라요"]),
+        ("save", PRODUCT_REVIEWS, "합친 요약", 1),
+    ]
+
+
+def test_refresh_stores_only_reviews_that_fit_the_summary(refresh):
+    refresh["fits"] = 2
+
+    assert review_refresh.refresh_category_summary(*DB_ARGS, "양복", "sk-test") == SUMMARY_READY
+    # 요약에 반영되지 않은 리뷰는 저장하지 않아 다음 갱신에서 다시 수집
+    assert refresh["calls"][1:] == [
+        ("merge", ["사이즈가 작아요", "사이즈가 작아요"]),
+        ("save", [
+            ("https://shop.example.com/vp/products/1", ["사이즈가 작아요"]),
+            ("https://shop.example.com/vp/products/2", ["사이즈가 작아요"]),
+        ], "합친 요약", 1),
+    ]
+
+
+def test_refresh_without_stored_reviews_summarizes_from_scratch(refresh):
+    refresh["known"] = {}
+
+    review_refresh.refresh_category_summary(*DB_ARGS, "양복", "sk-test")
+
+    assert [call[0] for call in refresh["calls"]] == ["crawl", "summarize", "save"]
+
+
+def test_refresh_does_not_store_reviews_when_summary_fails(refresh):
+    refresh["summary"] = None
+
+    with pytest.raises(RuntimeError):
+        review_refresh.refresh_category_summary(*DB_ARGS, "양복", "sk-test")
+
+    assert [call[0] for call in refresh["calls"]] == ["crawl", "merge"]
+
+
+def test_refresh_without_new_reviews_only_touches_summary(refresh):
+    refresh["crawled"] = []
+
+    assert review_refresh.refresh_category_summary(*DB_ARGS, "양복", "sk-test") == SUMMARY_READY
+    assert [call[0] for call in refresh["calls"]] == ["crawl", "touch"]
+
+    refresh["existing"] = None
+    assert review_refresh.refresh_category_summary(*DB_ARGS, "양복", "sk-test") == SUMMARY_EMPTY
+
+
+def test_select_summary_reviews_keeps_whole_reviews_within_budget(monkeypatch):
+    monkeypatch.setattr(differentiator, "count_tokens", lambda text, model: len(text))
+    fixed = sum(len(part["text"]) for part in differentiator._review_prompt_parts([], "기존 요약"))
+    monkeypatch.setattr(differentiator, "get_token_budget", lambda name: fixed + 12)
+
+    # 리뷰마다 줄바꿈 1토큰 포함: 6 + 5 = 11, 세 번째 리뷰(3)는 예산 초과
+    selected = differentiator.select_summary_reviews(["사이즈작음", "색상다름", "배송"], "기존 요약")
+
+    assert selected == ["사이즈작음", "색상다름"]
@@ -0,0 +1,147 @@
+import time
+from contextlib import contextmanager
+import pytest
+import backend.competitor_analysis.summary_cache as summary_cache
+from backend.competitor_analysis.summary_cache import SummaryCache
+
+
+class FakeSummaryTable:
+    """competitor_review_summary 테이블 대신 사용하는 {category: (review_summary, version)}."""
+
+    def __init__(self):
+        self.rows = {}
+
+    @contextmanager
+    def connection(self, *args):
+        yield self
+
+    @contextmanager
+    def cursor(self):
+        yield FakeCursor(self.rows)
+
+
+class FakeCursor:
+    def __init__(self, rows: dict):
+        self._rows = rows
+        self._result = []
+
+    def execute(self, sql: str, params=None):
+        if "WHERE category IN" in sql:
+            self._result = [(category, *self._rows[category]) for category in params if category in self._rows]
+        else:
+            self._result = [(category, version) for category, (_, version) in self._rows.items()]
+
+    def fetchall(self):
+        return self._result
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = FakeSummaryTable()
+    monkeypatch.setattr(summary_cache, "db_connection", table.connection)
+    return table
+
+
+def _cache(**options) -> SummaryCache:
+    # watcher 스레드가 테스트 중에 동작하지 않도록 watch_interval을 길게 둠
+    options.setdefault("watch_interval", 3600)
+    return SummaryCache("localhost", "user", "password", "db", **options)
+
+
+def test_put_then_get_returns_cached_summary():
+    cache = _cache()
+
+    assert cache.get("양복") == (False, None)
+    cache.put("양복", "요약", 1)
+
+    assert cache.get("양복") == (True, "요약")
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_entry_expires_after_ttl():
+    cache = _cache(ttl=0.1)
+    cache.put("양복", "요약", 1)
+
+    time.sleep(0.15)
+
+    assert cache.get("양복") == (False, None)
+
+
+def test_missing_summary_is_negatively_cached_for_short_time():
+    cache = _cache(negative_ttl=0.1)
+    cache.put("양복", None, 0)
+
+    assert cache.get("양복") == (True, None)
+    assert cache.get_stats()["negative_hits"] == 1
+    time.sleep(0.15)
+    assert cache.get("양복") == (False, None)
+
+
+def test_put_does_not_overwrite_newer_version():
+    cache = _cache()
+    cache.put("양복", "새 요약", 2)
+
+    cache.put("양복", "옛 요약", 1)
+
+    assert cache.get("양복") == (True, "새 요약")
+
+
+def test_stale_put_after_invalidate_is_ignored():
+    cache = _cache()
+    cache.put("양복", "옛 요약", 1)
+
+    # 저장(version 2) 이전에 DB를 읽은 요청이 저장 이후에 put하는 경우
+    cache.invalidate("양복", min_version=2)
+    cache.put("양복", "옛 요약", 1)
+    cache.put("구두", None, 0)
+    assert cache.get("양복") == (False, None)
+
+    cache.invalidate("구두", min_version=0)
+    cache.put("구두", None, 0)
+    assert cache.get("구두") == (False, None)
+
+    cache.put("양복", "새 요약", 2)
+    assert cache.get("양복") == (True, "새 요약")
+
+
+def test_sync_versions_reloads_changed_summary(table):
+    cache = _cache()
+    table.rows["양복"] = ("옛 요약", 1)
+    table.rows["구두"] = ("구두 요약", 1)
+    cache.put("양복", "옛 요약", 1)
+    cache.put("구두", "구두 요약", 1)
+
+    # 다른 프로세스가 요약본을 저장해 version이 바뀐 경우
+    table.rows["양복"] = ("새 요약", 2)
+    cache._sync_versions()
+
+    assert cache.get("양복") == (True, "새 요약")
+    assert cache.get("구두") == (True, "구두 요약")
+    assert cache.get_stats()["refreshed"] == 1
+
+
+def test_sync_versions_clears_negative_entry_when_summary_appears(table):
+    cache = _cache()
+    cache.put("양복", None, 0)
+
+    table.rows["양복"] = ("요약", 0)
+    cache._sync_versions()
+
+    assert cache.get("양복") == (False, None)
+
+
+def test_min_version_is_dropped_once_reached(table):
+    cache = _cache()
+    cache.invalidate("양복", min_version=2)
+    cache.invalidate("구두", min_version=3)
+
+    table.rows["양복"] = ("새 요약", 2)
+    cache.put("양복", "새 요약", 2)
+    # 다른 카테고리는 watcher가 DB에서 최소 version 이상을 확인하면 제거
+    table.rows["구두"] = ("구두 요약", 3)
+    cache._sync_versions()
+
+    assert cache._min_versions == {}
+    assert cache.get("양복") == (True, "새 요약")
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from backend.competitor_analysis.summary_notifier import (
+    SUMMARY_EMPTY,
+    SUMMARY_READY,
+    DbNotificationBroker,
+    InProcessBroker,
+)
+
+
+@pytest.mark.asyncio
+async def test_publish_wakes_waiting_subscriber():
+    broker = InProcessBroker()
+
+    async with broker.subscribe("양복") as subscription:
+        asyncio.get_running_loop().call_later(0.05, broker.publish, "양복", SUMMARY_READY)
+        status = await subscription.wait(timeout=2)
+
+    assert status == SUMMARY_READY
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_none_on_timeout():
+    broker = InProcessBroker()
+
+    async with broker.subscribe("양복") as subscription:
+        # 다른 카테고리의 알림은 전달되지 않음
+        broker.publish("구두", SUMMARY_READY)
+        status = await subscription.wait(timeout=0.1)
+
+    assert status is None
+
+
+@pytest.mark.asyncio
+async def test_subscribers_of_same_category_share_notification():
+    broker = InProcessBroker()
+
+    async with broker.subscribe("양복") as first, broker.subscribe("양복") as second:
+        broker.publish("양복", SUMMARY_EMPTY)
+        statuses = await asyncio.gather(first.wait(timeout=2), second.wait(timeout=2))
+
+    assert statuses == [SUMMARY_EMPTY, SUMMARY_EMPTY]
+
+
+class FakeEventTable:
+    """competitor_summary_event 테이블 대신 사용하는 이벤트 목록."""
+
+    def __init__(self):
+        self.events = []
+
+    def add(self, category: str, status: str) -> int:
+        event_id = len(self.events) + 1
+        self.events.append((event_id, category, status))
+        return event_id
+
+    def last_id(self) -> int:
+        return len(self.events)
+
+    def fetch(self, last_id: int) -> list:
+        return [event for event in self.events if event[0] > last_id]
+
+
+@pytest.fixture
+def db_broker(monkeypatch):
+    table = FakeEventTable()
+    broker = DbNotificationBroker("localhost", "user", "password", "db", poll_interval=0.02)
+    monkeypatch.setattr(broker, "_fetch_last_id", table.last_id)
+    monkeypatch.setattr(broker, "_fetch_events", table.fetch)
+    return broker, table
+
+
+@pytest.mark.asyncio
+async def test_db_broker_delivers_event_from_other_process(db_broker):
+    broker, table = db_broker
+
+    async with broker.subscribe("양복") as subscription:
+        table.add("양복", SUMMARY_READY)
+        status = await subscription.wait(timeout=2)
+
+    assert status == SUMMARY_READY
+
+
+@pytest.mark.asyncio
+async def test_db_broker_drops_events_published_before_subscribe(db_broker):
+    broker, table = db_broker
+
+    async with broker.subscribe("양복") as early:
+        # 첫 구독자가 poller를 띄운 뒤, 아직 조회되지 않은 이전 이벤트가 있는 상태에서 두 번째 구독자가 합류
+        table.add("양복", SUMMARY_EMPTY)
+        async with broker.subscribe("양복") as late:
+            assert await early.wait(timeout=2) == SUMMARY_EMPTY
+            # 합류 이전의 'empty' 이벤트는 나중 구독자에게 전달되지 않음
+            assert await late.wait(timeout=0.1) is None
+
+            table.add("양복", SUMMARY_READY)
+            assert await late.wait(timeout=2) == SUMMARY_READY
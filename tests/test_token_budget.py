@@ -0,0 +1,72 @@
+from utils.token_budget import count_tokens, fit_prompt_parts, truncate_to_tokens
+
+
+class CharTokenizer:
+    """글자 하나를 토큰 하나로 세는 가짜 HF 토크나이저."""
+
+    def encode(self, text: str, add_special_tokens: bool = False) -> list:
+        return list(text)
+
+    def decode(self, ids: list) -> str:
+        return "".join(ids)
+
+
+TOKENIZER = CharTokenizer()
+
+
+def test_count_tokens_uses_given_tokenizer():
+    assert count_tokens("가나다", tokenizer=TOKENIZER) == 3
+    assert count_tokens("", tokenizer=TOKENIZER) == 0
+
+
+def test_truncate_keeps_text_within_budget():
+    assert truncate_to_tokens("가나다", 5, tokenizer=TOKENIZER) == "가나다"
+    assert truncate_to_tokens("가나다", 0, tokenizer=TOKENIZER) == ""
+
+
+def test_truncate_cuts_multiline_text_at_line_boundary():
+    text = "첫째 줄\n둘째 줄\n셋째 줄"
+
+    # 두 줄(줄바꿈 포함 10토큰)까지만 들어가는 예산에서 셋째 줄은 통째로 제거
+    assert truncate_to_tokens(text, 12, tokenizer=TOKENIZER) == "첫째 줄\n둘째 줄"
+
+
+def test_truncate_cuts_single_line_by_tokens():
+    assert truncate_to_tokens("가나다라마", 3, tokenizer=TOKENIZER) == "가나다"
+
+
+def test_truncate_cuts_by_tokens_when_first_line_does_not_fit():
+    assert truncate_to_tokens("가나다라마\n바사", 3, tokenizer=TOKENIZER) == "가나다"
+
+
+def test_fit_prompt_parts_within_budget_is_unchanged():
+    parts = [{"name": "a", "text": "가나", "priority": 1}, {"name": "b", "text": "다라", "priority": None}]
+
+    assert fit_prompt_parts(parts, 10, tokenizer=TOKENIZER) == ["가나", "다라"]
+
+
+def test_fit_prompt_parts_truncates_lowest_priority_first():
+    parts = [
+        {"name": "system", "text": "지시문", "priority": None},
+        {"name": "product", "text": "상품정보", "priority": 2},
+        {"name": "reviews", "text": "리뷰리뷰리뷰", "priority": 1},
+    ]
+
+    # 13토큰 → 10토큰: priority 1인 reviews만 3토큰 축소
+    assert fit_prompt_parts(parts, 10, tokenizer=TOKENIZER) == ["지시문", "상품정보", "리뷰리"]
+
+
+def test_fit_prompt_parts_moves_to_next_priority_when_first_is_exhausted():
+    parts = [
+        {"name": "system", "text": "지시문", "priority": None},
+        {"name": "product", "text": "상품정보", "priority": 2},
+        {"name": "reviews", "text": "리뷰", "priority": 1},
+    ]
+
+    assert fit_prompt_parts(parts, 5, tokenizer=TOKENIZER) == ["지시문", "상품", ""]
+
+
+def test_fit_prompt_parts_never_truncates_required_parts():
+    parts = [{"name": "system", "text": "지시문지시문", "priority": None}, {"name": "extra", "text": "추가", "priority": 1}]
+
+    assert fit_prompt_parts(parts, 3, tokenizer=TOKENIZER) == ["지시문지시문", ""]
@@ -0,0 +1,159 @@
+import math
+from functools import lru_cache
+from typing import Dict, List
+from utils.logger import get_logger
+from utils.config import load_config
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = get_logger(__name__)
+
+# config.yaml의 token_budget 섹션이 없을 때 사용할 프롬프트별 입력 토큰 예산
+DEFAULT_TOKEN_BUDGETS = {
+    "openai_page": 12000,
+    "hf_page": 3072,
+    "review_summary": 6000,
+}
+# tiktoken도 토크나이저도 없을 때 사용하는 추정치 (한국어 기준 글자당 토큰 수)
+TOKENS_PER_CHAR = 0.5
+
+
+def get_token_budget(name: str) -> int:
+    """
+    config.yaml의 token_budget 섹션에서 프롬프트별 입력 토큰 예산을 읽습니다.
+
+    Args:
+        name (str): 예산 이름 (예: "openai_page", "hf_page", "review_summary")
+
+    Returns:
+        int: 입력 토큰 예산
+    """
+    try:
+        budgets = load_config().get("token_budget") or {}
+    except Exception:
+        budgets = {}
+    return int(budgets.get(name, DEFAULT_TOKEN_BUDGETS[name]))
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _encode(text: str, model: str = None, tokenizer=None):
+    if tokenizer is not None:
+        return tokenizer.encode(text, add_special_tokens=False), tokenizer.decode
+    encoding = _get_encoding(model or "gpt-4o")
+    if encoding is not None:
+        return encoding.encode(text), encoding.decode
+    return None, None
+
+
+def count_tokens(text: str, model: str = None, tokenizer=None) -> int:
+    """
+    텍스트의 토큰 수를 셉니다.
+    HF 토크나이저가 주어지면 그것을, 없으면 tiktoken(설치된 경우)을, 둘 다 없으면 글자 수 기반 추정치를 사용합니다.
+
+    Args:
+        text (str): 토큰 수를 셀 텍스트
+        model (str, optional): OpenAI 모델명 (tiktoken 인코딩 선택용)
+        tokenizer (optional): HuggingFace 토크나이저
+
+    Returns:
+        int: 토큰 수
+    """
+    if not text:
+        return 0
+    ids, _ = _encode(text, model, tokenizer)
+    if ids is not None:
+        return len(ids)
+    return math.ceil(len(text) * TOKENS_PER_CHAR)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = None, tokenizer=None) -> str:
+    """
+    텍스트를 최대 토큰 수에 맞게 자릅니다.
+    여러 줄로 된 텍스트는 줄 단위로 뒤에서부터 제거해 문장이 중간에 잘리지 않게 합니다.
+
+    Args:
+        text (str): 자를 텍스트
+        max_tokens (int): 최대 토큰 수
+        model (str, optional): OpenAI 모델명
+        tokenizer (optional): HuggingFace 토크나이저
+
+    Returns:
+        str: 잘린 텍스트
+    """
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text, model, tokenizer) <= max_tokens:
+        return text
+
+    lines = text.split("\n")
+    if len(lines) > 1:
+        kept, used = [], 0
+        for line in lines:
+            line_tokens = count_tokens(line + "\n", model, tokenizer)
+            if used + line_tokens > max_tokens:
+                break
+            kept.append(line)
+            used += line_tokens
+        if kept:
+            return "\n".join(kept)
+
+    ids, decode = _encode(text, model, tokenizer)
+    if ids is not None:
+        return decode(ids[:max_tokens])
+    return text[:int(max_tokens / TOKENS_PER_CHAR)]
+
+
+def fit_prompt_parts(parts: List[Dict], budget: int, model: str = None, tokenizer=None, label: str = "prompt") -> List[str]:
+    """
+    프롬프트 조각들의 토큰 수를 세고, 예산을 넘으면 우선순위가 낮은 조각부터 잘라 예산에 맞춥니다.
+    조각별 토큰 수와 잘린 내역을 로그로 남겨 프롬프트 크기 변화를 추적할 수 있게 합니다.
+
+    Args:
+        parts (List[Dict]): {"name": str, "text": str, "priority": int | None} 리스트.
+            priority가 낮을수록 먼저 잘리며, None이면 자르지 않는 필수 조각입니다.
+        budget (int): 전체 입력 토큰 예산
+        model (str, optional): OpenAI 모델명
+        tokenizer (optional): HuggingFace 토크나이저
+        label (str): 로그에 표시할 프롬프트 이름
+
+    Returns:
+        List[str]: 입력 순서 그대로의 (잘렸을 수 있는) 조각 텍스트 리스트
+    """
+    texts = [part["text"] or "" for part in parts]
+    counts = [count_tokens(text, model, tokenizer) for text in texts]
+    total = sum(counts)
+    report = ", ".join(f"{part['name']}={count}" for part, count in zip(parts, counts))
+    logger.debug(f"🛠️ {label} 토큰 수: {total}/{budget} ({report})")
+
+    if total <= budget:
+        return texts
+
+    truncatable = sorted(
+        (i for i, part in enumerate(parts) if part.get("priority") is not None),
+        key=lambda i: parts[i]["priority"],
+    )
+    for i in truncatable:
+        overflow = total - budget
+        if overflow <= 0:
+            break
+        texts[i] = truncate_to_tokens(texts[i], counts[i] - overflow, model, tokenizer)
+        new_count = count_tokens(texts[i], model, tokenizer)
+        logger.warning(f"⚠️ {label} 토큰 예산 초과로 '{parts[i]['name']}' 축소: {counts[i]} → {new_count}")
+        total -= counts[i] - new_count
+        counts[i] = new_count
+
+    if total > budget:
+        logger.warning(f"⚠️ {label} 필수 조각만으로 토큰 예산 초과: {total}/{budget}")
+    return texts